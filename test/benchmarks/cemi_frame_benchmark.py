@@ -0,0 +1,64 @@
+"""
+Benchmark for parsing CEMI frames.
+
+Compares the struct based fast path for standard group frames with the generic
+data link layer parser. Not collected by pytest, run manually:
+
+    python test/benchmarks/cemi_frame_benchmark.py [number_of_frames]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# pylint: disable=wrong-import-position
+from xknx import XKNX  # noqa: E402
+from xknx.knxip.cemi_frame import CEMIFrame  # noqa: E402
+from xknx.knxip.knxip_enum import CEMIMessageCode  # noqa: E402
+
+
+def synthetic_frames(count):
+    """Return `count` synthetic L_DATA_IND group write frames as received by KNXIPFrame.from_knx()."""
+    frames = []
+    for i in range(count):
+        dst = i & 0xFFFF
+        if i % 2:
+            # DPTBinary payload
+            frames.append(bytes((0x29, 0x00, 0xBC, 0xE0, 0x11, 0x01, dst >> 8, dst & 255, 0x01, 0x00, 0x81)))
+        else:
+            # DPTArray payload
+            frames.append(bytes((0x29, 0x00, 0xBC, 0xE0, 0x11, 0x01, dst >> 8, dst & 255, 0x03, 0x00, 0x80,
+                                 i & 255, (i >> 8) & 255)))
+    return [memoryview(raw) for raw in frames]
+
+
+def measure(parse, frames):
+    """Return seconds needed to parse all frames."""
+    start = time.perf_counter()
+    for raw in frames:
+        parse(raw)
+    return time.perf_counter() - start
+
+
+def main(count):
+    """Run benchmark."""
+    xknx = XKNX(config=None)
+    frame = CEMIFrame(xknx)
+    frames = synthetic_frames(count)
+
+    def parse_generic(raw):
+        """Parse like CEMIFrame.from_knx() without fast path."""
+        frame.code = CEMIMessageCode(raw[0])
+        return frame.from_knx_data_link_layer(raw)
+
+    generic = measure(parse_generic, frames)
+    fast = measure(frame.from_knx, frames)
+    print("{0} frames".format(count))
+    print("generic parser: {0:.3f}s ({1:.0f} frames/s)".format(generic, count / generic))
+    print("fast path:      {0:.3f}s ({1:.0f} frames/s)".format(fast, count / fast))
+    print("speedup:        {0:.2f}x".format(generic / fast))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
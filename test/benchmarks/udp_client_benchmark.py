@@ -0,0 +1,87 @@
+"""
+Benchmark for receiving KNX/IP frames with UDPClient.
+
+Blasts routing indications at a UDPClient bound to localhost and reports the
+telegrams per second processed with and without batched receive. Not collected
+by pytest, run manually:
+
+    python test/benchmarks/udp_client_benchmark.py [number_of_telegrams]
+"""
+import asyncio
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# pylint: disable=wrong-import-position
+from xknx import XKNX  # noqa: E402
+from xknx.dpt import DPTBinary  # noqa: E402
+from xknx.io import UDPClient  # noqa: E402
+from xknx.knxip import KNXIPFrame, KNXIPServiceType  # noqa: E402
+from xknx.telegram import GroupAddress, PhysicalAddress, Telegram  # noqa: E402
+
+BURST_SIZE = 100
+
+
+def routing_indication(xknx, group_address):
+    """Return raw routing indication frame."""
+    knxipframe = KNXIPFrame(xknx)
+    knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+    knxipframe.body.src_addr = PhysicalAddress('1.1.1')
+    knxipframe.body.telegram = Telegram(GroupAddress(group_address), payload=DPTBinary(1))
+    knxipframe.normalize()
+    return bytes(knxipframe.to_knx())
+
+
+async def measure(xknx, count, max_batch_size):
+    """Return number of received telegrams and seconds needed."""
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.bind(('127.0.0.1', 0))
+    udp_client = UDPClient(xknx, ('127.0.0.1', 0), sender.getsockname(), max_batch_size=max_batch_size)
+    received = 0
+
+    def callback(_knxipframe, _udp_client):
+        nonlocal received
+        received += 1
+
+    udp_client.register_callback(callback, [KNXIPServiceType.ROUTING_INDICATION])
+    await udp_client.connect()
+    target = udp_client.getsockname()
+    raws = [routing_indication(xknx, i % 0xFFFF + 1) for i in range(BURST_SIZE)]
+
+    start = time.perf_counter()
+    sent = 0
+    while sent < count:
+        for raw in raws:
+            sender.sendto(raw, target)
+        sent += BURST_SIZE
+        # let the receiver catch up - the socket buffer would overflow otherwise
+        while received < sent:
+            last = received
+            await asyncio.sleep(0)
+            if received == last:
+                await asyncio.sleep(0.001)
+                if received == last:
+                    break
+    elapsed = time.perf_counter() - start
+
+    await udp_client.stop()
+    sender.close()
+    return received, elapsed
+
+
+def main(count):
+    """Run benchmark."""
+    loop = asyncio.new_event_loop()
+    xknx = XKNX(loop=loop)
+    for max_batch_size in (1, 64):
+        received, elapsed = loop.run_until_complete(measure(xknx, count, max_batch_size))
+        print("max_batch_size={0:3}: {1} of {2} telegrams in {3:.3f}s ({4:.0f} telegrams/s)".format(
+            max_batch_size, received, count, elapsed, received / elapsed))
+    loop.close()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
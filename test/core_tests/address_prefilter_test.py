@@ -0,0 +1,87 @@
+"""Unit test for address prefilter."""
+import asyncio
+import unittest
+
+from xknx import XKNX
+from xknx.core import StateUpdater
+from xknx.devices import Switch
+from xknx.telegram import AddressFilter, GroupAddress
+
+
+class TestAddressPrefilter(unittest.TestCase):
+    """Test class for address prefilter."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_device_addresses(self):
+        """Test if group addresses of devices are allowed."""
+        xknx = XKNX(loop=self.loop)
+        self.assertFalse(xknx.address_prefilter.allows(GroupAddress('1/2/3').raw))
+
+        xknx.devices.add(Switch(xknx, 'TestSwitch', group_address='1/2/3', group_address_state='1/2/4'))
+        self.assertTrue(xknx.address_prefilter.allows(GroupAddress('1/2/3').raw))
+        self.assertTrue(xknx.address_prefilter.allows(GroupAddress('1/2/4').raw))
+        self.assertFalse(xknx.address_prefilter.allows(GroupAddress('1/2/5').raw))
+
+        switch = xknx.devices['TestSwitch']
+        switch.switch.group_addresses = '1/2/5'
+        self.assertTrue(xknx.address_prefilter.allows(GroupAddress('1/2/5').raw))
+        self.assertFalse(xknx.address_prefilter.allows(GroupAddress('1/2/3').raw))
+
+    def test_callback_address_filters(self):
+        """Test if address filters of telegram received callbacks are allowed."""
+        xknx = XKNX(loop=self.loop)
+
+        async def telegram_received(telegram):
+            """Telegram received callback."""
+
+        callback = xknx.telegram_queue.register_telegram_received_cb(
+            telegram_received, [AddressFilter('2/*/*'), AddressFilter('3/1/1-10')])
+        self.assertTrue(xknx.address_prefilter.allows(GroupAddress('2/7/255').raw))
+        self.assertTrue(xknx.address_prefilter.allows(GroupAddress('3/1/10').raw))
+        self.assertFalse(xknx.address_prefilter.allows(GroupAddress('3/1/11').raw))
+
+        xknx.telegram_queue.unregister_telegram_received_cb(callback)
+        self.assertFalse(xknx.address_prefilter.allows(GroupAddress('2/7/255').raw))
+
+    def test_callback_without_filter(self):
+        """Test if all addresses are allowed if a callback without address filters is registered."""
+
+        async def telegram_received(telegram):
+            """Telegram received callback."""
+
+        xknx = XKNX(loop=self.loop, telegram_received_cb=telegram_received)
+        self.assertIsNone(xknx.address_prefilter.allowed_addresses())
+        self.assertTrue(xknx.address_prefilter.allows(GroupAddress('31/7/255').raw))
+
+    def test_pending_read(self):
+        """Test if responses to pending reads are allowed."""
+        xknx = XKNX(loop=self.loop)
+        group_address = GroupAddress('4/0/1')
+        self.assertFalse(xknx.address_prefilter.allows(group_address.raw))
+
+        read = self.loop.create_task(xknx.telegram_queue.read_multiplexer.read(group_address))
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertTrue(xknx.address_prefilter.allows(group_address.raw))
+        read.cancel()
+        self.loop.run_until_complete(asyncio.gather(read, return_exceptions=True))
+
+    def test_state_updater(self):
+        """Test if the prefilter stays active with a running StateUpdater."""
+        xknx = XKNX(loop=self.loop)
+        xknx.devices.add(Switch(xknx, 'TestSwitch', group_address='1/2/3', group_address_state='1/2/4'))
+        state_updater = StateUpdater(xknx, start_timeout=3600)
+        self.loop.run_until_complete(state_updater.start())
+        try:
+            self.assertIsNotNone(xknx.address_prefilter.allowed_addresses())
+            self.assertTrue(xknx.address_prefilter.allows(GroupAddress('1/2/4').raw))
+            self.assertFalse(xknx.address_prefilter.allows(GroupAddress('1/2/5').raw))
+        finally:
+            self.loop.run_until_complete(state_updater.stop())
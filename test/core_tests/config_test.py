@@ -4,7 +4,7 @@ import unittest
 from unittest.mock import patch
 
 from xknx import XKNX
-from xknx.core import Config
+from xknx.core import Config, OverflowPolicy
 from xknx.devices import (
     Action, BinarySensor, Climate, ClimateMode, Cover, DateTime,
     DateTimeBroadcastType, ExposeSensor, Fan, Light, Notification, Scene,
@@ -37,6 +37,58 @@ class TestConfig(unittest.TestCase):
         """Test reading general section from config file."""
         self.assertEqual(TestConfig.xknx.own_address, PhysicalAddress('15.15.249'))
         self.assertEqual(TestConfig.xknx.rate_limit, 18)
+        self.assertEqual(TestConfig.xknx.rate_limit_burst, 5)
+        self.assertIsNone(TestConfig.xknx.state_file)
+
+    def test_config_general_state_file(self):
+        """Test reading state_file and callback options from general section."""
+        import yaml
+        xknx = XKNX(loop=self.loop)
+        Config(xknx).parse_general(yaml.safe_load("""
+            general:
+                state_file: '/var/lib/xknx/state'
+                change_only_callbacks: true
+                callback_coalesce_window: 0.5
+            """))
+        self.assertEqual(xknx.state_file, '/var/lib/xknx/state')
+        self.assertTrue(xknx.change_only_callbacks)
+        self.assertEqual(xknx.callback_coalesce_window, 0.5)
+
+    def test_config_general_incoming_dispatch_workers(self):
+        """Test reading incoming_dispatch_workers from general section."""
+        import yaml
+        xknx = XKNX(loop=self.loop)
+        self.assertEqual(xknx.incoming_dispatch_workers, 0)
+        Config(xknx).parse_general(yaml.safe_load("""
+            general:
+                incoming_dispatch_workers: 4
+                record_handler_latencies: true
+                state_updater_intervals:
+                    temperature: 600
+            """))
+        self.assertEqual(xknx.incoming_dispatch_workers, 4)
+        self.assertTrue(xknx.record_handler_latencies)
+        self.assertEqual(xknx.state_updater_intervals, {'temperature': 600})
+
+    def test_config_general_queues(self):
+        """Test reading queue sizes and overflow policies from general section."""
+        import yaml
+        xknx = XKNX(loop=self.loop)
+        Config(xknx).parse_general(yaml.safe_load("""
+            general:
+                incoming_queue_size: 1000
+                incoming_overflow_policy: drop_oldest
+                outgoing_queue_size: 100
+                outgoing_overflow_policy: coalesce
+                coalesce_outgoing_writes: true
+                outgoing_ttl: 10
+            """))
+        self.assertEqual(xknx.outgoing_ttl, 10)
+        self.assertTrue(xknx.coalesce_outgoing_writes)
+        self.assertEqual(xknx.incoming_queue_size, 1000)
+        self.assertEqual(xknx.incoming_overflow_policy, OverflowPolicy.DROP_OLDEST)
+        self.assertEqual(xknx.outgoing_queue_size, 100)
+        self.assertEqual(xknx.outgoing_overflow_policy, OverflowPolicy.COALESCE)
 
     #
     # XKNX Connection Config
@@ -64,6 +116,43 @@ class TestConfig(unittest.TestCase):
                  gateway_port=6000)
              ),
             ("""
+            connection:
+                tunneling:
+                    gateway_ip: '192.168.1.2'
+                    window_size: 4
+            """,
+             ConnectionConfig(
+                 connection_type=ConnectionType.TUNNELING,
+                 gateway_ip="192.168.1.2",
+                 window_size=4)
+             ),
+            ("""
+            connection:
+                tunneling:
+                    gateway_ip: '192.168.1.2'
+                    auto_reconnect: true
+                    auto_reconnect_wait: 5
+                    auto_reconnect_max_wait: 120
+            """,
+             ConnectionConfig(
+                 connection_type=ConnectionType.TUNNELING,
+                 gateway_ip="192.168.1.2",
+                 auto_reconnect=True,
+                 auto_reconnect_wait=5,
+                 auto_reconnect_max_wait=120)
+             ),
+            ("""
+            connection:
+                tunneling_pool:
+                    gateway_ip: '192.168.1.2'
+                    channels: 4
+            """,
+             ConnectionConfig(
+                 connection_type=ConnectionType.TUNNELING_POOL,
+                 gateway_ip="192.168.1.2",
+                 tunnel_channels=4)
+             ),
+            ("""
             connection:
                 tunneling:
                     gateway_ip: '192.168.1.2'
@@ -86,6 +175,28 @@ class TestConfig(unittest.TestCase):
                 routing:
             """,
              ConnectionConfig(connection_type=ConnectionType.ROUTING)
+             ),
+            ("""
+            connection:
+                multi_gateway:
+                    - tunneling:
+                        gateway_ip: '192.168.1.2'
+                        address_filters: ['1/*/*', '2/*/*']
+                    - tunneling_pool:
+                        gateway_ip: '192.168.1.3'
+                        channels: 4
+            """,
+             ConnectionConfig(
+                 connection_type=ConnectionType.MULTI_GATEWAY,
+                 gateways=[
+                     ConnectionConfig(
+                         connection_type=ConnectionType.TUNNELING,
+                         gateway_ip="192.168.1.2",
+                         address_filters=['1/*/*', '2/*/*']),
+                     ConnectionConfig(
+                         connection_type=ConnectionType.TUNNELING_POOL,
+                         gateway_ip="192.168.1.3",
+                         tunnel_channels=4)])
              )
         ]
         for yaml_string, expected_conn in test_configs:
@@ -0,0 +1,134 @@
+"""Unit test for incoming dispatcher."""
+import asyncio
+import unittest
+
+from xknx import XKNX
+from xknx.core import IncomingDispatcher
+from xknx.devices import Device
+from xknx.dpt import DPTBinary
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+
+
+class RecordingDevice(Device):
+    """Device recording processed telegrams - waiting for `release` if set."""
+
+    def __init__(self, xknx, name, group_addresses, release=None):
+        """Initialize RecordingDevice class."""
+        super().__init__(xknx, name)
+        self.group_addresses = [GroupAddress(group_address) for group_address in group_addresses]
+        self.release = release
+        self.processed = []
+
+    def all_group_addresses(self):
+        """Return all group addresses of device."""
+        return self.group_addresses
+
+    def has_group_address(self, group_address):
+        """Test if device has given group address."""
+        return group_address in self.group_addresses
+
+    async def process(self, telegram):
+        """Record telegram."""
+        if self.release is not None:
+            await self.release.wait()
+        self.processed.append(telegram)
+
+
+class TestIncomingDispatcher(unittest.TestCase):
+    """Test class for incoming dispatcher."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    @staticmethod
+    def telegram(group_address, value=1):
+        """Return incoming telegram."""
+        return Telegram(GroupAddress(group_address), payload=DPTBinary(value),
+                        direction=TelegramDirection.INCOMING)
+
+    def test_lane_key(self):
+        """Test if devices connected through shared group addresses share a lane."""
+        xknx = XKNX(loop=self.loop)
+        xknx.devices.add(RecordingDevice(xknx, 'A', ['1/0/5', '1/0/3']))
+        xknx.devices.add(RecordingDevice(xknx, 'B', ['1/0/3', '1/0/7']))
+        xknx.devices.add(RecordingDevice(xknx, 'C', ['2/0/1', '2/0/2']))
+        dispatcher = IncomingDispatcher(xknx, 2)
+
+        lane_a = dispatcher.lane_key(GroupAddress('1/0/5'))
+        self.assertEqual(dispatcher.lane_key(GroupAddress('1/0/3')), lane_a)
+        self.assertEqual(dispatcher.lane_key(GroupAddress('1/0/7')), lane_a)
+        self.assertEqual(dispatcher.lane_key(GroupAddress('2/0/1')), dispatcher.lane_key(GroupAddress('2/0/2')))
+        self.assertNotEqual(dispatcher.lane_key(GroupAddress('2/0/1')), lane_a)
+        self.assertNotEqual(dispatcher.lane_key(GroupAddress('3/0/1')), lane_a)
+
+        # rebuilt after devices were added
+        xknx.devices.add(RecordingDevice(xknx, 'D', ['1/0/7', '2/0/2']))
+        self.assertEqual(dispatcher.lane_key(GroupAddress('2/0/1')), lane_a)
+
+    def test_slow_device_does_not_block_others(self):
+        """Test if telegrams of other lanes are processed while a device is slow."""
+        xknx = XKNX(loop=self.loop, incoming_dispatch_workers=2)
+        release = asyncio.Event()
+        slow_device = RecordingDevice(xknx, 'Slow', ['1/0/1', '1/0/2'], release=release)
+        fast_device = RecordingDevice(xknx, 'Fast', ['2/0/1'])
+        xknx.devices.add(slow_device)
+        xknx.devices.add(fast_device)
+
+        async def run():
+            await xknx.telegram_queue.start()
+            for telegram in (self.telegram('1/0/1', 1), self.telegram('1/0/2', 0),
+                             self.telegram('2/0/1'), self.telegram('1/0/1', 0)):
+                xknx.telegrams.put_nowait(telegram)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            self.assertEqual(len(fast_device.processed), 1)
+            self.assertEqual(slow_device.processed, [])
+
+            release.set()
+            await xknx.telegrams.join()
+            await xknx.telegram_queue.stop()
+
+        self.loop.run_until_complete(asyncio.wait_for(run(), 1))
+        # telegrams of the same device are processed in order
+        self.assertEqual(
+            [(telegram.group_address, telegram.payload) for telegram in slow_device.processed],
+            [(GroupAddress('1/0/1'), DPTBinary(1)), (GroupAddress('1/0/2'), DPTBinary(0)),
+             (GroupAddress('1/0/1'), DPTBinary(0))])
+
+    def test_handler_latencies(self):
+        """Test if durations of callbacks and devices are recorded."""
+        xknx = XKNX(loop=self.loop, record_handler_latencies=True)
+        xknx.devices.add(RecordingDevice(xknx, 'TestDevice', ['1/0/1']))
+
+        async def slow_callback(telegram):
+            """Telegram received callback."""
+            await asyncio.sleep(0.01)
+
+        xknx.telegram_queue.register_telegram_received_cb(slow_callback)
+        for _ in range(2):
+            self.loop.run_until_complete(xknx.telegram_queue.process_telegram_incoming(self.telegram('1/0/1')))
+
+        latencies = xknx.telegram_queue.handler_latencies
+        self.assertEqual(latencies['TestDevice'].count, 2)
+        callback_latency = latencies[slow_callback.__qualname__]
+        self.assertEqual(callback_latency.count, 2)
+        self.assertGreaterEqual(callback_latency.average, 0.005)
+        self.assertEqual(xknx.telegram_queue.slowest_handlers(1), [callback_latency])
+
+    def test_handler_latencies_disabled(self):
+        """Test if durations are not recorded by default."""
+        xknx = XKNX(loop=self.loop)
+        xknx.devices.add(RecordingDevice(xknx, 'TestDevice', ['1/0/1']))
+        self.loop.run_until_complete(xknx.telegram_queue.process_telegram_incoming(self.telegram('1/0/1')))
+        self.assertEqual(xknx.telegram_queue.handler_latencies, {})
+        self.assertEqual(len(xknx.devices['TestDevice'].processed), 1)
+
+        xknx.incoming_dispatch_workers = 2
+        self.loop.run_until_complete(xknx.telegram_queue.process_telegram_incoming(self.telegram('1/0/1')))
+        self.assertEqual(xknx.telegram_queue.handler_latencies['TestDevice'].count, 1)
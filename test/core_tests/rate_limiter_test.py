@@ -0,0 +1,49 @@
+"""Unit test for RateLimiter objects."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.core.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test class for RateLimiter objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_token_bucket(self):
+        """Test burst, refill and delay of token bucket."""
+        xknx = XKNX(loop=self.loop, rate_limit=10, rate_limit_burst=2)
+        rate_limiter = RateLimiter(xknx)
+        with patch.object(self.loop, 'time') as mock_time:
+            mock_time.return_value = 100.0
+            self.assertEqual(rate_limiter.delay(), 0)
+            self.loop.run_until_complete(rate_limiter.acquire())
+            self.loop.run_until_complete(rate_limiter.acquire())
+            self.assertAlmostEqual(rate_limiter.delay(), 0.1)
+
+            mock_time.return_value = 100.05
+            self.assertAlmostEqual(rate_limiter.delay(), 0.05)
+
+            # refilled - but never above burst
+            mock_time.return_value = 200.0
+            self.assertEqual(rate_limiter.delay(), 0)
+            self.loop.run_until_complete(rate_limiter.acquire())
+            self.loop.run_until_complete(rate_limiter.acquire())
+            self.assertAlmostEqual(rate_limiter.delay(), 0.1)
+
+    def test_no_rate_limit(self):
+        """Test if rate_limit 0 disables the limiter."""
+        xknx = XKNX(loop=self.loop, rate_limit=0)
+        rate_limiter = RateLimiter(xknx)
+        for _ in range(100):
+            self.loop.run_until_complete(rate_limiter.acquire())
+        self.assertEqual(rate_limiter.delay(), 0)
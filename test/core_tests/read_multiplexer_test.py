@@ -0,0 +1,102 @@
+"""Unit test for read multiplexer."""
+import asyncio
+import unittest
+
+from xknx import XKNX
+from xknx.core import ReadMultiplexer
+from xknx.dpt import DPTBinary
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramDirection, TelegramType)
+
+
+class TestReadMultiplexer(unittest.TestCase):
+    """Test class for read multiplexer."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_shared_read(self):
+        """Test if concurrent reads of the same group address share one GroupValueRead."""
+        xknx = XKNX(loop=self.loop)
+        read_multiplexer = ReadMultiplexer(xknx)
+        response_telegram = Telegram(group_address=GroupAddress('1/2/3'),
+                                     telegramtype=TelegramType.GROUP_RESPONSE,
+                                     direction=TelegramDirection.INCOMING,
+                                     payload=DPTBinary(1))
+
+        read_1 = self.loop.create_task(read_multiplexer.read(GroupAddress('1/2/3')))
+        read_2 = self.loop.create_task(read_multiplexer.read(GroupAddress('1/2/3')))
+        read_3 = self.loop.create_task(read_multiplexer.read(GroupAddress('1/2/4')))
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual(xknx.telegrams.qsize(), 2)
+        self.assertEqual(xknx.telegrams.get_nowait(),
+                         Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ))
+        self.assertEqual(xknx.telegrams.get_nowait(),
+                         Telegram(GroupAddress('1/2/4'), TelegramType.GROUP_READ))
+
+        self.assertTrue(read_multiplexer.telegram_received(response_telegram))
+        self.assertFalse(read_multiplexer.telegram_received(response_telegram))
+        self.assertEqual(self.loop.run_until_complete(read_1), response_telegram)
+        self.assertEqual(self.loop.run_until_complete(read_2), response_telegram)
+        self.assertFalse(read_multiplexer.is_pending(GroupAddress('1/2/3')))
+        self.assertTrue(read_multiplexer.is_pending(GroupAddress('1/2/4')))
+        read_3.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_3)
+        self.assertFalse(read_multiplexer.is_pending(GroupAddress('1/2/4')))
+
+    def test_timeout(self):
+        """Test if timed out reader does not affect other readers of the same group address."""
+        xknx = XKNX(loop=self.loop)
+        read_multiplexer = ReadMultiplexer(xknx)
+        response_telegram = Telegram(group_address=GroupAddress('1/2/3'),
+                                     telegramtype=TelegramType.GROUP_WRITE,
+                                     direction=TelegramDirection.INCOMING,
+                                     payload=DPTBinary(1))
+
+        read_long = self.loop.create_task(read_multiplexer.read(GroupAddress('1/2/3'), timeout_in_seconds=10))
+        read_short = self.loop.create_task(read_multiplexer.read(GroupAddress('1/2/3'), timeout_in_seconds=0))
+        self.assertIsNone(self.loop.run_until_complete(read_short))
+        self.assertTrue(read_multiplexer.is_pending(GroupAddress('1/2/3')))
+
+        self.assertTrue(read_multiplexer.telegram_received(response_telegram))
+        self.assertEqual(self.loop.run_until_complete(read_long), response_telegram)
+        self.assertEqual(xknx.telegrams.qsize(), 1)
+
+        # last reader timed out - pending read is dropped
+        self.assertIsNone(self.loop.run_until_complete(
+            read_multiplexer.read(GroupAddress('1/2/3'), timeout_in_seconds=0)))
+        self.assertFalse(read_multiplexer.is_pending(GroupAddress('1/2/3')))
+
+    def test_telegram_received_wrong_type(self):
+        """Test if GroupValueRead telegrams do not resolve pending reads."""
+        xknx = XKNX(loop=self.loop)
+        read_multiplexer = ReadMultiplexer(xknx)
+        read = self.loop.create_task(read_multiplexer.read(GroupAddress('1/2/3')))
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+        self.assertFalse(read_multiplexer.telegram_received(
+            Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ, direction=TelegramDirection.INCOMING)))
+        self.assertTrue(read_multiplexer.is_pending(GroupAddress('1/2/3')))
+        read.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read)
+
+    def test_telegram_queue_routes_response(self):
+        """Test if TelegramQueue passes responses to pending reads instead of devices."""
+        xknx = XKNX(loop=self.loop)
+        response_telegram = Telegram(group_address=GroupAddress('1/2/3'),
+                                     telegramtype=TelegramType.GROUP_RESPONSE,
+                                     direction=TelegramDirection.INCOMING,
+                                     payload=DPTBinary(1))
+        read = self.loop.create_task(xknx.telegram_queue.read_multiplexer.read(GroupAddress('1/2/3')))
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+        self.loop.run_until_complete(xknx.telegram_queue.process_telegram_incoming(response_telegram))
+        self.assertEqual(self.loop.run_until_complete(read), response_telegram)
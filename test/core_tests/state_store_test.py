@@ -0,0 +1,144 @@
+"""Unit test for StateStore objects."""
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.core import StateStore, StateUpdater
+from xknx.devices import Climate, Light
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.remote_value import RemoteValueSwitch
+from xknx.telegram import GroupAddress, Telegram, TelegramType
+
+
+class TestStateStore(unittest.TestCase):
+    """Test class for StateStore objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'state')
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.tmp_dir.cleanup()
+        self.loop.close()
+
+    @staticmethod
+    def remote_values(xknx):
+        """Return remote values of all devices - as passed by XKNX.start()."""
+        return [remote_value for device in xknx.devices for remote_value in device.remote_values()]
+
+    def test_store_load(self):
+        """Test storing and loading payloads."""
+        xknx = XKNX(loop=self.loop)
+        state_store = StateStore(xknx, self.path)
+        state_store.open()
+        self.assertEqual(state_store.load(GroupAddress('1/2/3')), (None, None))
+
+        state_store.store(GroupAddress('1/2/3'), DPTBinary(1), timestamp=100)
+        state_store.store(GroupAddress('31/7/255'), DPTArray((0x0C, 0x1A)), timestamp=200)
+        # too long for a record
+        state_store.store(GroupAddress('1/2/4'), DPTArray(tuple(range(15))), timestamp=300)
+        state_store.close()
+
+        state_store = StateStore(xknx, self.path)
+        state_store.open()
+        self.assertEqual(state_store.load(GroupAddress('1/2/3')), (DPTBinary(1), 100))
+        self.assertEqual(state_store.load(GroupAddress('31/7/255')), (DPTArray((0x0C, 0x1A)), 200))
+        self.assertEqual(state_store.load(GroupAddress('1/2/4')), (None, None))
+        self.assertEqual(state_store.timestamp(GroupAddress('31/7/255')), 200)
+        state_store.close()
+
+    def test_reset_unknown_format(self):
+        """Test if file of unknown format is reset."""
+        with open(self.path, 'wb') as file:
+            file.write(b'fnord')
+        xknx = XKNX(loop=self.loop)
+        state_store = StateStore(xknx, self.path)
+        state_store.open()
+        self.assertEqual(state_store.load(GroupAddress('0/0/5')), (None, None))
+        state_store.close()
+
+    def test_process_and_restore(self):
+        """Test if payloads processed by remote values are restored into devices."""
+        xknx = XKNX(loop=self.loop)
+        xknx.state_store = StateStore(xknx, self.path)
+        xknx.state_store.open()
+        remote_value = RemoteValueSwitch(xknx, group_address='1/2/3', group_address_state='1/2/4')
+        self.loop.run_until_complete(remote_value.process(
+            Telegram(GroupAddress('1/2/4'), TelegramType.GROUP_RESPONSE, payload=DPTBinary(1))))
+        xknx.state_store.close()
+
+        xknx = XKNX(loop=self.loop)
+        light = Light(xknx, 'TestLight', group_address_switch='1/2/3', group_address_switch_state='1/2/4')
+        climate = Climate(xknx, 'TestClimate', group_address_temperature='1/2/5')
+        xknx.devices.add(light)
+        xknx.devices.add(climate)
+        xknx.state_store = StateStore(xknx, self.path)
+        xknx.state_store.open()
+        xknx.state_store.store(GroupAddress('1/2/5'), DPTArray((0x0C, 0x1A)))
+        # invalid payload for temperature is not restored
+        xknx.state_store.store(GroupAddress('1/2/3'), DPTArray((0x0C, 0x1A)), timestamp=0)
+        xknx.state_store.restore(self.remote_values(xknx))
+        xknx.state_store.close()
+
+        self.assertTrue(light.state)
+        self.assertEqual(climate.temperature.value, 21.0)
+
+    def test_set_and_restore(self):
+        """Test if values set by xknx itself are restored after a restart."""
+        xknx = XKNX(loop=self.loop)
+        light = Light(xknx, 'TestLight', group_address_switch='1/2/3', group_address_switch_state='1/2/4')
+        xknx.devices.add(light)
+        xknx.state_store = StateStore(xknx, self.path)
+        xknx.state_store.open()
+        xknx.state_store.store(GroupAddress('1/2/4'), DPTBinary(1), timestamp=time.time() - 10)
+        xknx.state_store.restore(self.remote_values(xknx))
+        self.assertTrue(light.state)
+        self.loop.run_until_complete(light.set_off())
+        xknx.state_store.close()
+
+        xknx = XKNX(loop=self.loop)
+        light = Light(xknx, 'TestLight', group_address_switch='1/2/3', group_address_switch_state='1/2/4')
+        xknx.devices.add(light)
+        xknx.state_store = StateStore(xknx, self.path)
+        xknx.state_store.open()
+        xknx.state_store.restore(self.remote_values(xknx))
+        xknx.state_store.close()
+        self.assertFalse(light.state)
+
+    def test_mmap_fails(self):
+        """Test if the file is closed if it can not be mapped into memory."""
+        xknx = XKNX(loop=self.loop)
+        state_store = StateStore(xknx, self.path)
+        with patch('mmap.mmap', side_effect=OSError("No such device")):
+            with self.assertRaises(OSError):
+                state_store.open()
+        self.assertIsNone(state_store._file)
+
+    def test_state_updater_skips_restored(self):
+        """Test if StateUpdater does not read addresses restored recently."""
+        xknx = XKNX(loop=self.loop)
+        light1 = Light(xknx, 'TestLight1', group_address_switch='1/2/3', group_address_switch_state='1/2/4')
+        light2 = Light(xknx, 'TestLight2', group_address_switch='1/2/5', group_address_switch_state='1/2/6')
+        xknx.devices.add(light1)
+        xknx.devices.add(light2)
+        xknx.state_store = StateStore(xknx, self.path)
+        xknx.state_store.open()
+        xknx.state_store.store(GroupAddress('1/2/4'), DPTBinary(1))
+        xknx.state_store.store(GroupAddress('1/2/6'), DPTBinary(1), timestamp=time.time() - 7200)
+
+        state_updater = StateUpdater(xknx)
+        state_updater.collect_state_addresses()
+        xknx.state_store.close()
+
+        # pylint: disable=protected-access
+        now = self.loop.time()
+        self.assertLess(now - state_updater._last_seen[GroupAddress('1/2/4').raw], 60)
+        self.assertGreater(now - state_updater._last_seen[GroupAddress('1/2/6').raw], 3600)
@@ -0,0 +1,148 @@
+"""Unit test for StateTable objects."""
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+from xknx import XKNX
+from xknx.core import StateTable
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.remote_value import RemoteValueSwitch, RemoteValueTemp
+from xknx.telegram import GroupAddress, PhysicalAddress, Telegram
+
+
+class TestStateTable(unittest.TestCase):
+    """Test class for StateTable objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_update(self):
+        """Test updating and reading payloads."""
+        state_table = StateTable()
+        group_address = GroupAddress('1/2/3')
+        self.assertIsNone(state_table.payload(group_address))
+        self.assertIsNone(state_table.timestamp(group_address))
+        self.assertIsNone(state_table.source_address(group_address))
+
+        state_table.update(group_address, DPTBinary(1), 100, PhysicalAddress('1.1.4'))
+        self.assertEqual(state_table.payload(group_address), DPTBinary(1))
+        self.assertEqual(state_table.timestamp(group_address), 100)
+        self.assertEqual(state_table.source_address(group_address), PhysicalAddress('1.1.4'))
+        self.assertEqual(state_table.counter(group_address), 1)
+
+        state_table.update(group_address, DPTArray((0x0C, 0x1A)), 200)
+        self.assertEqual(state_table.payload(group_address), DPTArray((0x0C, 0x1A)))
+        self.assertIsNone(state_table.source_address(group_address))
+        self.assertEqual(state_table.counter(group_address), 2)
+
+        long_payload = DPTArray(tuple(range(20)))
+        state_table.update(group_address, long_payload, 300)
+        self.assertEqual(state_table.payload(group_address), long_payload)
+
+        state_table.update(group_address, None, 400)
+        self.assertIsNone(state_table.payload(group_address))
+        self.assertEqual(state_table.counter(group_address), 4)
+
+    def test_pages(self):
+        """Test if arrays are allocated for pages of group addresses updated only."""
+        state_table = StateTable()
+        self.assertEqual(len(state_table), 0)
+        self.assertEqual(state_table.counter(GroupAddress('1/2/3')), 0)
+        state_table.update(GroupAddress('1/2/3'), DPTBinary(1), 100)
+        state_table.update(GroupAddress('1/2/4'), DPTBinary(1), 100)
+        self.assertEqual(len(state_table), 1)
+        state_table.update(GroupAddress('1/3/3'), DPTBinary(1), 100)
+        self.assertEqual(len(state_table), 2)
+        self.assertIsNone(state_table.payload(GroupAddress('2/2/3')))
+
+    def test_latest(self):
+        """Test finding the group address updated last."""
+        state_table = StateTable()
+        self.assertIsNone(state_table.latest([GroupAddress('1/2/3'), GroupAddress('1/2/4')]))
+        state_table.update(GroupAddress('1/2/3'), DPTBinary(1), 200)
+        state_table.update(GroupAddress('1/2/4'), DPTBinary(0), 100)
+        self.assertEqual(state_table.latest([GroupAddress('1/2/3'), GroupAddress('1/2/4')]),
+                         GroupAddress('1/2/3'))
+
+    def test_views(self):
+        """Test if registered views are marked outdated on updates of their group addresses."""
+        state_table = StateTable()
+        view = Mock()
+        state_table.register_view(view, [GroupAddress('1/2/3'), GroupAddress('1/2/4')])
+        state_table.update(GroupAddress('1/2/3'), DPTBinary(1), 100)
+        state_table.update(GroupAddress('1/2/5'), DPTBinary(1), 100)
+        self.assertEqual(view.state_changed.call_count, 1)
+        state_table.restore(state_table.snapshot())
+        self.assertEqual(view.state_changed.call_count, 3)
+        state_table.unregister_view(view, [GroupAddress('1/2/3')])
+        state_table.update(GroupAddress('1/2/3'), DPTBinary(0), 200)
+        self.assertEqual(view.state_changed.call_count, 3)
+
+    def test_snapshot(self):
+        """Test snapshot and restore."""
+        state_table = StateTable()
+        state_table.update(GroupAddress('1/2/3'), DPTArray((0x0C, 0x1A)), 100, PhysicalAddress('1.1.4'))
+        state_table.update(GroupAddress('1/2/4'), DPTArray(tuple(range(20))), 100)
+        snapshot = state_table.snapshot()
+
+        other_table = StateTable()
+        other_table.update(GroupAddress('1/2/3'), DPTBinary(1), 200)
+        other_table.restore(snapshot)
+        self.assertEqual(other_table.payload(GroupAddress('1/2/3')), DPTArray((0x0C, 0x1A)))
+        self.assertEqual(other_table.timestamp(GroupAddress('1/2/3')), 100)
+        self.assertEqual(other_table.source_address(GroupAddress('1/2/3')), PhysicalAddress('1.1.4'))
+        # counters are incremented, not restored
+        self.assertEqual(other_table.counter(GroupAddress('1/2/3')), 2)
+        # extended payloads are not part of snapshots
+        self.assertIsNone(other_table.payload(GroupAddress('1/2/4')))
+
+        with self.assertRaises(ValueError):
+            other_table.restore(snapshot[:-1])
+
+    def test_remote_value_view(self):
+        """Test if remote values are views on the state table of xknx."""
+        xknx = XKNX(loop=self.loop)
+        remote_value1 = RemoteValueTemp(xknx, group_address='1/2/3', group_address_state='1/2/4')
+        remote_value2 = RemoteValueTemp(xknx, group_address_state='1/2/4')
+        remote_value3 = RemoteValueSwitch(xknx, group_address='1/2/5')
+
+        telegram = Telegram(GroupAddress('1/2/4'), payload=DPTArray((0x0C, 0x1A)),
+                            source_address=PhysicalAddress('1.1.4'))
+        self.loop.run_until_complete(remote_value1.process(telegram))
+        self.assertEqual(remote_value1.value, 21.0)
+        self.assertEqual(remote_value2.value, 21.0)
+        self.assertEqual(xknx.state_table.source_address(GroupAddress('1/2/4')), PhysicalAddress('1.1.4'))
+
+        # set() writes to the first group address
+        self.loop.run_until_complete(remote_value1.set(22.0))
+        self.assertEqual(remote_value1.value, 22.0)
+        self.assertEqual(xknx.state_table.payload(GroupAddress('1/2/3')), DPTArray((0x0C, 0x4C)))
+        self.assertEqual(remote_value2.value, 21.0)
+
+        # update of another group address of the remote value by another remote value
+        remote_value4 = RemoteValueTemp(xknx, group_address='1/2/4')
+        self.loop.run_until_complete(remote_value4.set(23.0))
+        self.assertEqual(remote_value1.value, 23.0)
+        self.assertEqual(remote_value2.value, 23.0)
+
+        # payloads of another shape written through another remote value are not used
+        remote_value5 = RemoteValueSwitch(xknx, group_address='1/2/4')
+        remote_value5.payload = DPTBinary(1)
+        self.assertIsNone(remote_value1.payload)
+        self.assertIsNone(remote_value1.value)
+        self.assertTrue(remote_value5.value)
+        self.loop.run_until_complete(remote_value4.set(23.0))
+
+        # snapshot restore is picked up by all views
+        snapshot = xknx.state_table.snapshot()
+        remote_value3.payload = DPTBinary(1)
+        self.assertTrue(remote_value3.value)
+        xknx.state_table.restore(snapshot)
+        self.assertIsNone(remote_value3.value)
+        self.assertEqual(remote_value1.value, 23.0)
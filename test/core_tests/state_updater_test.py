@@ -1,15 +1,18 @@
-"""Unit test for KNX/IP Disconnect Request/Response."""
+"""Unit test for StateUpdater objects."""
 import asyncio
 import unittest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from xknx import XKNX
 from xknx.core import StateUpdater
-from xknx.devices import Light
+from xknx.devices import DateTime, Light, Sensor
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramDirection, TelegramType)
 
 
 class TestStateupdater(unittest.TestCase):
-    """Test class for xknx/io/Disconnect objects."""
+    """Test class for xknx/core/StateUpdater objects."""
 
     def setUp(self):
         """Set up test class."""
@@ -20,6 +23,18 @@ class TestStateupdater(unittest.TestCase):
         """Tear down test class."""
         self.loop.close()
 
+    def test_xknx_start_intervals(self):
+        """Test if refresh intervals are passed from XKNX.start to the StateUpdater."""
+        xknx = XKNX(loop=self.loop, state_updater_intervals={'temperature': 600})
+        with patch('xknx.io.KNXIPInterface.start', new=AsyncMock()), \
+                patch('xknx.core.TelegramQueue.start', new=AsyncMock()), \
+                patch('xknx.core.StateUpdater.start', new=AsyncMock()):
+            self.loop.run_until_complete(xknx.start(state_updater=True))
+            self.assertEqual(xknx.state_updater.intervals, {'temperature': 600})
+            self.loop.run_until_complete(xknx.start(state_updater=True, state_updater_intervals={'TestLight': 60}))
+            self.assertEqual(xknx.state_updater.intervals, {'TestLight': 60})
+        xknx.started = False
+
     def test_state_updater(self):
         """Test State updater."""
         xknx = XKNX(loop=self.loop)
@@ -40,3 +55,123 @@ class TestStateupdater(unittest.TestCase):
             self.loop.run_until_complete(asyncio.Task(state_updater.start()))
             self.loop.run_until_complete(state_updater.run_task)
             mock_sync.assert_called_with()
+
+    def test_read_state_address(self):
+        """Test if state addresses are read and passed to the device."""
+        xknx = XKNX(loop=self.loop)
+        light = Light(
+            xknx,
+            name='TestLight',
+            group_address_switch='1/0/9',
+            group_address_switch_state='1/0/10')
+        xknx.devices.add(light)
+
+        state_updater = StateUpdater(xknx, timeout=0, start_timeout=0)
+        state_updater.run_forever = False
+
+        with patch('xknx.core.ValueReader.read') as mock_read:
+            mock_read.return_value = Telegram(GroupAddress('1/0/10'), TelegramType.GROUP_RESPONSE, payload=DPTBinary(1))
+
+            self.loop.run_until_complete(state_updater.run())
+            mock_read.assert_called_once_with()
+        self.assertTrue(light.state)
+
+    def test_datetime_broadcast(self):
+        """Test if DateTime broadcasts the time on every cycle."""
+        xknx = XKNX(loop=self.loop)
+        xknx.devices.add(DateTime(xknx, 'TestDateTime', group_address='1/2/3'))
+
+        state_updater = StateUpdater(xknx, timeout=0, start_timeout=0)
+        state_updater.run_forever = False
+        self.loop.run_until_complete(state_updater.run())
+
+        self.assertEqual(xknx.telegrams.qsize(), 1)
+        telegram = xknx.telegrams.get_nowait()
+        self.assertEqual(telegram.group_address, GroupAddress('1/2/3'))
+        self.assertEqual(telegram.telegramtype, TelegramType.GROUP_WRITE)
+
+    def test_shared_state_address(self):
+        """Test if a state address shared by several devices is read once."""
+        xknx = XKNX(loop=self.loop)
+        light1 = Light(xknx, 'TestLight1', group_address_switch='1/0/9', group_address_switch_state='1/0/10')
+        light2 = Light(xknx, 'TestLight2', group_address_switch='1/0/8', group_address_switch_state='1/0/10')
+        xknx.devices.add(light1)
+        xknx.devices.add(light2)
+
+        state_updater = StateUpdater(xknx, timeout=0, start_timeout=0)
+        state_updater.run_forever = False
+
+        with patch('xknx.core.ValueReader.read') as mock_read:
+            mock_read.return_value = Telegram(GroupAddress('1/0/10'), TelegramType.GROUP_RESPONSE, payload=DPTBinary(1))
+
+            self.loop.run_until_complete(state_updater.run())
+            mock_read.assert_called_once_with()
+        self.assertTrue(light1.state)
+
+    def test_intervals(self):
+        """Test interval lookup by device name, value type and device class."""
+        xknx = XKNX(loop=self.loop)
+        light = Light(xknx, name='TestLight', group_address_switch='1/0/9')
+        sensor1 = Sensor(xknx, 'TestSensor1', group_address_state='1/0/1', value_type='temperature')
+        sensor2 = Sensor(xknx, 'TestSensor2', group_address_state='1/0/2', value_type='percent')
+
+        state_updater = StateUpdater(xknx, intervals={
+            'TestSensor1': 60,
+            'temperature': 120,
+            'percent': 300,
+            Sensor: 600})
+        self.assertEqual(state_updater.interval_for(light), 3600)
+        self.assertEqual(state_updater.interval_for(sensor1), 60)
+        self.assertEqual(state_updater.interval_for(sensor2), 300)
+
+        state_updater = StateUpdater(xknx, intervals={Sensor: 600})
+        self.assertEqual(state_updater.interval_for(sensor2), 600)
+
+    def test_skip_recently_seen(self):
+        """Test if addresses seen on the bus are not read but rescheduled."""
+        xknx = XKNX(loop=self.loop)
+        sensor1 = Sensor(xknx, 'TestSensor1', group_address_state='1/0/1', value_type='percent')
+        sensor2 = Sensor(xknx, 'TestSensor2', group_address_state='1/0/2', value_type='percent')
+        xknx.devices.add(sensor1)
+        xknx.devices.add(sensor2)
+
+        state_updater = StateUpdater(xknx, timeout=100, start_timeout=0)
+        self.loop.run_until_complete(state_updater.telegram_received(
+            Telegram(GroupAddress('1/0/1'), direction=TelegramDirection.INCOMING, payload=DPTArray(0xFF))))
+
+        with patch('xknx.core.ValueReader.read') as mock_read:
+            mock_read.return_value = None
+
+            run_task = self.loop.create_task(state_updater.run())
+            self.loop.run_until_complete(asyncio.sleep(0.01))
+            run_task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                self.loop.run_until_complete(run_task)
+            # only 1/0/2 was read
+            self.assertEqual(mock_read.call_count, 1)
+
+        seen = state_updater._last_seen[GroupAddress('1/0/1').raw]
+        self.assertEqual(state_updater._next_due[GroupAddress('1/0/1').raw], seen + 100)
+
+    def test_max_concurrent_reads(self):
+        """Test if number of concurrent reads is bounded."""
+        xknx = XKNX(loop=self.loop)
+        for i in range(5):
+            xknx.devices.add(Sensor(xknx, 'TestSensor{}'.format(i), group_address_state='1/0/{}'.format(i),
+                                    value_type='percent'))
+
+        state_updater = StateUpdater(xknx, timeout=0, start_timeout=0, max_concurrent_reads=2)
+        state_updater.run_forever = False
+        running = []
+        concurrent_reads = []
+
+        async def read():
+            running.append(None)
+            concurrent_reads.append(len(running))
+            await asyncio.sleep(0)
+            running.pop()
+
+        with patch('xknx.core.ValueReader.read', side_effect=read) as mock_read:
+            self.loop.run_until_complete(state_updater.run())
+            self.assertEqual(mock_read.call_count, 5)
+        self.assertEqual(max(concurrent_reads), 2)
@@ -0,0 +1,169 @@
+"""Unit test for telegram buffer."""
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+from xknx import XKNX
+from xknx.core import OverflowPolicy, PriorityTelegramBuffer, TelegramBuffer
+from xknx.dpt import DPTBinary
+from xknx.io import KNXIPInterface
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+
+
+class TestTelegramBuffer(unittest.TestCase):
+    """Test class for telegram buffer."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    @staticmethod
+    def telegram(group_address, value=1):
+        """Return incoming telegram."""
+        return Telegram(GroupAddress(group_address), payload=DPTBinary(value),
+                        direction=TelegramDirection.INCOMING)
+
+    @staticmethod
+    def drain(buffer):
+        """Return all items of buffer."""
+        items = []
+        while not buffer.empty():
+            items.append(buffer.get_nowait())
+            buffer.task_done()
+        return items
+
+    def test_block(self):
+        """Test if put_nowait raises QueueFull with OverflowPolicy.BLOCK."""
+        buffer = TelegramBuffer(2)
+        buffer.put_nowait(self.telegram('1/0/1'))
+        buffer.put_nowait(self.telegram('1/0/2'))
+        with self.assertRaises(asyncio.QueueFull):
+            buffer.put_nowait(self.telegram('1/0/3'))
+        self.assertEqual(buffer.overflow_count, 1)
+        self.assertEqual(buffer.drop_count, 1)
+        self.assertEqual(buffer.qsize(), 2)
+
+    def test_drop_oldest(self):
+        """Test if oldest telegram is discarded with OverflowPolicy.DROP_OLDEST."""
+        buffer = TelegramBuffer(2, OverflowPolicy.DROP_OLDEST)
+        for group_address in ('1/0/1', '1/0/2', '1/0/3'):
+            self.loop.run_until_complete(buffer.put(self.telegram(group_address)))
+        self.assertEqual([telegram.group_address for telegram in self.drain(buffer)],
+                         [GroupAddress('1/0/2'), GroupAddress('1/0/3')])
+        self.assertEqual(buffer.drop_count, 1)
+        # discarded telegrams are marked as done
+        self.loop.run_until_complete(asyncio.wait_for(buffer.join(), 1))
+
+    def test_drop_newest(self):
+        """Test if new telegram is discarded with OverflowPolicy.DROP_NEWEST."""
+        dropped_cb = Mock()
+        buffer = TelegramBuffer(2, 'drop_newest', dropped_cb=dropped_cb)
+        for group_address in ('1/0/1', '1/0/2', '1/0/3'):
+            buffer.put_nowait(self.telegram(group_address))
+        self.assertEqual([telegram.group_address for telegram in self.drain(buffer)],
+                         [GroupAddress('1/0/1'), GroupAddress('1/0/2')])
+        self.assertEqual(buffer.drop_count, 1)
+        dropped_cb.assert_called_once_with(self.telegram('1/0/3'))
+
+    def test_stop_signal_never_dropped(self):
+        """Test if items which are not telegrams are queued even if the buffer is full."""
+        buffer = TelegramBuffer(1, OverflowPolicy.BLOCK)
+        buffer.put_nowait(self.telegram('1/0/1'))
+        buffer.put_nowait(None)
+        # does not wait for a free slot
+        self.loop.run_until_complete(asyncio.wait_for(buffer.put(None), 1))
+        self.assertEqual(buffer.drop_count, 0)
+        self.assertEqual(self.drain(buffer), [self.telegram('1/0/1'), None, None])
+
+    def test_bounded_direction(self):
+        """Test if only telegrams of bounded_direction count against maxsize."""
+        buffer = TelegramBuffer(1, OverflowPolicy.DROP_OLDEST, bounded_direction=TelegramDirection.INCOMING)
+        outgoing = Telegram(GroupAddress('1/0/9'), payload=DPTBinary(1))
+        buffer.put_nowait(self.telegram('1/0/1'))
+        self.loop.run_until_complete(asyncio.wait_for(buffer.put(outgoing), 1))
+        buffer.put_nowait(self.telegram('1/0/2'))
+        # the outgoing telegram is not discarded for the incoming one
+        self.assertEqual(self.drain(buffer), [outgoing, self.telegram('1/0/2')])
+        self.assertEqual(buffer.drop_count, 1)
+        buffer.put_nowait(self.telegram('1/0/3'))
+        self.assertTrue(buffer.full())
+
+    def test_coalesce(self):
+        """Test if queued telegram to the same group address is replaced with OverflowPolicy.COALESCE."""
+        buffer = TelegramBuffer(2, OverflowPolicy.COALESCE)
+        buffer.put_nowait(self.telegram('1/0/1', 0))
+        buffer.put_nowait(self.telegram('1/0/2', 0))
+        buffer.put_nowait(self.telegram('1/0/1', 1))
+        self.assertEqual(buffer.coalesce_count, 1)
+        # without telegram to coalesce with the oldest telegram is discarded
+        buffer.put_nowait(self.telegram('1/0/3', 1))
+        self.assertEqual(buffer.drop_count, 1)
+        self.assertEqual(self.drain(buffer), [self.telegram('1/0/2', 0), self.telegram('1/0/3', 1)])
+
+        buffer.put_nowait(self.telegram('1/0/1', 0))
+        buffer.put_nowait(self.telegram('1/0/2', 0))
+        buffer.put_nowait(self.telegram('1/0/1', 1))
+        self.assertEqual(self.drain(buffer), [self.telegram('1/0/1', 1), self.telegram('1/0/2', 0)])
+
+    def test_priority_buffer(self):
+        """Test overflow policies of priority buffer with (priority, sequence, telegram) entries."""
+        dropped_cb = Mock()
+        buffer = PriorityTelegramBuffer(3, OverflowPolicy.DROP_OLDEST, dropped_cb=dropped_cb)
+        buffer.put_nowait((2, 0, self.telegram('1/0/1')))
+        buffer.put_nowait((0, 1, self.telegram('1/0/2')))
+        buffer.put_nowait((2, 2, self.telegram('1/0/3')))
+        buffer.put_nowait((1, 3, self.telegram('1/0/4')))
+        dropped_cb.assert_called_once_with((2, 0, self.telegram('1/0/1')))
+        self.assertEqual([entry[1] for entry in self.drain(buffer)], [1, 3, 2])
+
+        buffer.overflow_policy = OverflowPolicy.COALESCE
+        buffer.put_nowait((2, 0, self.telegram('1/0/1', 0)))
+        buffer.put_nowait((1, 1, self.telegram('1/0/2')))
+        buffer.put_nowait((2, 2, self.telegram('1/0/3')))
+        buffer.put_nowait((0, 3, self.telegram('1/0/1', 1)))
+        self.assertEqual(self.drain(buffer), [
+            (1, 1, self.telegram('1/0/2')), (2, 0, self.telegram('1/0/1', 1)), (2, 2, self.telegram('1/0/3'))])
+
+    def test_priority_buffer_pushpop(self):
+        """Test pushpop of priority buffer."""
+        buffer = PriorityTelegramBuffer()
+        self.assertEqual(buffer.pushpop((2, 0, None)), (2, 0, None))
+        buffer.put_nowait((1, 1, None))
+        self.assertEqual(buffer.pushpop((2, 0, None)), (1, 1, None))
+        self.assertEqual(self.drain(buffer), [(2, 0, None)])
+
+    def test_received_telegrams_put_nowait(self):
+        """Test if received telegrams are queued without task and dropped if the queue is full."""
+        xknx = XKNX(loop=self.loop, incoming_queue_size=1)
+        interface = KNXIPInterface(xknx)
+        interface.telegram_received(self.telegram('1/0/1'))
+        interface.telegram_received(self.telegram('1/0/2'))
+        self.assertEqual(xknx.telegrams.qsize(), 1)
+        self.assertEqual(xknx.telegrams.drop_count, 1)
+        self.assertEqual(xknx.telegrams.get_nowait(), self.telegram('1/0/1'))
+
+    def test_outgoing_queue_dropped(self):
+        """Test if outgoing telegrams discarded by the outgoing queue are marked as done."""
+        xknx = XKNX(loop=self.loop, outgoing_queue_size=1, outgoing_overflow_policy=OverflowPolicy.DROP_OLDEST)
+        xknx.rate_limit = 0
+        sent = []
+
+        async def send_telegram(telegram):
+            sent.append(telegram)
+        xknx.knxip_interface = Mock(send_telegram=send_telegram)
+
+        async def run():
+            await xknx.telegram_queue.start()
+            self.assertEqual(xknx.telegram_queue.outgoing_queue.maxsize, 1)
+            for group_address in ('1/0/1', '1/0/2', '1/0/3'):
+                xknx.telegrams.put_nowait(Telegram(GroupAddress(group_address), payload=DPTBinary(1)))
+            await xknx.telegrams.join()
+            await xknx.telegram_queue.stop()
+
+        self.loop.run_until_complete(asyncio.wait_for(run(), 1))
+        self.assertEqual(len(sent) + xknx.telegram_queue.outgoing_queue.drop_count, 3)
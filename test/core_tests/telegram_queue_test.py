@@ -4,10 +4,12 @@ import unittest
 from unittest.mock import Mock, patch
 
 from xknx import XKNX
+from xknx.devices import Switch
 from xknx.dpt import DPTBinary
 from xknx.exceptions import CouldNotParseTelegram
 from xknx.telegram import (
-    AddressFilter, GroupAddress, Telegram, TelegramDirection)
+    AddressFilter, GroupAddress, Telegram, TelegramDirection, TelegramPriority,
+    TelegramType)
 
 
 class TestTelegramQueue(unittest.TestCase):
@@ -81,15 +83,182 @@ class TestTelegramQueue(unittest.TestCase):
         xknx.telegrams.put_nowait(telegram_in)
         self.loop.run_until_complete(xknx.telegrams.join())
         self.assertEqual(async_sleep_mock.call_count, 0)
-        # sleep for outgoing telegrams
+        # no sleep for first outgoing telegram (bucket is full), sleep for second
         xknx.telegrams.put_nowait(telegram_out)
         xknx.telegrams.put_nowait(telegram_out)
         self.loop.run_until_complete(xknx.telegrams.join())
-        self.assertEqual(async_sleep_mock.call_count, 2)
-        async_sleep_mock.assert_called_with(sleep_time)
+        self.assertEqual(async_sleep_mock.call_count, 1)
+        self.assertAlmostEqual(async_sleep_mock.call_args[0][0], sleep_time, places=2)
 
         self.loop.run_until_complete(xknx.telegram_queue.stop())
 
+    @patch('asyncio.sleep')
+    def test_rate_limit_burst(self, async_sleep_mock):
+        """Test if a burst of telegrams is sent without delay."""
+        # pylint: disable=no-self-use
+        async def async_none():
+            return None
+        async_sleep_mock.return_value = asyncio.ensure_future(async_none())
+
+        xknx = XKNX(loop=self.loop, rate_limit=20, rate_limit_burst=3)
+        telegram_out = Telegram(
+            direction=TelegramDirection.OUTGOING,
+            payload=DPTBinary(1),
+            group_address=GroupAddress("1/2/3"))
+
+        self.loop.run_until_complete(xknx.telegram_queue.start())
+        for _ in range(3):
+            xknx.telegrams.put_nowait(telegram_out)
+        self.loop.run_until_complete(xknx.telegrams.join())
+        self.assertEqual(async_sleep_mock.call_count, 0)
+
+        xknx.telegrams.put_nowait(telegram_out)
+        self.loop.run_until_complete(xknx.telegrams.join())
+        self.assertEqual(async_sleep_mock.call_count, 1)
+
+        self.loop.run_until_complete(xknx.telegram_queue.stop())
+
+    @patch('xknx.core.TelegramQueue.process_telegram_outgoing')
+    def test_outgoing_priority(self, process_tg_out_mock):
+        """Test if outgoing telegrams of higher priority overtake queued telegrams."""
+        # pylint: disable=no-self-use
+        async def async_none(telegram):
+            return None
+        process_tg_out_mock.side_effect = async_none
+
+        xknx = XKNX(loop=self.loop, rate_limit=0)
+        telegrams = [
+            Telegram(GroupAddress("1/2/1")),
+            Telegram(GroupAddress("1/2/2")),
+            Telegram(GroupAddress("1/2/3"), priority=TelegramPriority.NORMAL),
+            Telegram(GroupAddress("1/2/4"), priority=TelegramPriority.SYSTEM),
+            Telegram(GroupAddress("1/2/5"), priority=TelegramPriority.URGENT),
+        ]
+        for telegram in telegrams:
+            xknx.telegrams.put_nowait(telegram)
+
+        self.loop.run_until_complete(xknx.telegram_queue.start())
+        self.loop.run_until_complete(xknx.telegrams.join())
+        self.loop.run_until_complete(xknx.telegram_queue.stop())
+
+        sent = [call[0][0].group_address for call in process_tg_out_mock.call_args_list]
+        self.assertEqual(sent, [
+            GroupAddress("1/2/4"),
+            GroupAddress("1/2/5"),
+            GroupAddress("1/2/3"),
+            GroupAddress("1/2/1"),
+            GroupAddress("1/2/2")])
+
+    @patch('xknx.core.TelegramQueue.process_telegram_outgoing')
+    def test_write_overtakes_state_reads(self, process_tg_out_mock):
+        """Test if writes of devices are sent before queued state reads."""
+        # pylint: disable=no-self-use
+        async def async_none(telegram):
+            return None
+        process_tg_out_mock.side_effect = async_none
+
+        xknx = XKNX(loop=self.loop, rate_limit=0)
+        switch = Switch(xknx, 'TestSwitch', group_address='1/2/1')
+        alarm = Switch(xknx, 'TestAlarm', group_address='1/2/2')
+        alarm.priority = TelegramPriority.URGENT
+        for index in range(3):
+            xknx.telegrams.put_nowait(
+                Telegram(GroupAddress("1/3/{}".format(index)), telegramtype=TelegramType.GROUP_READ))
+        self.loop.run_until_complete(switch.set_on())
+        self.loop.run_until_complete(alarm.set_on())
+
+        self.loop.run_until_complete(xknx.telegram_queue.start())
+        self.loop.run_until_complete(xknx.telegrams.join())
+        self.loop.run_until_complete(xknx.telegram_queue.stop())
+
+        sent = [call[0][0] for call in process_tg_out_mock.call_args_list]
+        self.assertEqual([telegram.group_address for telegram in sent], [
+            GroupAddress("1/2/2"),
+            GroupAddress("1/2/1"),
+            GroupAddress("1/3/0"),
+            GroupAddress("1/3/1"),
+            GroupAddress("1/3/2")])
+        self.assertEqual(sent[0].priority, TelegramPriority.URGENT)
+
+    @patch('xknx.core.TelegramQueue.process_telegram_outgoing')
+    def test_coalesce_outgoing_writes(self, process_tg_out_mock):
+        """Test if queued GroupValueWrites are replaced by newer writes to the same group address."""
+        # pylint: disable=no-self-use
+        async def async_none(telegram):
+            return None
+        process_tg_out_mock.side_effect = async_none
+
+        xknx = XKNX(loop=self.loop, rate_limit=0, coalesce_outgoing_writes=True)
+        telegrams = [
+            Telegram(GroupAddress("1/2/1"), payload=DPTBinary(0)),
+            Telegram(GroupAddress("1/2/2"), payload=DPTBinary(0)),
+            Telegram(GroupAddress("1/2/1"), payload=DPTBinary(1)),
+            Telegram(GroupAddress("1/2/1"), telegramtype=TelegramType.GROUP_READ),
+            Telegram(GroupAddress("1/2/2"), payload=DPTBinary(1)),
+        ]
+        for telegram in telegrams:
+            xknx.telegrams.put_nowait(telegram)
+
+        self.loop.run_until_complete(xknx.telegram_queue.start())
+        self.loop.run_until_complete(xknx.telegrams.join())
+        self.loop.run_until_complete(xknx.telegram_queue.stop())
+
+        sent = [call[0][0] for call in process_tg_out_mock.call_args_list]
+        self.assertEqual(sent, [
+            Telegram(GroupAddress("1/2/1"), payload=DPTBinary(1)),
+            Telegram(GroupAddress("1/2/2"), payload=DPTBinary(1)),
+            Telegram(GroupAddress("1/2/1"), telegramtype=TelegramType.GROUP_READ)])
+        self.assertEqual(xknx.telegram_queue.coalesced_writes, 2)
+
+    @patch('xknx.core.TelegramQueue.process_telegram_outgoing')
+    def test_drop_expired(self, process_tg_out_mock):
+        """Test if outgoing telegrams are dropped once their deadline passed."""
+        # pylint: disable=no-self-use
+        async def async_none(telegram):
+            return None
+        process_tg_out_mock.side_effect = async_none
+
+        xknx = XKNX(loop=self.loop, rate_limit=0, outgoing_ttl=10)
+        expired = Telegram(GroupAddress("1/2/1"), deadline=0)
+        default_ttl = Telegram(GroupAddress("1/2/2"))
+        xknx.telegrams.put_nowait(expired)
+        xknx.telegrams.put_nowait(default_ttl)
+
+        self.loop.run_until_complete(xknx.telegram_queue.start())
+        self.loop.run_until_complete(xknx.telegrams.join())
+        self.loop.run_until_complete(xknx.telegram_queue.stop())
+
+        process_tg_out_mock.assert_called_once_with(default_ttl)
+        self.assertIsNotNone(default_ttl.deadline)
+        self.assertEqual(xknx.telegram_queue.expired_telegrams, 1)
+
+    @patch('xknx.core.TelegramQueue.process_telegram_outgoing')
+    def test_handler_sends_into_full_incoming_queue(self, process_tg_out_mock):
+        """Test if a handler sending a telegram while the bounded incoming queue is full does not block."""
+        # pylint: disable=no-self-use
+        async def async_none(telegram):
+            return None
+        process_tg_out_mock.side_effect = async_none
+
+        xknx = XKNX(loop=self.loop, rate_limit=0, incoming_queue_size=1)
+        response = Telegram(GroupAddress("1/2/9"), payload=DPTBinary(1))
+
+        async def handler(telegram):
+            if telegram.group_address == GroupAddress("1/2/1"):
+                # bus traffic filled the incoming queue meanwhile
+                xknx.telegrams.put_nowait(
+                    Telegram(GroupAddress("1/2/2"), direction=TelegramDirection.INCOMING, payload=DPTBinary(1)))
+                self.assertTrue(xknx.telegrams.full())
+                await xknx.telegrams.put(response)
+        xknx.telegram_queue.register_telegram_received_cb(handler)
+        xknx.telegrams.put_nowait(
+            Telegram(GroupAddress("1/2/1"), direction=TelegramDirection.INCOMING, payload=DPTBinary(1)))
+
+        self.loop.run_until_complete(xknx.telegram_queue.start())
+        self.loop.run_until_complete(asyncio.wait_for(xknx.telegrams.join(), 1))
+        self.loop.run_until_complete(asyncio.wait_for(xknx.telegram_queue.stop(), 1))
+        process_tg_out_mock.assert_called_once_with(response)
+
     #
     # TEST REGISTER
     #
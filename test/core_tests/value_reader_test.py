@@ -42,13 +42,10 @@ class TestValueReader(unittest.TestCase):
 
         # GroupValueRead telegram is still in the queue because we are not actually processing it
         self.assertEqual(xknx.telegrams.qsize(), 1)
-        # Callback was removed again
+        # No callback was registered, pending read was removed again
         self.assertEqual(xknx.telegram_queue.telegram_received_cbs,
                          [])
-        # Timeout handle was cancelled (cancelled method requires Python 3.7)
-        event_has_cancelled = getattr(value_reader.timeout_handle, "cancelled", None)
-        if callable(event_has_cancelled):
-            self.assertTrue(value_reader.timeout_handle.cancelled())
+        self.assertFalse(xknx.telegram_queue.read_multiplexer.is_pending(value_reader.group_address))
         # timeout() was never called because there was no timeout
         timeout_mock.assert_not_called()
         # Telegram was received
@@ -71,13 +68,10 @@ class TestValueReader(unittest.TestCase):
         # Warning was logged
         logger_warning_mock.assert_called_once_with(
             "Error: KNX bus did not respond in time to GroupValueRead request for: %s", GroupAddress('0/0/0'))
-        # Callback was removed again
+        # No callback was registered, pending read was removed again
         self.assertEqual(xknx.telegram_queue.telegram_received_cbs,
                          [])
-        # Timeout handle was cancelled (cancelled method requires Python 3.7)
-        event_has_cancelled = getattr(value_reader.timeout_handle, "cancelled", None)
-        if callable(event_has_cancelled):
-            self.assertTrue(value_reader.timeout_handle.cancelled())
+        self.assertFalse(xknx.telegram_queue.read_multiplexer.is_pending(value_reader.group_address))
         # No telegram was received
         self.assertIsNone(value_reader.received_telegram)
         # Unsuccessfull read() returns None
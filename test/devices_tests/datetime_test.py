@@ -39,7 +39,7 @@ class TestDateTime(unittest.TestCase):
         self.assertEqual(telegram.group_address, GroupAddress('1/2/3'))
         self.assertEqual(telegram.telegramtype, TelegramType.GROUP_WRITE)
         self.assertEqual(len(telegram.payload.value), 8)
-        self.assertEqual(telegram.payload.value, (0x75, 0x01, 0x07, 0xE9, 0x0D, 0x0E, 0x0, 0x0))
+        self.assertEqual(telegram.payload.value, bytes((0x75, 0x01, 0x07, 0xE9, 0x0D, 0x0E, 0x0, 0x0)))
 
     #
     # SYNC Date
@@ -57,7 +57,7 @@ class TestDateTime(unittest.TestCase):
         self.assertEqual(telegram.group_address, GroupAddress('1/2/3'))
         self.assertEqual(telegram.telegramtype, TelegramType.GROUP_WRITE)
         self.assertEqual(len(telegram.payload.value), 3)
-        self.assertEqual(telegram.payload.value, (0x07, 0x01, 0x11))
+        self.assertEqual(telegram.payload.value, bytes((0x07, 0x01, 0x11)))
 
     #
     # SYNC Time
@@ -75,7 +75,7 @@ class TestDateTime(unittest.TestCase):
         self.assertEqual(telegram.group_address, GroupAddress('1/2/3'))
         self.assertEqual(telegram.telegramtype, TelegramType.GROUP_WRITE)
         self.assertEqual(len(telegram.payload.value), 3)
-        self.assertEqual(telegram.payload.value, (0xE9, 0x0D, 0x0E))
+        self.assertEqual(telegram.payload.value, bytes((0xE9, 0x0D, 0x0E)))
 
     #
     # PROCESS
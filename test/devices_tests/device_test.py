@@ -4,10 +4,11 @@ import unittest
 from unittest.mock import Mock, patch
 
 from xknx import XKNX
-from xknx.devices import Device
+from xknx.devices import Device, Switch
 from xknx.dpt import DPTArray
 from xknx.exceptions import XKNXException
-from xknx.telegram import GroupAddress, Telegram, TelegramType
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramPriority, TelegramType)
 
 
 class TestDevice(unittest.TestCase):
@@ -28,6 +29,15 @@ class TestDevice(unittest.TestCase):
         device = Device(xknx, 'TestDevice')
         self.assertEqual(device.state_addresses(), [])
 
+    def test_remote_values(self):
+        """Test if remote values of device and nested devices are yielded."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestSwitch', group_address='1/2/3')
+        self.assertEqual(list(switch.remote_values()), [switch.switch])
+        device = Device(xknx, 'TestDevice')
+        device.nested = switch
+        self.assertEqual(list(device.remote_values()), [switch.switch])
+
     def test_process_callback(self):
         """Test process / reading telegrams from telegram queue. Test if callback was called."""
         xknx = XKNX(loop=self.loop)
@@ -211,3 +221,54 @@ class TestDevice(unittest.TestCase):
                     mock_device_process.return_value = fut2
                     self.loop.run_until_complete(asyncio.Task(device._sync_impl()))
                     mock_device_process.assert_called_with(telegram)
+
+    def test_coalesce_device_updated(self):
+        """Test if updates within callback_coalesce_window are merged into one callback."""
+        xknx = XKNX(loop=self.loop, callback_coalesce_window=0.01)
+        device = Device(xknx, 'TestDevice')
+        xknx.devices.add(device)
+        updated = []
+
+        async def device_updated_cb(device):
+            """Record updated device."""
+            updated.append(device)
+
+        xknx.devices.register_device_updated_cb(device_updated_cb)
+        for _ in range(3):
+            self.loop.run_until_complete(device.after_update())
+        self.assertEqual(updated, [])
+        self.loop.run_until_complete(asyncio.sleep(0.02))
+        self.assertEqual(updated, [device])
+
+        self.loop.run_until_complete(device.after_update())
+        self.loop.run_until_complete(asyncio.sleep(0.02))
+        self.assertEqual(updated, [device, device])
+
+    def test_cancel_coalesced_updates(self):
+        """Test if pending coalesced updates are cancelled on stop."""
+        xknx = XKNX(loop=self.loop, callback_coalesce_window=0.01)
+        device = Device(xknx, 'TestDevice')
+        xknx.devices.add(device)
+        updated = []
+
+        async def device_updated_cb(device):
+            """Record updated device."""
+            updated.append(device)
+
+        xknx.devices.register_device_updated_cb(device_updated_cb)
+        self.loop.run_until_complete(device.after_update())
+        # called for all devices by XKNX.stop()
+        device.cancel_coalesced_updates()
+        self.loop.run_until_complete(asyncio.sleep(0.02))
+        self.assertEqual(updated, [])
+        self.assertIsNone(device._coalesced_update)
+
+    def test_priority(self):
+        """Test if the priority of a device is used by its remote values."""
+        xknx = XKNX(loop=self.loop)
+        switch = Switch(xknx, 'TestSwitch', group_address='1/2/3')
+        self.assertEqual(switch.priority, TelegramPriority.LOW)
+        switch.priority = TelegramPriority.URGENT
+        self.loop.run_until_complete(switch.set_on())
+        telegram = xknx.telegrams.get_nowait()
+        self.assertEqual(telegram.priority, TelegramPriority.URGENT)
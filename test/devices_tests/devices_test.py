@@ -102,6 +102,37 @@ class TestDevices(unittest.TestCase):
             tuple(devices.devices_by_group_address(GroupAddress('3/0/1'))),
             (sensor1, sensor2))
 
+    def test_device_by_group_address_index_update(self):
+        """Test if group address index is updated after adding devices and reassigning group addresses."""
+        xknx = XKNX(loop=self.loop)
+
+        switch1 = Switch(xknx,
+                         "TestOutlet_1",
+                         group_address='1/2/3')
+        xknx.devices.add(switch1)
+        self.assertEqual(
+            tuple(xknx.devices.devices_by_group_address(GroupAddress('1/2/3'))),
+            (switch1,))
+
+        switch2 = Switch(xknx,
+                         "TestOutlet_2",
+                         group_address='1/2/3')
+        xknx.devices.add(switch2)
+        self.assertEqual(
+            tuple(xknx.devices.devices_by_group_address(GroupAddress('1/2/3'))),
+            (switch1, switch2))
+
+        switch1.switch.group_addresses = '1/2/4'
+        self.assertEqual(
+            tuple(xknx.devices.devices_by_group_address(GroupAddress('1/2/3'))),
+            (switch2,))
+        self.assertEqual(
+            tuple(xknx.devices.devices_by_group_address(GroupAddress('1/2/4'))),
+            (switch1,))
+        self.assertEqual(
+            tuple(xknx.devices.devices_by_group_address(GroupAddress('1/2/5'))),
+            ())
+
     def test_iter(self):
         """Test __iter__() function."""
         xknx = XKNX(loop=self.loop)
@@ -283,3 +314,58 @@ class TestDevices(unittest.TestCase):
         after_update_callback2.assert_not_called()
         after_update_callback1.reset_mock()
         after_update_callback2.reset_mock()
+
+    def test_subscribe_device_updates(self):
+        """Test receiving updated devices in batches."""
+        xknx = XKNX(loop=self.loop)
+        device1 = Device(xknx, 'TestDevice1')
+        device2 = Device(xknx, 'TestDevice2')
+        xknx.devices.add(device1)
+        xknx.devices.add(device2)
+        subscription = xknx.devices.subscribe_device_updates()
+
+        async def update_and_receive():
+            """Update devices within one event loop iteration and receive batch."""
+            await device1.after_update()
+            await device2.after_update()
+            await device1.after_update()
+            return await subscription.__anext__()
+
+        self.assertEqual(self.loop.run_until_complete(update_and_receive()), [device1, device2])
+
+        self.loop.run_until_complete(device2.after_update())
+        subscription.close()
+        self.assertEqual(xknx.devices.device_update_subscriptions, [])
+
+        async def receive_all():
+            """Receive remaining batches."""
+            return [batch async for batch in subscription]
+
+        # pending batch is delivered after close
+        self.assertEqual(self.loop.run_until_complete(receive_all()), [[device2]])
+        self.loop.run_until_complete(device1.after_update())
+        self.assertEqual(self.loop.run_until_complete(receive_all()), [])
+
+    def test_subscribe_device_updates_interval(self):
+        """Test collecting updated devices for an interval."""
+        xknx = XKNX(loop=self.loop)
+        device1 = Device(xknx, 'TestDevice1')
+        device2 = Device(xknx, 'TestDevice2')
+        xknx.devices.add(device1)
+        xknx.devices.add(device2)
+        subscription = xknx.devices.subscribe_device_updates(interval=0.02)
+
+        async def update_later():
+            """Update device within interval."""
+            await asyncio.sleep(0.01)
+            await device2.after_update()
+
+        async def update_and_receive():
+            """Update devices and receive batch."""
+            await device1.after_update()
+            self.loop.create_task(update_later())
+            return await subscription.__anext__()
+
+        self.assertEqual(self.loop.run_until_complete(update_and_receive()), [device1, device2])
+        xknx.devices.unsubscribe_device_updates(subscription)
+        self.assertTrue(subscription.closed)
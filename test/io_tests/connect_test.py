@@ -8,6 +8,7 @@ from xknx.io import Connect, UDPClient
 from xknx.knxip import (
     HPAI, ConnectRequestType, ConnectResponse, ErrorCode, KNXIPFrame,
     KNXIPServiceType)
+from xknx.telegram import PhysicalAddress
 
 
 class TestConnect(unittest.TestCase):
@@ -72,3 +73,5 @@ class TestConnect(unittest.TestCase):
         self.assertTrue(connect.success)
         self.assertEqual(connect.communication_channel, 23)
         self.assertEqual(connect.identifier, 7)
+        # the assigned address belongs to the tunnel only
+        self.assertEqual(xknx.own_address, PhysicalAddress('15.15.250'))
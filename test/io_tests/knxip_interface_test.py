@@ -0,0 +1,38 @@
+"""Unit test for KNX/IP interface."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.core import OverflowPolicy
+from xknx.dpt import DPTBinary
+from xknx.io import KNXIPInterface
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+
+
+class TestKNXIPInterface(unittest.TestCase):
+    """Test class for xknx/io/KNXIPInterface objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_incoming_queue_full(self):
+        """Test if telegrams received while the incoming queue is full are counted and logged."""
+        xknx = XKNX(loop=self.loop, incoming_queue_size=1, incoming_overflow_policy=OverflowPolicy.BLOCK)
+        interface = KNXIPInterface(xknx)
+        telegrams = [Telegram(GroupAddress('1/2/{}'.format(index)), payload=DPTBinary(1),
+                              direction=TelegramDirection.INCOMING) for index in range(2)]
+
+        with patch.object(xknx.logger, 'warning') as mock_warning:
+            for telegram in telegrams:
+                interface.telegram_received(telegram)
+            mock_warning.assert_called_once_with(
+                "Incoming telegram queue full. Dropping %s (%s dropped so far)", telegrams[1], 1)
+        self.assertEqual(xknx.telegrams.qsize(), 1)
+        self.assertEqual(xknx.telegrams.drop_count, 1)
@@ -0,0 +1,114 @@
+"""Unit test for connecting several KNX/IP gateways."""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.exceptions import XKNXException
+from xknx.io import (
+    ConnectionConfig, ConnectionType, KNXIPInterface, MultiGateway)
+from xknx.telegram import (
+    GroupAddress, PhysicalAddress, Telegram, TelegramDirection)
+
+
+class TestMultiGateway(unittest.TestCase):
+    """Test class for xknx/io/MultiGateway objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+        self.received = []
+        self.line_1 = KNXIPInterface(self.xknx, ConnectionConfig(
+            connection_type=ConnectionType.TUNNELING, gateway_ip='192.168.1.2', address_filters=['1/*/*']))
+        self.line_2 = KNXIPInterface(self.xknx, ConnectionConfig(
+            connection_type=ConnectionType.TUNNELING, gateway_ip='192.168.1.3', address_filters=['2/*/*']))
+        self.default = KNXIPInterface(self.xknx, ConnectionConfig(
+            connection_type=ConnectionType.ROUTING))
+        self.multi_gateway = MultiGateway(self.xknx, [self.line_1, self.line_2, self.default],
+                                          telegram_received_callback=self.received.append)
+        for gateway in self.multi_gateway.gateways:
+            gateway.interface = Mock(connected=True, send_telegram=AsyncMock())
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    @staticmethod
+    def telegram(group_address, value=1, source_address=None):
+        """Return telegram."""
+        direction = TelegramDirection.OUTGOING if source_address is None else TelegramDirection.INCOMING
+        return Telegram(GroupAddress(group_address), payload=DPTBinary(value),
+                        direction=direction, source_address=source_address)
+
+    def test_gateways_for(self):
+        """Test order of gateways for group addresses."""
+        self.assertEqual(self.multi_gateway.gateways_for(GroupAddress('1/0/1')),
+                         [self.line_1, self.default, self.line_2])
+        self.assertEqual(self.multi_gateway.gateways_for(GroupAddress('2/0/1')),
+                         [self.line_2, self.default, self.line_1])
+        self.assertEqual(self.multi_gateway.gateways_for(GroupAddress('3/0/1')),
+                         [self.default, self.line_1, self.line_2])
+
+    def test_send_telegram(self):
+        """Test if telegrams are sent through the responsible gateway."""
+        self.loop.run_until_complete(self.multi_gateway.send_telegram(self.telegram('2/0/1')))
+        self.line_2.interface.send_telegram.assert_called_once_with(self.telegram('2/0/1'))
+        self.line_1.interface.send_telegram.assert_not_called()
+        self.assertEqual(self.multi_gateway.failover_telegrams, 0)
+
+    def test_failover(self):
+        """Test if telegrams are sent through another gateway while the responsible one is disconnected."""
+        self.line_1.interface.connected = False
+        self.loop.run_until_complete(self.multi_gateway.send_telegram(self.telegram('1/0/1')))
+        self.default.interface.send_telegram.assert_called_once_with(self.telegram('1/0/1'))
+        self.assertEqual(self.multi_gateway.failover_telegrams, 1)
+
+        # all disconnected - buffered by the responsible gateway
+        for gateway in self.multi_gateway.gateways:
+            gateway.interface.connected = False
+        self.loop.run_until_complete(self.multi_gateway.send_telegram(self.telegram('1/0/2')))
+        self.line_1.interface.send_telegram.assert_called_once_with(self.telegram('1/0/2'))
+
+    def test_start_skips_gateways(self):
+        """Test if gateways which can not be connected are skipped."""
+        self.line_1.start = AsyncMock()
+        self.line_2.start = AsyncMock(side_effect=XKNXException("Could not establish connection"))
+        self.line_2.stop = AsyncMock()
+        self.default.start = AsyncMock(side_effect=OSError("Network unreachable"))
+        self.default.stop = AsyncMock()
+        self.loop.run_until_complete(self.multi_gateway.start())
+        self.assertEqual(self.multi_gateway.gateways, [self.line_1])
+
+        self.line_1.start = AsyncMock(side_effect=XKNXException("Could not establish connection"))
+        self.line_1.stop = AsyncMock()
+        with self.assertRaisesRegex(XKNXException, "Could not establish connection"):
+            self.loop.run_until_complete(self.multi_gateway.start())
+
+    def test_merge_received_telegrams(self):
+        """Test if telegrams received through several gateways are passed on once."""
+        source_address = PhysicalAddress('1.2.3')
+        self.line_1.telegram_received(self.telegram('1/0/1', 1, source_address))
+        self.line_2.telegram_received(self.telegram('1/0/1', 1, source_address))
+        self.line_2.telegram_received(self.telegram('2/0/1', 1, source_address))
+        # sent by xknx and forwarded by couplers
+        self.line_2.telegram_received(self.telegram('1/0/1', 0, self.xknx.own_address))
+
+        self.assertEqual(self.received, [
+            self.telegram('1/0/1', 1, source_address),
+            self.telegram('2/0/1', 1, source_address)])
+        self.assertEqual(self.multi_gateway.duplicate_telegrams, 1)
+        # nothing was queued by the gateways
+        self.assertTrue(self.xknx.telegrams.empty())
+
+    def test_interface_start(self):
+        """Test if KNXIPInterface connects all gateways of a MULTI_GATEWAY connection."""
+        interface = KNXIPInterface(self.xknx, ConnectionConfig(
+            connection_type=ConnectionType.MULTI_GATEWAY,
+            gateways=[ConnectionConfig(connection_type=ConnectionType.ROUTING, local_ip='192.168.1.1')]))
+        with patch.object(MultiGateway, 'start', AsyncMock()):
+            self.loop.run_until_complete(interface.start())
+        self.assertIsInstance(interface.interface, MultiGateway)
+        self.assertEqual(len(interface.interface.gateways), 1)
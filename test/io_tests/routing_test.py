@@ -0,0 +1,77 @@
+"""Unit test for KNX/IP routing."""
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+from xknx import XKNX
+from xknx.devices import Switch
+from xknx.dpt import DPTBinary
+from xknx.io import Routing
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+from xknx.telegram import GroupAddress, PhysicalAddress, Telegram
+
+
+class TestRouting(unittest.TestCase):
+    """Test class for xknx/io/Routing objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    @staticmethod
+    def routing_indication(xknx, group_address):
+        """Return raw routing indication frame."""
+        knxipframe = KNXIPFrame(xknx)
+        knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+        knxipframe.body.src_addr = PhysicalAddress('1.1.1')
+        knxipframe.body.telegram = Telegram(GroupAddress(group_address), payload=DPTBinary(1))
+        knxipframe.normalize()
+        return bytes(knxipframe.to_knx())
+
+    def test_prefilter(self):
+        """Test if routing indications are dropped by destination address and APCI."""
+        xknx = XKNX(loop=self.loop)
+        xknx.devices.add(Switch(xknx, 'TestSwitch', group_address='1/2/3'))
+        telegram_received_callback = Mock()
+        routing = Routing(xknx, telegram_received_callback, '127.0.0.1', False)
+
+        memory_read = bytearray(self.routing_indication(xknx, '1/2/3'))
+        # APCI 0x200 - A_Memory_Read
+        memory_read[15] |= 0x02
+        raws = [self.routing_indication(xknx, '1/2/3'),
+                self.routing_indication(xknx, '1/2/4'),
+                bytes(memory_read)]
+        self.assertEqual([routing.prefilter(raw) for raw in raws], [True, False, False])
+
+        routing.udpclient.datagrams_received_callback(raws)
+        telegram_received_callback.assert_called_once()
+        self.assertEqual(telegram_received_callback.call_args[0][0].group_address, GroupAddress('1/2/3'))
+
+    def test_prefilter_individual_address(self):
+        """Test if routing indications addressed to physical addresses are dropped."""
+        xknx = XKNX(loop=self.loop)
+        routing = Routing(xknx, Mock(), '127.0.0.1', False)
+        raw = bytearray(self.routing_indication(xknx, '1/2/3'))
+        # clear destination address type flag
+        raw[9] &= 0x7F
+        self.assertFalse(routing.prefilter(bytes(raw)))
+
+    def test_prefilter_inactive(self):
+        """Test if all frames pass if a callback without address filters is registered."""
+
+        async def telegram_received(telegram):
+            """Telegram received callback."""
+
+        xknx = XKNX(loop=self.loop, telegram_received_cb=telegram_received)
+        routing = Routing(xknx, Mock(), '127.0.0.1', False)
+        self.assertTrue(routing.prefilter(self.routing_indication(xknx, '1/2/4')))
+        # other service types and malformed frames are left to the parser
+        xknx.telegram_queue.unregister_telegram_received_cb(xknx.telegram_queue.telegram_received_cbs[0])
+        self.assertFalse(routing.prefilter(self.routing_indication(xknx, '1/2/4')))
+        self.assertTrue(routing.prefilter(b'\x06\x10\x02\x06\x00\x08\x01\x00'))
+        self.assertTrue(routing.prefilter(b'\x06\x10\x05\x30\x00\x08\x29\x00'))
@@ -0,0 +1,120 @@
+"""Unit test for KNX/IP tunnel pool."""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.exceptions import XKNXException
+from xknx.io import TunnelPool
+from xknx.telegram import (
+    GroupAddress, PhysicalAddress, Telegram, TelegramDirection)
+
+
+class TestTunnelPool(unittest.TestCase):
+    """Test class for xknx/io/TunnelPool objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+        self.received = []
+        self.pool = TunnelPool(self.xknx, '192.168.1.1', '192.168.1.2', 3671, channels=2,
+                               telegram_received_callback=self.received.append)
+        for index, tunnel in enumerate(self.pool.tunnels):
+            tunnel.src_address = PhysicalAddress('1.1.{}'.format(index + 10))
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    @staticmethod
+    def telegram(group_address, value=1, source_address=None):
+        """Return telegram."""
+        direction = TelegramDirection.OUTGOING if source_address is None else TelegramDirection.INCOMING
+        return Telegram(GroupAddress(group_address), payload=DPTBinary(value),
+                        direction=direction, source_address=source_address)
+
+    def test_spread_outgoing_telegrams(self):
+        """Test if telegrams are spread across channels - keeping the order per group address."""
+        sent = {tunnel: [] for tunnel in self.pool.tunnels}
+
+        def send(tunnel):
+            async def _send(telegram):
+                await asyncio.sleep(0)
+                sent[tunnel].append(telegram)
+            return _send
+
+        for tunnel in self.pool.tunnels:
+            tunnel.start = AsyncMock()
+            tunnel.stop = AsyncMock()
+            tunnel.connected = True
+            tunnel.send_telegram = send(tunnel)
+
+        async def run():
+            await self.pool.start()
+            for telegram in (self.telegram('1/0/1', 1), self.telegram('1/0/2', 1),
+                             self.telegram('1/0/1', 0), self.telegram('1/0/2', 0)):
+                await self.pool.send_telegram(telegram)
+            await self.pool.stop()
+        self.loop.run_until_complete(run())
+
+        first, second = self.pool.tunnels
+        self.assertEqual(sent[first], [self.telegram('1/0/1', 1), self.telegram('1/0/1', 0)])
+        self.assertEqual(sent[second], [self.telegram('1/0/2', 1), self.telegram('1/0/2', 0)])
+        self.assertEqual(self.pool._pending, {})
+
+    def test_start_drops_channels(self):
+        """Test if channels which can not be opened are closed."""
+        first, second = self.pool.tunnels
+        first.start = AsyncMock()
+        second.start = AsyncMock(side_effect=XKNXException("Could not establish connection"))
+        second.stop = AsyncMock()
+
+        self.loop.run_until_complete(self.pool.start())
+        self.assertEqual(self.pool.tunnels, [first])
+        second.stop.assert_called_once_with()
+
+        first.stop = AsyncMock()
+        self.loop.run_until_complete(self.pool.stop())
+        first.stop.assert_called_once_with()
+
+    def test_start_fails(self):
+        """Test if start fails if no channel can be opened."""
+        for tunnel in self.pool.tunnels:
+            tunnel.start = AsyncMock(side_effect=XKNXException("Could not establish connection"))
+            tunnel.stop = AsyncMock()
+        with self.assertRaisesRegex(XKNXException, "Could not establish connection"):
+            self.loop.run_until_complete(self.pool.start())
+
+    def test_drop_duplicates(self):
+        """Test if telegrams received on several channels are passed on once."""
+        first, second = self.pool.tunnels
+        source_address = PhysicalAddress('1.2.3')
+        self.pool.telegram_received(first, self.telegram('1/0/1', 1, source_address))
+        self.pool.telegram_received(second, self.telegram('1/0/1', 1, source_address))
+        # same telegram sent twice on the bus
+        self.pool.telegram_received(second, self.telegram('1/0/1', 1, source_address))
+        self.pool.telegram_received(first, self.telegram('1/0/1', 1, source_address))
+        self.pool.telegram_received(first, self.telegram('1/0/1', 0, source_address))
+        # sent by the pool through the other channel
+        self.pool.telegram_received(second, self.telegram('1/0/1', 1, first.src_address))
+
+        self.assertEqual(self.received, [
+            self.telegram('1/0/1', 1, source_address),
+            self.telegram('1/0/1', 1, source_address),
+            self.telegram('1/0/1', 0, source_address)])
+        self.assertEqual(self.pool.duplicate_telegrams, 2)
+
+    def test_duplicate_window(self):
+        """Test if telegrams received after the duplicate window are passed on."""
+        first, second = self.pool.tunnels
+        source_address = PhysicalAddress('1.2.3')
+        with patch('time.monotonic', Mock(return_value=100)):
+            self.pool.telegram_received(first, self.telegram('1/0/1', 1, source_address))
+        with patch('time.monotonic', Mock(return_value=110)):
+            self.pool.telegram_received(first, self.telegram('1/0/1', 1, source_address))
+            self.pool.telegram_received(second, self.telegram('1/0/1', 1, source_address))
+        self.assertEqual(len(self.received), 2)
+        self.assertEqual(len(self.pool.duplicate_filter), 1)
@@ -0,0 +1,105 @@
+"""Unit test for KNX/IP tunnel."""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.io import Tunnel
+from xknx.telegram import GroupAddress, PhysicalAddress, Telegram
+
+
+class TestTunnel(unittest.TestCase):
+    """Test class for xknx/io/Tunnel objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.xknx = XKNX(loop=self.loop)
+        self.tunnel = Tunnel(self.xknx, self.xknx.own_address, '192.168.1.1', '192.168.1.2', 3671)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    @staticmethod
+    def telegram(group_address, **kwargs):
+        """Return outgoing telegram."""
+        return Telegram(GroupAddress(group_address), payload=DPTBinary(1), **kwargs)
+
+    def test_buffer_while_disconnected(self):
+        """Test if telegrams are buffered while disconnected and sent in order once connected."""
+        sent = []
+
+        async def send(telegram):
+            sent.append(telegram)
+
+        with patch.object(self.tunnel, '_send', side_effect=send):
+            self.loop.run_until_complete(self.tunnel.send_telegram(self.telegram('1/0/1')))
+            self.loop.run_until_complete(self.tunnel.send_telegram(self.telegram('1/0/2', deadline=0)))
+            self.loop.run_until_complete(self.tunnel.send_telegram(self.telegram('1/0/3')))
+            self.assertEqual(sent, [])
+            self.assertEqual(self.tunnel.buffered_telegrams, 3)
+
+            self.assertTrue(self.loop.run_until_complete(self.tunnel._flush_buffer()))
+            self.assertTrue(self.tunnel.connected)
+            self.loop.run_until_complete(self.tunnel.send_telegram(self.telegram('1/0/4')))
+
+        self.assertEqual([telegram.group_address for telegram in sent],
+                         [GroupAddress('1/0/1'), GroupAddress('1/0/3'), GroupAddress('1/0/4')])
+        # expired telegram
+        self.assertEqual(self.tunnel.dropped_telegrams, 1)
+
+    def test_connect_assigns_src_address(self):
+        """Test if the individual address assigned by the gateway is kept by the tunnel only."""
+        own_address = self.xknx.own_address
+        other_tunnel = Tunnel(self.xknx, self.xknx.own_address, '192.168.1.1', '192.168.1.2', 3671)
+        for tunnel, identifier in ((self.tunnel, 0x1101), (other_tunnel, 0x1102)):
+            connect = Mock(success=True, communication_channel=23, identifier=identifier, start=AsyncMock())
+            with patch('xknx.io.tunnel.Connect', return_value=connect), \
+                    patch.object(tunnel, 'start_heartbeat', new=AsyncMock()):
+                self.assertTrue(self.loop.run_until_complete(tunnel._connect()))
+        self.assertEqual(self.tunnel.src_address, PhysicalAddress('1.1.1'))
+        self.assertEqual(other_tunnel.src_address, PhysicalAddress('1.1.2'))
+        self.assertEqual(self.xknx.own_address, own_address)
+
+    def test_buffer_size(self):
+        """Test if the oldest telegram is dropped if the buffer is full."""
+        self.tunnel.buffer_size = 2
+        for group_address in ('1/0/1', '1/0/2', '1/0/3'):
+            self.loop.run_until_complete(self.tunnel.send_telegram(self.telegram(group_address)))
+        self.assertEqual([telegram.group_address for telegram in self.tunnel._buffer],
+                         [GroupAddress('1/0/2'), GroupAddress('1/0/3')])
+        self.assertEqual(self.tunnel.dropped_telegrams, 1)
+
+    def test_missing_ack_reconnects(self):
+        """Test if a telegram without TUNNELLING_ACK is kept and the tunnel is reconnected in the background."""
+        self.tunnel.connected = True
+        telegram = self.telegram('1/0/1')
+        slot = Mock(generation=self.tunnel.tunnelling_sender.generation)
+        with patch.object(self.tunnel.tunnelling_sender, 'send', new=AsyncMock(return_value=slot)), \
+                patch.object(self.tunnel.tunnelling_sender, 'wait_for_ack', new=AsyncMock(return_value=False)), \
+                patch.object(self.tunnel.tunnelling_sender, 'release'), \
+                patch.object(self.tunnel, '_reconnect_loop', new=AsyncMock()) as reconnect_loop:
+            self.loop.run_until_complete(self.tunnel.send_telegram(telegram))
+            self.assertFalse(self.tunnel.connected)
+            self.assertEqual(list(self.tunnel._resend), [telegram])
+            # further telegrams are buffered behind it
+            self.loop.run_until_complete(self.tunnel.send_telegram(self.telegram('1/0/2')))
+            self.assertEqual(self.tunnel.buffered_telegrams, 2)
+            self.loop.run_until_complete(self.tunnel._reconnect_task)
+        reconnect_loop.assert_called_once_with(0)
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_reconnect_backoff(self, sleep_mock):
+        """Test if the wait between failed reconnect attempts is doubled up to auto_reconnect_max_wait."""
+        self.tunnel.auto_reconnect_wait = 2
+        self.tunnel.auto_reconnect_max_wait = 5
+        with patch.object(self.tunnel, '_reconnect_once',
+                          new=AsyncMock(side_effect=[False, False, False, True])):
+            self.loop.run_until_complete(self.tunnel.reconnect())
+        self.assertEqual([call[0][0] for call in sleep_mock.call_args_list], [2, 4, 5])
+        self.assertEqual(self.tunnel.reconnect_attempts, 4)
+        self.assertEqual(self.tunnel.reconnects, 1)
+        self.assertIsNotNone(self.tunnel.last_reconnect_duration)
@@ -0,0 +1,131 @@
+"""Unit test for KNX/IP TunnellingSender."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.io import TunnellingSender, UDPClient
+from xknx.knxip import ErrorCode, KNXIPFrame, KNXIPServiceType
+from xknx.telegram import GroupAddress, PhysicalAddress, Telegram
+
+
+class TestTunnellingSender(unittest.TestCase):
+    """Test class for xknx/io/TunnellingSender objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    @staticmethod
+    def ack(xknx, sequence_counter, communication_channel_id=23, status_code=ErrorCode.E_NO_ERROR):
+        """Return TunnellingAck frame."""
+        knxipframe = KNXIPFrame(xknx)
+        knxipframe.init(KNXIPServiceType.TUNNELLING_ACK)
+        knxipframe.body.communication_channel_id = communication_channel_id
+        knxipframe.body.sequence_counter = sequence_counter
+        knxipframe.body.status_code = status_code
+        knxipframe.normalize()
+        return knxipframe
+
+    def create_sender(self, window_size):
+        """Return connected TunnellingSender and its udp_client."""
+        xknx = XKNX(loop=self.loop)
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        sender = TunnellingSender(xknx, udp_client, window_size=window_size)
+        sender.reset(23, PhysicalAddress('2.2.2'))
+        return xknx, udp_client, sender
+
+    def test_send_and_ack(self):
+        """Test sending requests and matching acks by sequence counter."""
+        xknx, udp_client, sender = self.create_sender(window_size=2)
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+
+        with patch('xknx.io.UDPClient.send') as mock_udp_send:
+            slot1 = self.loop.run_until_complete(sender.send(telegram))
+            slot2 = self.loop.run_until_complete(sender.send(telegram))
+            self.assertEqual(mock_udp_send.call_count, 2)
+            sent = [call[0][0].body for call in mock_udp_send.call_args_list]
+            self.assertEqual([body.sequence_counter for body in sent], [0, 1])
+            self.assertEqual(sent[0].communication_channel_id, 23)
+            self.assertEqual(sent[0].cemi.src_addr, PhysicalAddress('2.2.2'))
+            self.assertEqual(sender.outstanding, 2)
+
+            # acks may arrive out of order; foreign channel is ignored
+            udp_client.handle_knxipframe(self.ack(xknx, 0, communication_channel_id=24))
+            udp_client.handle_knxipframe(self.ack(xknx, 1))
+            udp_client.handle_knxipframe(self.ack(xknx, 0))
+            self.assertTrue(self.loop.run_until_complete(sender.wait_for_ack(slot1)))
+            self.assertTrue(self.loop.run_until_complete(sender.wait_for_ack(slot2)))
+            sender.release(slot1)
+            sender.release(slot2)
+            self.assertEqual(sender.outstanding, 0)
+            self.assertEqual(sender.sequence_number, 2)
+
+    def test_window_full(self):
+        """Test if send waits for a free slot within the window."""
+        _, _, sender = self.create_sender(window_size=1)
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+
+        with patch('xknx.io.UDPClient.send') as mock_udp_send:
+            slot1 = self.loop.run_until_complete(sender.send(telegram))
+            task = self.loop.create_task(sender.send(telegram))
+            self.loop.run_until_complete(asyncio.sleep(0))
+            self.assertFalse(task.done())
+            self.assertEqual(mock_udp_send.call_count, 1)
+
+            sender.release(slot1)
+            sender.release(slot1)
+            slot2 = self.loop.run_until_complete(task)
+            self.assertIs(slot2, slot1)
+            self.assertEqual(slot2.sequence_counter, 1)
+            self.assertEqual(mock_udp_send.call_count, 2)
+
+            # stale lease of the first use does not release the slot again
+            sender.release(slot2, lease=slot2.lease - 1)
+            self.assertEqual(sender.outstanding, 1)
+
+    def test_repeat_on_timeout(self):
+        """Test if request is repeated once with the same sequence counter."""
+        xknx, _, sender = self.create_sender(window_size=1)
+        sender.timeout_in_seconds = 0
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+
+        with patch('xknx.io.UDPClient.send') as mock_udp_send:
+            slot = self.loop.run_until_complete(sender.send(telegram))
+            self.assertFalse(self.loop.run_until_complete(sender.wait_for_ack(slot)))
+            self.assertEqual(mock_udp_send.call_count, 2)
+            sent = [call[0][0].body.sequence_counter for call in mock_udp_send.call_args_list]
+            self.assertEqual(sent, [0, 0])
+
+        with patch('xknx.io.UDPClient.send'):
+            sender.release(slot)
+            slot = self.loop.run_until_complete(sender.send(telegram))
+            sender.ack_received(self.ack(xknx, 1, status_code=ErrorCode.E_CONNECTION_ID), None)
+            self.assertFalse(slot.success)
+
+    def test_reset(self):
+        """Test if outstanding requests fail on reset."""
+        _, _, sender = self.create_sender(window_size=2)
+        telegram = Telegram(GroupAddress('1/2/3'), payload=DPTBinary(1))
+
+        with patch('xknx.io.UDPClient.send'):
+            slot = self.loop.run_until_complete(sender.send(telegram))
+            sender.reset(24, PhysicalAddress('2.2.3'))
+            self.assertFalse(self.loop.run_until_complete(sender.wait_for_ack(slot)))
+            self.assertEqual(sender.outstanding, 0)
+            self.assertEqual(sender.sequence_number, 0)
+            sender.release(slot)
+
+    def test_invalid_window_size(self):
+        """Test invalid window sizes."""
+        xknx = XKNX(loop=self.loop)
+        with self.assertRaises(ValueError):
+            TunnellingSender(xknx, window_size=0)
+        with self.assertRaises(ValueError):
+            TunnellingSender(xknx, window_size=256)
@@ -0,0 +1,142 @@
+"""Unit test for UDPClient."""
+import asyncio
+import socket
+import unittest
+from unittest.mock import Mock
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.io import UDPClient
+from xknx.knxip import KNXIPFrame, KNXIPServiceType
+from xknx.telegram import GroupAddress, PhysicalAddress, Telegram
+
+
+class TestUDPClient(unittest.TestCase):
+    """Test class for xknx/io/UDPClient objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def routing_indication(self, xknx, group_address):
+        """Return raw routing indication frame."""
+        knxipframe = KNXIPFrame(xknx)
+        knxipframe.init(KNXIPServiceType.ROUTING_INDICATION)
+        knxipframe.body.src_addr = PhysicalAddress('1.1.1')
+        knxipframe.body.telegram = Telegram(GroupAddress(group_address), payload=DPTBinary(1))
+        knxipframe.normalize()
+        return bytes(knxipframe.to_knx())
+
+    def test_handle_knxipframes(self):
+        """Test dispatching a batch of frames to callbacks by service type."""
+        xknx = XKNX(loop=self.loop)
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        routing_callback = Mock()
+        any_callback = Mock()
+        udp_client.register_callback(routing_callback, [KNXIPServiceType.ROUTING_INDICATION])
+        udp_client.register_callback(any_callback)
+
+        raws = [self.routing_indication(xknx, '1/2/3'), b'', b'\x06\x10',
+                self.routing_indication(xknx, '1/2/4')]
+        udp_client.datagrams_received_callback(raws)
+
+        self.assertEqual(routing_callback.call_count, 2)
+        self.assertEqual(any_callback.call_count, 2)
+        self.assertEqual(routing_callback.call_args_list[0][0][0].body.dst_addr, GroupAddress('1/2/3'))
+        self.assertEqual(routing_callback.call_args_list[1][0][0].body.dst_addr, GroupAddress('1/2/4'))
+
+    def test_batched_receive(self):
+        """Test if all datagrams waiting on the socket are drained within one wakeup."""
+        xknx = XKNX(loop=self.loop)
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sender.bind(('127.0.0.1', 0))
+        udp_client = UDPClient(xknx, ('127.0.0.1', 0), sender.getsockname(), max_batch_size=3)
+        batches = []
+        udp_client.datagrams_received_callback = batches.append
+        try:
+            self.loop.run_until_complete(udp_client.connect())
+            for i in range(4):
+                sender.sendto(self.routing_indication(xknx, i + 1), udp_client.getsockname())
+            self.loop.run_until_complete(asyncio.sleep(0.05))
+        finally:
+            self.loop.run_until_complete(udp_client.stop())
+            sender.close()
+
+        self.assertEqual([len(batch) for batch in batches], [3, 1])
+        self.assertEqual(batches[0][0], self.routing_indication(xknx, 1))
+        self.assertEqual(batches[1][0], self.routing_indication(xknx, 4))
+
+    def test_drain_error(self):
+        """Test if an error raised while draining ends the batch and is passed to error_received."""
+        xknx = XKNX(loop=self.loop)
+        sock = Mock()
+        sock.recv.side_effect = [b'second', OSError('recv failed'), b'third']
+        factory = UDPClient.UDPClientFactory(xknx, '127.0.0.1', sock=sock, max_batch_size=5)
+        factory.error_received = Mock()
+
+        self.assertEqual(factory.drain(b'first'), [b'first', b'second'])
+        factory.error_received.assert_called_once()
+        self.assertEqual(str(factory.error_received.call_args[0][0]), 'recv failed')
+
+    def test_drain_closing_transport(self):
+        """Test if a closing transport is not drained."""
+        xknx = XKNX(loop=self.loop)
+        sock = Mock()
+        factory = UDPClient.UDPClientFactory(xknx, '127.0.0.1', sock=sock, max_batch_size=5)
+        factory.connection_made(Mock(**{'is_closing.return_value': True}))
+
+        self.assertEqual(factory.drain(b'first'), [b'first'])
+        sock.recv.assert_not_called()
+
+    def test_register_unregister_callback(self):
+        """Test if callbacks are indexed by service type."""
+        xknx = XKNX(loop=self.loop)
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        callb_routing = udp_client.register_callback(Mock(), [KNXIPServiceType.ROUTING_INDICATION])
+        callb_search = udp_client.register_callback(
+            Mock(), [KNXIPServiceType.SEARCH_RESPONSE, KNXIPServiceType.ROUTING_INDICATION])
+        callb_any = udp_client.register_callback(Mock())
+
+        self.assertEqual(
+            udp_client.callbacks_for_service_type(KNXIPServiceType.ROUTING_INDICATION),
+            (callb_routing, callb_search, callb_any))
+        self.assertEqual(
+            udp_client.callbacks_for_service_type(KNXIPServiceType.SEARCH_RESPONSE),
+            (callb_search, callb_any))
+        self.assertEqual(
+            udp_client.callbacks_for_service_type(KNXIPServiceType.CONNECT_RESPONSE),
+            (callb_any,))
+        self.assertEqual(udp_client.callbacks, [callb_routing, callb_search, callb_any])
+
+        udp_client.unregister_callback(callb_search)
+        udp_client.unregister_callback(callb_any)
+        self.assertEqual(
+            udp_client.callbacks_for_service_type(KNXIPServiceType.ROUTING_INDICATION),
+            (callb_routing,))
+        self.assertEqual(
+            udp_client.callbacks_for_service_type(KNXIPServiceType.SEARCH_RESPONSE),
+            ())
+        self.assertEqual(udp_client.callbacks, [callb_routing])
+
+    def test_callbacks_registration_order(self):
+        """Test if callbacks are called in order of registration regardless of their service types."""
+        xknx = XKNX(loop=self.loop)
+        udp_client = UDPClient(xknx, ("192.168.1.1", 0), ("192.168.1.2", 1234))
+        calls = []
+        callb_any = udp_client.register_callback(lambda frame, client: calls.append('any'))
+        callb_routing = udp_client.register_callback(
+            lambda frame, client: calls.append('routing'), [KNXIPServiceType.ROUTING_INDICATION])
+        callb_any_2 = udp_client.register_callback(lambda frame, client: calls.append('any_2'))
+
+        self.assertEqual(
+            udp_client.callbacks_for_service_type(KNXIPServiceType.ROUTING_INDICATION),
+            (callb_any, callb_routing, callb_any_2))
+        self.assertEqual(udp_client.callbacks, [callb_any, callb_routing, callb_any_2])
+
+        udp_client.datagrams_received_callback([self.routing_indication(xknx, '1/2/3')])
+        self.assertEqual(calls, ['any', 'routing', 'any_2'])
@@ -4,11 +4,11 @@ from unittest.mock import MagicMock
 
 from pytest import fixture, raises
 
-from xknx.dpt import DPTBinary
+from xknx.dpt import DPTArray, DPTBinary
 from xknx.exceptions import CouldNotParseKNXIP, UnsupportedCEMIMessage
 from xknx.knxip.cemi_frame import CEMIFrame
 from xknx.knxip.knxip_enum import APCICommand, CEMIMessageCode
-from xknx.telegram import PhysicalAddress
+from xknx.telegram import GroupAddress, GroupAddressType, PhysicalAddress
 
 
 def get_data(code, adil, flags, src, dst, mpdu_len, tpci_apci, payload):
@@ -64,3 +64,51 @@ def test_invalid_invalid_len(frame):
     """Test for invalid cemi len"""
     with raises(UnsupportedCEMIMessage, match=r".*CEMI too small.*"):
         frame.from_knx_data_link_layer(get_data(0x29, 0, 0, 0, 0, 2, 0, [])[:5])
+
+
+def test_to_knx_into_offset(frame):
+    """Test serializing into a preallocated buffer at an offset"""
+    raw = get_data(0x29, 0, 0, 0x1101, 0x0901, 1, 0x0081, [])
+    frame.from_knx(raw)
+    buffer = bytearray(4 + len(raw))
+    assert frame.to_knx_into(buffer, 4) == len(raw)
+    assert buffer == bytes(4) + bytes(raw)
+    assert frame.to_knx() == bytes(raw)
+
+
+def test_standard_group_frame_fast_path(frame):
+    """Test parsing of standard group frames via the struct based fast path"""
+    frame.xknx.address_format = GroupAddressType.LONG
+    raw = bytes(get_data(0x29, 0, 0xBCE0, 0x1101, 0x0901, 3, 0x0080, [0x0C, 0x1A]))
+    assert frame.from_knx_standard_group_frame(raw) == 13
+    assert frame.code == CEMIMessageCode.L_DATA_IND
+    assert frame.cmd == APCICommand.GROUP_WRITE
+    assert frame.flags == 0xBCE0
+    assert frame.mpdu_len == 3
+    assert frame.payload == DPTArray((0x0C, 0x1A))
+    assert frame.src_addr == PhysicalAddress("1.1.1")
+    assert frame.dst_addr == GroupAddress("1/1/1")
+
+    generic = CEMIFrame(frame.xknx)
+    assert generic.from_knx_data_link_layer(raw) == 13
+    assert generic.to_knx() == frame.to_knx()
+    assert generic.telegram == frame.telegram
+    assert frame.telegram.source_address == PhysicalAddress("1.1.1")
+
+
+def test_standard_group_frame_fast_path_fallback(frame):
+    """Test if frames not covered by the fast path are left to the generic parser"""
+    # flags without group destination
+    raw = bytes(get_data(0x29, 0, 0xB060, 0x1101, 0x1102, 1, 0x0081, []))
+    assert frame.from_knx_standard_group_frame(raw) is None
+    # additional info
+    raw = bytes(get_data(0x29, 1, 0xBCE0, 0x1101, 0x0901, 1, 0x0081, []))
+    assert frame.from_knx_standard_group_frame(raw) is None
+    # unknown APCI
+    raw = bytes(get_data(0x29, 0, 0xBCE0, 0x1101, 0x0901, 1, 0xFFC0, []))
+    assert frame.from_knx_standard_group_frame(raw) is None
+    # wrong mpdu len
+    raw = bytes(get_data(0x29, 0, 0xBCE0, 0x1101, 0x0901, 2, 0x0081, []))
+    assert frame.from_knx_standard_group_frame(raw) is None
+    with raises(CouldNotParseKNXIP, match=r".*APDU LEN should be .*"):
+        frame.from_knx(raw)
@@ -52,7 +52,7 @@ class Test_KNXIP_ConnectRequest(unittest.TestCase):
             ip_addr='192.168.42.1', port=52393)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_from_knx_wrong_length_of_cri(self):
         """Test parsing and streaming wrong ConnectRequest."""
@@ -54,7 +54,7 @@ class Test_KNXIP_ConnectResponse(unittest.TestCase):
         knxipframe2.body.identifier = 4607
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_from_knx_wrong_crd(self):
         """Test parsing and streaming wrong ConnectRequest (wrong CRD length byte)."""
@@ -91,4 +91,4 @@ class Test_KNXIP_ConnectResponse(unittest.TestCase):
         knxipframe2.body.status_code = ErrorCode.E_NO_MORE_CONNECTIONS
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
@@ -45,7 +45,7 @@ class Test_KNXIP_ConnStateReq(unittest.TestCase):
             ip_addr='192.168.200.12', port=50100)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_from_knx_wrong_info(self):
         """Test parsing and streaming wrong ConnectionStateRequest."""
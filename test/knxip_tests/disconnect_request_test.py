@@ -44,7 +44,7 @@ class Test_KNXIP_DisconnectReq(unittest.TestCase):
             ip_addr='192.168.200.12', port=50100)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_from_knx_wrong_length(self):
         """Test parsing and streaming wrong DisconnectRequest."""
@@ -42,7 +42,7 @@ class Test_KNXIP_DisconnectResp(unittest.TestCase):
         knxipframe2.body.status_code = ErrorCode.E_NO_MORE_UNIQUE_CONNECTIONS
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_from_knx_wrong_length(self):
         """Test parsing and streaming wrong DisconnectResponse."""
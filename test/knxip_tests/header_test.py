@@ -32,7 +32,7 @@ class Test_KNXIP_Header(unittest.TestCase):
         self.assertEqual(header.service_type_ident, KNXIPServiceType.TUNNELLING_ACK)
         self.assertEqual(header.b4_reserve, 0)
         self.assertEqual(header.total_length, 10)
-        self.assertEqual(header.to_knx(), list(raw))
+        self.assertEqual(header.to_knx(), bytes(raw))
 
     def test_set_length(self):
         """Test setting length."""
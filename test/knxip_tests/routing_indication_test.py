@@ -50,9 +50,9 @@ class Test_KNXIP(unittest.TestCase):
 
         knxipframe.normalize()
 
-        self.assertEqual(knxipframe.header.to_knx(), list(raw[0:6]))
-        self.assertEqual(knxipframe.body.to_knx(), list(raw[6:]))
-        self.assertEqual(knxipframe.to_knx(), list(raw))
+        self.assertEqual(knxipframe.header.to_knx(), bytes(raw[0:6]))
+        self.assertEqual(knxipframe.body.to_knx(), bytes(raw[6:]))
+        self.assertEqual(knxipframe.to_knx(), bytes(raw))
 
     def test_telegram_set(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet with DPTArray/DPTTime as payload."""
@@ -76,9 +76,9 @@ class Test_KNXIP(unittest.TestCase):
                 0xbc, 0xd0, 0x12, 0x02, 0x01, 0x51, 0x04, 0x00,
                 0x80, 13, 23, 42))
 
-        self.assertEqual(knxipframe.header.to_knx(), list(raw[0:6]))
-        self.assertEqual(knxipframe.body.to_knx(), list(raw[6:]))
-        self.assertEqual(knxipframe.to_knx(), list(raw))
+        self.assertEqual(knxipframe.header.to_knx(), bytes(raw[0:6]))
+        self.assertEqual(knxipframe.body.to_knx(), bytes(raw[6:]))
+        self.assertEqual(knxipframe.to_knx(), bytes(raw))
 
     def test_telegram_get(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, group read."""
@@ -124,9 +124,9 @@ class Test_KNXIP(unittest.TestCase):
         knxipframe2.body.set_hops(5)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
-        self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.header.to_knx(), bytes(raw[0:6]))
+        self.assertEqual(knxipframe2.body.to_knx(), bytes(raw[6:]))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_EndTOEnd_group_write_binary_off(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, switch off light in my kitchen."""
@@ -148,9 +148,9 @@ class Test_KNXIP(unittest.TestCase):
         knxipframe2.body.set_hops(5)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
-        self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.header.to_knx(), bytes(raw[0:6]))
+        self.assertEqual(knxipframe2.body.to_knx(), bytes(raw[6:]))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_EndTOEnd_group_write_1byte(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, dimm light in my kitchen."""
@@ -172,9 +172,9 @@ class Test_KNXIP(unittest.TestCase):
         knxipframe2.body.set_hops(5)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
-        self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.header.to_knx(), bytes(raw[0:6]))
+        self.assertEqual(knxipframe2.body.to_knx(), bytes(raw[6:]))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_EndTOEnd_group_write_2bytes(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, setting value of thermostat."""
@@ -198,9 +198,9 @@ class Test_KNXIP(unittest.TestCase):
         knxipframe2.body.set_hops(5)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
-        self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.header.to_knx(), bytes(raw[0:6]))
+        self.assertEqual(knxipframe2.body.to_knx(), bytes(raw[6:]))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_EndTOEnd_group_read(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, group read."""
@@ -222,9 +222,9 @@ class Test_KNXIP(unittest.TestCase):
         knxipframe2.body.set_hops(5)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
-        self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.header.to_knx(), bytes(raw[0:6]))
+        self.assertEqual(knxipframe2.body.to_knx(), bytes(raw[6:]))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_EndTOEnd_group_response(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, group response."""
@@ -248,9 +248,9 @@ class Test_KNXIP(unittest.TestCase):
         knxipframe2.body.set_hops(5)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.header.to_knx(), list(raw[0:6]))
-        self.assertEqual(knxipframe2.body.to_knx(), list(raw[6:]))
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.header.to_knx(), bytes(raw[0:6]))
+        self.assertEqual(knxipframe2.body.to_knx(), bytes(raw[6:]))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_maximum_apci(self):
         """Test parsing and streaming CEMIFrame KNX/IP packet, testing maximum APCI."""
@@ -268,7 +268,7 @@ class Test_KNXIP(unittest.TestCase):
         raw = ((0x06, 0x10, 0x05, 0x30, 0x00, 0x11, 0x29, 0x00,
                 0xbc, 0xd0, 0x13, 0x01, 0x01, 0x51, 0x01, 0x00,
                 0xbf))
-        self.assertEqual(knxipframe.to_knx(), list(raw))
+        self.assertEqual(knxipframe.to_knx(), bytes(raw))
 
         knxipframe2 = KNXIPFrame(xknx)
         knxipframe2.init(KNXIPServiceType.ROUTING_INDICATION)
@@ -39,4 +39,4 @@ class Test_KNXIP_Discovery(unittest.TestCase):
             HPAI(ip_addr="224.0.23.12", port=3671)
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
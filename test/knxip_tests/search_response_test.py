@@ -37,7 +37,7 @@ class Test_KNXIP_Discovery(unittest.TestCase):
         xknx = XKNX(loop=self.loop)
         knxipframe = KNXIPFrame(xknx)
         self.assertEqual(knxipframe.from_knx(raw), 80)
-        self.assertEqual(knxipframe.to_knx(), list(raw))
+        self.assertEqual(knxipframe.to_knx(), bytes(raw))
 
         self.assertTrue(isinstance(knxipframe.body, SearchResponse))
         self.assertEqual(
@@ -63,7 +63,7 @@ class Test_KNXIP_Discovery(unittest.TestCase):
         knxipframe2.body.dibs.append(knxipframe.body.dibs[0])
         knxipframe2.body.dibs.append(knxipframe.body.dibs[1])
         knxipframe2.normalize()
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_unknown_device_name(self):
         """Test device_name if no DIBDeviceInformation is present."""
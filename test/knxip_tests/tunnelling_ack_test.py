@@ -42,7 +42,7 @@ class Test_KNXIP_TunnelingReq(unittest.TestCase):
         knxipframe2.body.sequence_counter = 23
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_from_knx_wrong_ack_information(self):
         """Test parsing and streaming wrong TunnellingAck (wrong length byte)."""
@@ -48,7 +48,7 @@ class Test_KNXIP_TunnelingReq(unittest.TestCase):
         knxipframe2.body.sequence_counter = 23
         knxipframe2.normalize()
 
-        self.assertEqual(knxipframe2.to_knx(), list(raw))
+        self.assertEqual(knxipframe2.to_knx(), bytes(raw))
 
     def test_from_knx_wrong_header(self):
         """Test parsing and streaming wrong TunnellingRequest (wrong header length byte)."""
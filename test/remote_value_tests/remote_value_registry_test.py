@@ -0,0 +1,101 @@
+"""Unit test for RemoteValueRegistry objects."""
+import asyncio
+import unittest
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.remote_value import RemoteValueRegistry, RemoteValueSwitch
+from xknx.telegram import GroupAddress, Telegram
+
+
+class TestRemoteValueRegistry(unittest.TestCase):
+    """Test class for RemoteValueRegistry objects."""
+
+    def setUp(self):
+        """Set up test class."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Tear down test class."""
+        self.loop.close()
+
+    def test_remote_values_by_group_address(self):
+        """Test lookup of remote values by group address."""
+        xknx = XKNX(loop=self.loop)
+        remote_value1 = RemoteValueSwitch(xknx, group_address='1/2/3')
+        remote_value2 = RemoteValueSwitch(xknx, group_address='1/2/4', group_address_state='1/2/5')
+        remote_value3 = RemoteValueSwitch(xknx, group_address='1/2/3')
+        registry = RemoteValueRegistry(xknx, [remote_value1, remote_value2, remote_value3])
+
+        self.assertEqual(
+            registry.remote_values_by_group_address(GroupAddress('1/2/3')),
+            [remote_value1, remote_value3])
+        self.assertEqual(
+            registry.remote_values_by_group_address(GroupAddress('1/2/5')),
+            [remote_value2])
+        self.assertEqual(
+            registry.remote_values_by_group_address(GroupAddress('1/2/6')),
+            [])
+        self.assertTrue(registry.has_group_address(GroupAddress('1/2/4')))
+        self.assertFalse(registry.has_group_address(GroupAddress('1/2/6')))
+
+    def test_reassign_group_address(self):
+        """Test if registry follows reassigned group addresses."""
+        xknx = XKNX(loop=self.loop)
+        remote_value = RemoteValueSwitch(xknx, group_address='1/2/3')
+        registry = RemoteValueRegistry(xknx, [remote_value])
+        self.assertTrue(registry.has_group_address(GroupAddress('1/2/3')))
+
+        remote_value.group_addresses = '1/2/4'
+        self.assertFalse(registry.has_group_address(GroupAddress('1/2/3')))
+        self.assertTrue(registry.has_group_address(GroupAddress('1/2/4')))
+
+    def test_assign_group_address(self):
+        """Test if only the registries of a remote value follow directly assigned group addresses."""
+        xknx = XKNX(loop=self.loop)
+        remote_value1 = RemoteValueSwitch(xknx, group_address='1/2/3')
+        remote_value2 = RemoteValueSwitch(xknx, group_address='1/2/5')
+        registry1 = RemoteValueRegistry(xknx, [remote_value1])
+        registry2 = RemoteValueRegistry(xknx, [remote_value2])
+        self.assertTrue(registry1.has_group_address(GroupAddress('1/2/3')))
+        self.assertTrue(registry2.has_group_address(GroupAddress('1/2/5')))
+        index2 = registry2._remote_values_by_group_address
+
+        generation = xknx.devices.group_address_generation
+        remote_value1.group_address = [GroupAddress('1/2/4')]
+        self.assertFalse(registry1.has_group_address(GroupAddress('1/2/3')))
+        self.assertTrue(registry1.has_group_address(GroupAddress('1/2/4')))
+        remote_value1.group_address_state = GroupAddress('1/2/6')
+        self.assertTrue(registry1.has_group_address(GroupAddress('1/2/6')))
+        self.assertEqual(xknx.devices.group_address_generation, generation + 2)
+        # index of the other registry is kept
+        self.assertIs(registry2._remote_values_by_group_address, index2)
+
+    def test_register_unregister(self):
+        """Test register and unregister of remote values."""
+        xknx = XKNX(loop=self.loop)
+        remote_value = RemoteValueSwitch(xknx, group_address='1/2/3')
+        registry = RemoteValueRegistry(xknx)
+        self.assertFalse(registry.has_group_address(GroupAddress('1/2/3')))
+        registry.register(remote_value)
+        self.assertEqual(len(registry), 1)
+        self.assertTrue(registry.has_group_address(GroupAddress('1/2/3')))
+        registry.unregister(remote_value)
+        self.assertEqual(len(registry), 0)
+        self.assertFalse(registry.has_group_address(GroupAddress('1/2/3')))
+
+    def test_process(self):
+        """Test if telegram is only passed to owning remote values."""
+        xknx = XKNX(loop=self.loop)
+        remote_value1 = RemoteValueSwitch(xknx, group_address='1/2/3')
+        remote_value2 = RemoteValueSwitch(xknx, group_address='1/2/4')
+        registry = RemoteValueRegistry(xknx, [remote_value1, remote_value2])
+
+        telegram = Telegram(GroupAddress('1/2/4'), payload=DPTBinary(1))
+        self.assertTrue(self.loop.run_until_complete(registry.process(telegram)))
+        self.assertIsNone(remote_value1.value)
+        self.assertTrue(remote_value2.value)
+
+        telegram = Telegram(GroupAddress('1/2/5'), payload=DPTBinary(1))
+        self.assertFalse(self.loop.run_until_complete(registry.process(telegram)))
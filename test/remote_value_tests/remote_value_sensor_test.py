@@ -3,8 +3,10 @@ import asyncio
 import unittest
 
 from xknx import XKNX
+from xknx.dpt import DPTArray
 from xknx.exceptions import ConversionError
 from xknx.remote_value import RemoteValueSensor
+from xknx.telegram import GroupAddress, Telegram
 
 
 class TestRemoteValueSensor(unittest.TestCase):
@@ -31,3 +33,35 @@ class TestRemoteValueSensor(unittest.TestCase):
             self.assertTrue(
                 isinstance(RemoteValueSensor.DPTMAP[value_type].payload_length,
                            int))
+
+    def test_change_only_deadband(self):
+        """Test if after_update_cb is only called for values changed by more than deadband."""
+        xknx = XKNX(loop=self.loop, change_only_callbacks=True)
+        values = []
+
+        async def after_update_cb(value, group_address):
+            """Record reported values."""
+            values.append(value)
+
+        remote_value = RemoteValueSensor(
+            xknx, group_address='1/2/3', value_type='temperature',
+            after_update_cb=after_update_cb, deadband=0.5)
+        for payload in ((0x0C, 0x1A), (0x0C, 0x1A), (0x0C, 0x22), (0x0C, 0x2A), (0x0C, 0x1A)):
+            # 21.0, 21.0, 21.16, 21.32 (drifted 0.32 from last report), 21.0
+            self.loop.run_until_complete(remote_value.process(
+                Telegram(GroupAddress('1/2/3'), payload=DPTArray(payload))))
+        self.assertEqual(values, [21.0])
+
+        self.loop.run_until_complete(remote_value.process(
+            Telegram(GroupAddress('1/2/3'), payload=DPTArray((0x0C, 0x4C)))))
+        self.assertEqual(values, [21.0, 22.0])
+
+    def test_deadband_non_numeric(self):
+        """Test if the deadband is ignored for values which are no numbers."""
+        xknx = XKNX(loop=self.loop)
+        remote_value = RemoteValueSensor(xknx, group_address='1/2/3', value_type='string', deadband=0.5)
+        self.assertTrue(remote_value.value_changed('KNX', 'xknx'))
+        self.assertFalse(remote_value.value_changed('KNX', 'KNX'))
+        self.assertTrue(remote_value.value_changed(None, 21.0))
+        self.assertFalse(remote_value.value_changed(None, None))
+        self.assertFalse(remote_value.value_changed(21.0, 21.4))
@@ -105,3 +105,46 @@ class TestRemoteValue(unittest.TestCase):
         self.assertNotEqual(remote_value4, remote_value1)
         self.assertEqual(remote_value1, remote_value5)
         self.assertEqual(remote_value5, remote_value1)
+
+    def test_value_cached(self):
+        """Test if value is decoded once per payload."""
+        xknx = XKNX(loop=self.loop)
+        remote_value = RemoteValue(xknx, group_address='1/1/1')
+        self.assertIsNone(remote_value.value)
+        with patch('xknx.remote_value.RemoteValue.from_knx') as mock_from_knx, \
+                patch('xknx.remote_value.RemoteValue.payload_valid') as mock_payload_valid:
+            mock_from_knx.return_value = 23
+            mock_payload_valid.return_value = True
+            telegram = Telegram(group_address=GroupAddress('1/1/1'), payload=DPTArray((0x01, 0x02)))
+            self.loop.run_until_complete(remote_value.process(telegram))
+            self.assertEqual(remote_value.value, 23)
+            self.assertEqual(remote_value.value, 23)
+            mock_from_knx.assert_called_once_with(DPTArray((0x01, 0x02)))
+
+            mock_from_knx.return_value = 42
+            remote_value.payload = DPTArray((0x03, 0x04))
+            self.assertEqual(remote_value.value, 42)
+            self.assertEqual(mock_from_knx.call_count, 2)
+
+            # decoded and not yet decoded remote values are still equal
+            remote_value2 = RemoteValue(xknx, group_address='1/1/1')
+            remote_value2.payload = DPTArray((0x03, 0x04))
+            self.assertEqual(remote_value, remote_value2)
+
+    def test_change_only_callbacks(self):
+        """Test if after_update_cb is only called for changed values with change_only_callbacks."""
+        xknx = XKNX(loop=self.loop, change_only_callbacks=True)
+        values = []
+
+        async def after_update_cb(value, group_address):
+            """Record reported values."""
+            values.append(value)
+
+        remote_value = RemoteValue(xknx, group_address='1/1/1', after_update_cb=after_update_cb)
+        with patch('xknx.remote_value.RemoteValue.payload_valid') as mock_payload_valid, \
+                patch('xknx.remote_value.RemoteValue.from_knx', side_effect=lambda payload: payload.value):
+            mock_payload_valid.return_value = True
+            for value in (1, 1, 0, 0, 1):
+                self.loop.run_until_complete(remote_value.process(
+                    Telegram(group_address=GroupAddress('1/1/1'), payload=DPTBinary(value))))
+        self.assertEqual(values, [1, 0, 1])
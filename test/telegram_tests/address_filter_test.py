@@ -2,7 +2,8 @@
 import unittest
 
 from xknx.exceptions import ConversionError
-from xknx.telegram import AddressFilter, GroupAddress
+from xknx.telegram import (
+    AddressFilter, CompiledAddressFilter, GroupAddress, GroupAddressType)
 
 
 class TestAddressFilter(unittest.TestCase):
@@ -149,3 +150,36 @@ class TestAddressFilter(unittest.TestCase):
         # pylint: disable=protected-access
         self.assertEqual(AddressFilter.Range._adjust_range(GroupAddress.MAX_FREE+1), GroupAddress.MAX_FREE)
         self.assertEqual(AddressFilter.Range._adjust_range(-1), 0)
+
+    def test_compiled_filter(self):
+        """Test matching with compiled filters."""
+        compiled = AddressFilter("1/2/3-5").compile()
+        self.assertTrue(compiled.match("1/2/4"))
+        self.assertTrue(GroupAddress("1/2/5") in compiled)
+        self.assertFalse(compiled.match("1/2/6"))
+        self.assertFalse(compiled.match("1/3/4"))
+        # level3 pattern does not match addresses without middle group
+        self.assertFalse(compiled.match(GroupAddress("1/516")))
+        self.assertFalse(compiled.match(None))
+
+        compiled_free = AddressFilter("300-400").compile()
+        self.assertTrue(compiled_free.match(GroupAddress(350, levels=GroupAddressType.FREE)))
+        self.assertFalse(compiled_free.match(GroupAddress(299, levels=GroupAddressType.FREE)))
+
+    def test_compiled_filter_union_intersection(self):
+        """Test union and intersection of compiled filters."""
+        af1 = AddressFilter("1/*/*").compile()
+        af2 = AddressFilter("*/2/1-10").compile()
+
+        union = af1 | af2
+        self.assertTrue(union.match("1/5/100"))
+        self.assertTrue(union.match("3/2/5"))
+        self.assertFalse(union.match("3/2/11"))
+        self.assertEqual(union, CompiledAddressFilter.from_filters([AddressFilter("1/*/*"), AddressFilter("*/2/1-10")]))
+
+        intersection = af1 & af2
+        self.assertTrue(intersection.match("1/2/5"))
+        self.assertFalse(intersection.match("1/5/100"))
+        self.assertFalse(intersection.match("3/2/5"))
+
+        self.assertFalse(CompiledAddressFilter.from_filters([]).match("1/2/3"))
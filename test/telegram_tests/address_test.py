@@ -1,4 +1,5 @@
 """Unit test for Address class."""
+import copy
 from unittest import TestCase
 
 from xknx.exceptions import CouldNotParseAddress
@@ -81,8 +82,8 @@ class TestPhysicalAddress(TestCase):
         self.assertEqual(PhysicalAddress('1.0.0'), PhysicalAddress(4096))
         self.assertNotEqual(PhysicalAddress('1.0.0'), PhysicalAddress('1.1.1'))
         self.assertNotEqual(PhysicalAddress('1.0.0'), None)
-        with self.assertRaises(TypeError):
-            PhysicalAddress('1.0.0') == 'example'  # pylint: disable=expression-not-assigned
+        self.assertNotEqual(PhysicalAddress('1.0.0'), 'example')
+        self.assertNotEqual(PhysicalAddress('1.0.0'), GroupAddress(4096))
 
     def test_representation(self):
         """Test string representation of address."""
@@ -90,6 +91,20 @@ class TestPhysicalAddress(TestCase):
             repr(PhysicalAddress("2.3.4")),
             'PhysicalAddress("2.3.4")')
 
+    def test_hash_and_interning(self):
+        """Test if addresses are hashable and interned."""
+        self.assertIs(PhysicalAddress('1.0.0'), PhysicalAddress(4096))
+        self.assertIs(PhysicalAddress('1.0.0'), PhysicalAddress((0x10, 0x00)))
+        self.assertEqual(hash(PhysicalAddress('1.0.0')), hash(PhysicalAddress(4096)))
+        self.assertEqual(len({PhysicalAddress('1.0.0'), PhysicalAddress(4096), PhysicalAddress('1.1.1')}), 2)
+        self.assertIs(copy.deepcopy(PhysicalAddress('1.0.0')), PhysicalAddress('1.0.0'))
+
+    def test_immutable(self):
+        """Test if addresses can not be modified."""
+        address = PhysicalAddress('1.0.0')
+        with self.assertRaises(AttributeError):
+            address.raw = 1
+
 
 class TestGroupAddress(TestCase):
     """Test class for GroupAddress."""
@@ -215,8 +230,8 @@ class TestGroupAddress(TestCase):
         self.assertEqual(GroupAddress('1/0'), GroupAddress(2048))
         self.assertNotEqual(GroupAddress('1/1'), GroupAddress('1/1/0'))
         self.assertNotEqual(GroupAddress('1/0'), None)
-        with self.assertRaises(TypeError):
-            GroupAddress('1/0') == 'example'  # pylint: disable=expression-not-assigned
+        self.assertNotEqual(GroupAddress('1/0'), 'example')
+        self.assertNotEqual(GroupAddress('1/0'), PhysicalAddress(2048))
 
     def test_representation(self):
         """Test string representation of address."""
@@ -232,3 +247,21 @@ class TestGroupAddress(TestCase):
             repr(GroupAddress('0', GroupAddressType.LONG)),
             'GroupAddress("0/0/0")'
         )
+
+    def test_hash_and_interning(self):
+        """Test if addresses are hashable and interned by raw value and levels."""
+        self.assertIs(GroupAddress('1/0/0'), GroupAddress(2048))
+        self.assertIs(GroupAddress('1/0/0'), GroupAddress((0x08, 0x00)))
+        self.assertIsNot(GroupAddress(2048), GroupAddress(2048, GroupAddressType.FREE))
+        self.assertEqual(GroupAddress(2048), GroupAddress(2048, GroupAddressType.FREE))
+        self.assertEqual(hash(GroupAddress(2048)), hash(GroupAddress(2048, GroupAddressType.FREE)))
+        self.assertEqual({GroupAddress('1/0/0'): 1}[GroupAddress(2048, GroupAddressType.SHORT)], 1)
+        self.assertIs(copy.deepcopy(GroupAddress('1/0')), GroupAddress('1/0'))
+
+    def test_immutable(self):
+        """Test if addresses can not be modified."""
+        address = GroupAddress('1/0/0')
+        with self.assertRaises(AttributeError):
+            address.raw = 1
+        with self.assertRaises(AttributeError):
+            address.levels = GroupAddressType.FREE
@@ -1,5 +1,6 @@
 """Unit test for Telegram objects."""
 import unittest
+from unittest.mock import patch
 
 from xknx.telegram import (
     GroupAddress, Telegram, TelegramDirection, TelegramType)
@@ -29,3 +30,13 @@ class TestTelegram(unittest.TestCase):
             Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ),
             Telegram(GroupAddress('1/2/3'), TelegramType.GROUP_READ,
                      TelegramDirection.INCOMING))
+
+    def test_deadline(self):
+        """Test if telegrams expire after their deadline."""
+        with patch('time.monotonic', return_value=100.0):
+            telegram = Telegram(GroupAddress('1/2/3'), ttl=5)
+        self.assertEqual(telegram.deadline, 105.0)
+        self.assertFalse(telegram.expired(now=105.0))
+        self.assertTrue(telegram.expired(now=105.1))
+        self.assertFalse(Telegram(GroupAddress('1/2/3')).expired())
+        self.assertTrue(Telegram(GroupAddress('1/2/3'), deadline=0).expired())
@@ -1,6 +1,13 @@
 """Module for the automations and business logic of XKNX."""
 # flake8: noqa
+from .address_prefilter import AddressPrefilter
 from .config import Config
+from .handler_latency import HandlerLatency
+from .incoming_dispatcher import IncomingDispatcher
+from .read_multiplexer import ReadMultiplexer
+from .state_store import StateStore
+from .state_table import StateTable
 from .stateupdater import StateUpdater
+from .telegram_buffer import OverflowPolicy, PriorityTelegramBuffer, TelegramBuffer
 from .telegram_queue import TelegramQueue
 from .value_reader import ValueReader
@@ -0,0 +1,74 @@
+"""
+Module for deciding on the relevance of incoming frames before they are parsed.
+
+The AddressPrefilter holds the set of raw group addresses anyone is interested in -
+derived automatically from the group addresses of all devices, the AddressFilters of
+all telegram received callbacks and the pending reads of the ReadMultiplexer. It is
+rebuilt lazily whenever devices or callbacks change.
+
+As soon as a telegram received callback without AddressFilters is registered (e.g. a
+`telegram_received_cb` passed to XKNX) every address is of interest and the prefilter
+passes all frames. Callbacks registered with `device_addresses_only` (like the one of
+the StateUpdater) are only interested in group addresses of devices and are ignored.
+
+Routing checks the destination address and APCI of incoming routing indications
+directly within the raw bytes and drops frames nobody is interested in - before any
+KNXIPFrame, CEMIFrame or Telegram object is constructed.
+"""
+from xknx.telegram import GroupAddress
+
+_NUMBER_OF_ADDRESSES = 0x10000
+
+
+class AddressPrefilter:
+    """Class for testing if raw group addresses of incoming frames are of interest."""
+
+    def __init__(self, xknx):
+        """Initialize AddressPrefilter class."""
+        self.xknx = xknx
+        # one byte per raw group address - None if all addresses are of interest
+        self._allowed = None
+        self._built_for = None
+
+    def _state(self):
+        """Return state of devices and callbacks the allowed addresses are derived from."""
+        return (len(self.xknx.devices),
+                self.xknx.devices.group_address_generation,
+                self.xknx.telegram_queue.callbacks_generation,
+                self.xknx.address_format)
+
+    def allowed_addresses(self):
+        """Return bytes object with one entry per raw group address of interest or None if all are."""
+        state = self._state()
+        if state != self._built_for:
+            self._allowed = self._build()
+            self._built_for = state
+        return self._allowed
+
+    def _build(self):
+        """Collect raw group addresses of interest."""
+        allowed = bytearray(_NUMBER_OF_ADDRESSES)
+        for telegram_received_cb in self.xknx.telegram_queue.telegram_received_cbs:
+            if telegram_received_cb.device_addresses_only:
+                # covered by the group addresses of devices below
+                continue
+            compiled_filter = telegram_received_cb.compiled_filter
+            if compiled_filter is None:
+                return None
+            bitmap = compiled_filter.bitmaps[self.xknx.address_format]
+            allowed = bytearray(
+                (int.from_bytes(allowed, 'big') | int.from_bytes(bitmap, 'big')).to_bytes(
+                    _NUMBER_OF_ADDRESSES, 'big'))
+        for device in self.xknx.devices:
+            for group_address in device.all_group_addresses():
+                allowed[group_address.raw] = 1
+        return bytes(allowed)
+
+    def allows(self, raw_address):
+        """Test if frames addressed to raw group address are of interest."""
+        allowed = self.allowed_addresses()
+        if allowed is None or allowed[raw_address]:
+            return True
+        # responses to reads of addresses no device is listening to
+        return self.xknx.telegram_queue.read_multiplexer.is_pending(
+            GroupAddress(raw_address, levels=self.xknx.address_format))
@@ -14,6 +14,8 @@ from xknx.exceptions import XKNXException
 from xknx.io import ConnectionConfig, ConnectionType
 from xknx.telegram import PhysicalAddress
 
+from .telegram_buffer import OverflowPolicy
+
 
 class Config:
     """Class for parsing xknx.yaml."""
@@ -43,6 +45,40 @@ class Config:
             if "rate_limit" in doc["general"]:
                 self.xknx.rate_limit = \
                     doc["general"]["rate_limit"]
+            if "rate_limit_burst" in doc["general"]:
+                self.xknx.rate_limit_burst = \
+                    doc["general"]["rate_limit_burst"]
+            if "state_file" in doc["general"]:
+                self.xknx.state_file = \
+                    doc["general"]["state_file"]
+            if "change_only_callbacks" in doc["general"]:
+                self.xknx.change_only_callbacks = \
+                    doc["general"]["change_only_callbacks"]
+            if "callback_coalesce_window" in doc["general"]:
+                self.xknx.callback_coalesce_window = \
+                    doc["general"]["callback_coalesce_window"]
+            if "incoming_dispatch_workers" in doc["general"]:
+                self.xknx.incoming_dispatch_workers = \
+                    doc["general"]["incoming_dispatch_workers"]
+            if "record_handler_latencies" in doc["general"]:
+                self.xknx.record_handler_latencies = \
+                    doc["general"]["record_handler_latencies"]
+            if "state_updater_intervals" in doc["general"]:
+                self.xknx.state_updater_intervals = \
+                    doc["general"]["state_updater_intervals"]
+            if "coalesce_outgoing_writes" in doc["general"]:
+                self.xknx.coalesce_outgoing_writes = \
+                    doc["general"]["coalesce_outgoing_writes"]
+            if "outgoing_ttl" in doc["general"]:
+                self.xknx.outgoing_ttl = \
+                    doc["general"]["outgoing_ttl"]
+            for direction in ("incoming", "outgoing"):
+                if f"{direction}_queue_size" in doc["general"]:
+                    setattr(self.xknx, f"{direction}_queue_size",
+                            doc["general"][f"{direction}_queue_size"])
+                if f"{direction}_overflow_policy" in doc["general"]:
+                    setattr(self.xknx, f"{direction}_overflow_policy",
+                            OverflowPolicy(doc["general"][f"{direction}_overflow_policy"]))
 
     def parse_connection(self, doc):
         """Parse the connection section of xknx.yaml."""
@@ -50,21 +86,33 @@ class Config:
                 and hasattr(doc["connection"], '__iter__'):
             for conn, prefs in doc["connection"].items():
                 try:
-                    if conn == "tunneling":
-                        if prefs is None or \
-                                "gateway_ip" not in prefs:
-                            raise XKNXException("`gateway_ip` is required for tunneling connection.")
-                        conn_type = ConnectionType.TUNNELING
-                    elif conn == "routing":
-                        conn_type = ConnectionType.ROUTING
-                    else:
-                        conn_type = ConnectionType.AUTOMATIC
-                    self._parse_connection_prefs(conn_type, prefs)
+                    self.xknx.connection_config = self._parse_connection_config(conn, prefs)
                 except XKNXException as ex:
                     self.xknx.logger.error("Error while reading config file: Could not parse %s: %s", conn, ex)
                     raise ex
 
-    def _parse_connection_prefs(self, conn_type: ConnectionType, prefs) -> None:
+    def _parse_connection_config(self, conn, prefs) -> ConnectionConfig:
+        if conn in ("tunneling", "tunneling_pool"):
+            if prefs is None or \
+                    "gateway_ip" not in prefs:
+                raise XKNXException("`gateway_ip` is required for tunneling connection.")
+            conn_type = ConnectionType.TUNNELING if conn == "tunneling" else ConnectionType.TUNNELING_POOL
+        elif conn == "routing":
+            conn_type = ConnectionType.ROUTING
+        elif conn == "multi_gateway":
+            # list of connections with a single entry each
+            if not isinstance(prefs, list):
+                raise XKNXException("`multi_gateway` requires a list of connections.")
+            return ConnectionConfig(
+                connection_type=ConnectionType.MULTI_GATEWAY,
+                gateways=[self._parse_connection_config(gateway_conn, gateway_prefs)
+                          for gateway in prefs
+                          for gateway_conn, gateway_prefs in gateway.items()])
+        else:
+            conn_type = ConnectionType.AUTOMATIC
+        return self._parse_connection_prefs(conn_type, prefs)
+
+    def _parse_connection_prefs(self, conn_type: ConnectionType, prefs) -> ConnectionConfig:
         connection_config = ConnectionConfig(connection_type=conn_type)
         if hasattr(prefs, '__iter__'):
             for pref, value in prefs.items():
@@ -74,7 +122,19 @@ class Config:
                     connection_config.gateway_port = value
                 elif pref == "local_ip":
                     connection_config.local_ip = value
-        self.xknx.connection_config = connection_config
+                elif pref == "auto_reconnect":
+                    connection_config.auto_reconnect = value
+                elif pref == "auto_reconnect_wait":
+                    connection_config.auto_reconnect_wait = value
+                elif pref == "auto_reconnect_max_wait":
+                    connection_config.auto_reconnect_max_wait = value
+                elif pref == "window_size":
+                    connection_config.window_size = value
+                elif pref == "channels":
+                    connection_config.tunnel_channels = value
+                elif pref == "address_filters":
+                    connection_config.address_filters = value
+        return connection_config
 
     def parse_groups(self, doc):
         """Parse the group section of xknx.yaml."""
@@ -0,0 +1,41 @@
+"""
+Module for measuring how long handlers of incoming telegrams take.
+
+The TelegramQueue measures every call of a telegram received callback and every Device
+processing an incoming telegram (including its device updated callbacks). Statistics
+are kept per handler name within `TelegramQueue.handler_latencies` and may be used to
+identify slow consumers:
+
+    for latency in xknx.telegram_queue.slowest_handlers(5):
+        print(latency)
+"""
+
+
+class HandlerLatency:
+    """Class for collecting the durations of a handler of incoming telegrams."""
+
+    def __init__(self, name):
+        """Initialize HandlerLatency class."""
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.last = 0.0
+
+    def record(self, duration):
+        """Add duration (in seconds) of a call of the handler."""
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        if duration > self.maximum:
+            self.maximum = duration
+
+    @property
+    def average(self):
+        """Return average duration in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def __str__(self):
+        """Return object as readable string."""
+        return '<HandlerLatency name="{0}" count="{1}" average="{2:.3f}ms" maximum="{3:.3f}ms" />'.format(
+            self.name, self.count, self.average * 1000, self.maximum * 1000)
@@ -0,0 +1,115 @@
+"""
+Module for processing incoming telegrams concurrently.
+
+With `XKNX.incoming_dispatch_workers` set, the TelegramQueue passes incoming telegrams
+to the IncomingDispatcher instead of processing them one after another. Telegrams are
+sorted into lanes; a bounded pool of workers processes different lanes concurrently
+while the telegrams within a lane are processed in the order they were received.
+
+A lane covers all devices connected through shared group addresses: all group addresses
+of a device - and all devices listening to a group address - belong to the same lane.
+A slow device updated callback hence only delays telegrams of its own lane.
+
+Telegram received callbacks are called within the lane of the telegram and may thus be
+called concurrently for telegrams of different lanes.
+"""
+import asyncio
+import collections
+
+from xknx.exceptions import XKNXException
+from xknx.telegram import GroupAddress
+
+# stops a worker
+_STOP = object()
+
+
+class IncomingDispatcher:
+    """Class for processing incoming telegrams of different lanes concurrently."""
+
+    def __init__(self, xknx, workers):
+        """Initialize IncomingDispatcher class."""
+        self.xknx = xknx
+        self.workers = workers
+        # lane key -> telegrams; a lane is present while it is queued or being processed
+        self._lanes = {}
+        # keys of lanes waiting for a worker
+        self._ready = asyncio.Queue()
+        # raw group address -> lane key, built from the group addresses of all devices
+        self._lane_keys = {}
+        self._lane_keys_for = None
+
+    def lane_key(self, group_address):
+        """Return key of the lane telegrams to group address are processed in."""
+        if not isinstance(group_address, GroupAddress):
+            return None
+        state = (len(self.xknx.devices), self.xknx.devices.group_address_generation)
+        if state != self._lane_keys_for:
+            self._lane_keys = self._build_lane_keys()
+            self._lane_keys_for = state
+        # addresses of no device have a lane of their own
+        return self._lane_keys.get(group_address.raw, group_address.raw)
+
+    def _build_lane_keys(self):
+        """Map raw group addresses to the lowest raw group address of all devices connected through shared addresses."""
+        parents = {}
+
+        def find(raw):
+            """Return root of raw group address."""
+            root = raw
+            while parents[root] != root:
+                root = parents[root]
+            while parents[raw] != root:
+                parents[raw], raw = root, parents[raw]
+            return root
+
+        for device in self.xknx.devices:
+            raws = [group_address.raw for group_address in device.all_group_addresses()]
+            for raw in raws:
+                parents.setdefault(raw, raw)
+            for raw in raws[1:]:
+                root, other_root = find(raws[0]), find(raw)
+                if root != other_root:
+                    parents[max(root, other_root)] = min(root, other_root)
+        return {raw: find(raw) for raw in parents}
+
+    def dispatch(self, telegram):
+        """Queue incoming telegram within its lane. xknx.telegrams.task_done() is called once it was processed."""
+        key = self.lane_key(telegram.group_address)
+        lane = self._lanes.get(key)
+        if lane is None:
+            self._lanes[key] = collections.deque((telegram,))
+            self._ready.put_nowait(key)
+        else:
+            lane.append(telegram)
+
+    async def run(self):
+        """Run workers until stopped."""
+        await asyncio.gather(*(self._worker() for _ in range(self.workers)))
+
+    async def stop(self):
+        """Wait until all dispatched telegrams were processed and stop workers."""
+        await self._ready.join()
+        for _ in range(self.workers):
+            self._ready.put_nowait(_STOP)
+
+    async def _worker(self):
+        """Endless loop for processing the next telegram of lanes."""
+        while True:
+            key = await self._ready.get()
+            if key is _STOP:
+                self._ready.task_done()
+                break
+            lane = self._lanes[key]
+            try:
+                await self.xknx.telegram_queue.process_telegram_incoming(lane[0])
+            except XKNXException as ex:
+                self.xknx.logger.error("Error while processing telegram %s", ex)
+            finally:
+                lane.popleft()
+                self.xknx.telegrams.task_done()
+                # requeue lane behind the lanes already waiting
+                if lane:
+                    self._ready.put_nowait(key)
+                else:
+                    del self._lanes[key]
+                self._ready.task_done()
@@ -0,0 +1,49 @@
+"""
+Module for limiting the rate of outgoing telegrams.
+
+The RateLimiter is a token bucket: it holds up to `xknx.rate_limit_burst` tokens and
+is refilled with `xknx.rate_limit` tokens per second. Every outgoing telegram consumes
+one token. After the bus was idle a burst of telegrams is sent without delay; sustained
+traffic is limited to `rate_limit` telegrams per second.
+"""
+import asyncio
+
+
+class RateLimiter:
+    """Class for limiting the rate of outgoing telegrams (token bucket)."""
+
+    def __init__(self, xknx):
+        """Initialize RateLimiter class."""
+        self.xknx = xknx
+        self._tokens = None
+        self._last_refill = None
+
+    def _refill(self):
+        """Add tokens for the time passed since last refill."""
+        now = self.xknx.loop.time()
+        burst = max(1, self.xknx.rate_limit_burst)
+        if self._tokens is None:
+            self._tokens = burst
+        else:
+            self._tokens = min(burst, self._tokens + (now - self._last_refill) * self.xknx.rate_limit)
+        self._last_refill = now
+
+    def delay(self):
+        """Return seconds to wait until the next token is available."""
+        if not self.xknx.rate_limit:
+            return 0
+        self._refill()
+        if self._tokens >= 1:
+            return 0
+        return (1 - self._tokens) / self.xknx.rate_limit
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        if not self.xknx.rate_limit:
+            return
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
+            self._refill()
+        # may become negative if woken up early - the next telegram waits longer then
+        self._tokens -= 1
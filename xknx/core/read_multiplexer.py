@@ -0,0 +1,71 @@
+"""
+Module for multiplexing reads of KNX group addresses.
+
+One ReadMultiplexer lives within the TelegramQueue. It keeps a dict from group address
+to the pending read of this address. Incoming telegrams are matched with a single dict
+lookup instead of walking a callback per outstanding read.
+
+Concurrent reads of the same group address share one GroupValueRead and one future.
+Every reader waits with its own timeout; the pending read is dropped after the last
+reader timed out.
+"""
+import asyncio
+
+from xknx.telegram import Telegram, TelegramType
+
+
+class ReadMultiplexer:
+    """Class for multiplexing reads of KNX group addresses."""
+
+    class PendingRead:
+        """Future of a GroupValueRead and number of readers waiting for it."""
+
+        # pylint: disable=too-few-public-methods
+
+        def __init__(self, future):
+            """Initialize PendingRead class."""
+            self.future = future
+            self.waiters = 0
+
+    def __init__(self, xknx):
+        """Initialize ReadMultiplexer class."""
+        self.xknx = xknx
+        # group address -> PendingRead
+        self._pending_reads = {}
+
+    def is_pending(self, group_address):
+        """Test if a read of group address is waiting for its response."""
+        return group_address in self._pending_reads
+
+    async def read(self, group_address, timeout_in_seconds=1):
+        """Send GroupValueRead if none is pending and wait for response. Return None on timeout."""
+        pending_read = self._pending_reads.get(group_address)
+        send_group_read = pending_read is None
+        if send_group_read:
+            pending_read = ReadMultiplexer.PendingRead(self.xknx.loop.create_future())
+            self._pending_reads[group_address] = pending_read
+        pending_read.waiters += 1
+        try:
+            if send_group_read:
+                await self.xknx.telegrams.put(Telegram(group_address, TelegramType.GROUP_READ))
+            # shield - a timed out reader must not cancel the future of the others
+            return await asyncio.wait_for(asyncio.shield(pending_read.future), timeout_in_seconds)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            pending_read.waiters -= 1
+            if not pending_read.waiters and self._pending_reads.get(group_address) is pending_read:
+                del self._pending_reads[group_address]
+                pending_read.future.cancel()
+
+    def telegram_received(self, telegram):
+        """Resolve pending read of group address of telegram. Return True if a read was waiting for it."""
+        if telegram.telegramtype not in (
+                TelegramType.GROUP_RESPONSE, TelegramType.GROUP_WRITE):
+            return False
+        pending_read = self._pending_reads.pop(telegram.group_address, None)
+        if pending_read is None:
+            return False
+        if not pending_read.future.done():
+            pending_read.future.set_result(telegram)
+        return True
@@ -0,0 +1,129 @@
+"""
+Module for persisting the last known state of group addresses.
+
+The StateStore keeps the last payload and the time it was received for every group
+address in a memory-mapped file. The file holds one fixed-size record per possible
+group address (indexed by its raw value), so every update is a single in-place write
+and the operating system flushes dirty pages in the background.
+
+On start XKNX passes the remote values of all devices: the payloads of their group
+addresses are restored into the StateTable - with the time they were received. The
+StateUpdater only reads addresses not updated within their refresh interval.
+
+Record layout (24 bytes):
+
+* timestamp: seconds since epoch (double), 0 if nothing was stored
+* kind: 0 = empty, 1 = DPTBinary, 2 = DPTArray
+* length of the payload
+* payload: value of DPTBinary or bytes of DPTArray (StateTable.MAX_PAYLOAD_LENGTH bytes)
+"""
+import mmap
+import os
+import struct
+import time
+
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.telegram import GroupAddress
+
+from .state_table import StateTable
+
+_HEADER = b'XKNXST\x01\x00'
+_RECORD = struct.Struct('<dBB{}s'.format(StateTable.MAX_PAYLOAD_LENGTH))
+_NUMBER_OF_RECORDS = 0x10000
+_FILE_SIZE = len(_HEADER) + _RECORD.size * _NUMBER_OF_RECORDS
+
+_KIND_EMPTY = 0
+_KIND_BINARY = 1
+_KIND_ARRAY = 2
+
+
+class StateStore:
+    """Class for persisting the last known payload of group addresses."""
+
+    def __init__(self, xknx, path):
+        """Initialize StateStore class."""
+        self.xknx = xknx
+        self.path = path
+        self._file = None
+        self._mmap = None
+
+    def open(self):
+        """Open (or create) file and map it into memory. Files of other formats are reset."""
+        exists = os.path.exists(self.path)
+        self._file = open(self.path, 'r+b' if exists else 'w+b')
+        if not exists or os.path.getsize(self.path) != _FILE_SIZE or \
+                self._file.read(len(_HEADER)) != _HEADER:
+            if exists:
+                self.xknx.logger.warning("Resetting state store with unknown format: %s", self.path)
+            self._file.seek(0)
+            self._file.truncate(_FILE_SIZE)
+            self._file.write(_HEADER)
+            self._file.flush()
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), _FILE_SIZE)
+        except (OSError, ValueError):
+            self._file.close()
+            self._file = None
+            raise
+
+    def close(self):
+        """Flush pending writes and close file."""
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _offset(group_address):
+        """Return offset of record of group address."""
+        return len(_HEADER) + group_address.raw * _RECORD.size
+
+    def store(self, group_address, payload, timestamp=None):
+        """Store payload of group address. Payloads not fitting into a record are ignored."""
+        if self._mmap is None or not isinstance(group_address, GroupAddress):
+            return
+        if isinstance(payload, DPTBinary):
+            kind, data = _KIND_BINARY, bytes((payload.value,))
+        elif isinstance(payload, DPTArray) and len(payload.value) <= StateTable.MAX_PAYLOAD_LENGTH:
+            kind, data = _KIND_ARRAY, bytes(payload.value)
+        else:
+            return
+        _RECORD.pack_into(
+            self._mmap, self._offset(group_address),
+            time.time() if timestamp is None else timestamp, kind, len(data), data)
+
+    def load(self, group_address):
+        """Return (payload, timestamp) stored for group address or (None, None)."""
+        if self._mmap is None:
+            return None, None
+        timestamp, kind, length, data = _RECORD.unpack_from(self._mmap, self._offset(group_address))
+        if kind == _KIND_BINARY:
+            return DPTBinary(data[0]), timestamp
+        if kind == _KIND_ARRAY:
+            return DPTArray(data[:length]), timestamp
+        return None, None
+
+    def timestamp(self, group_address):
+        """Return time payload of group address was stored or None."""
+        return self.load(group_address)[1]
+
+    def restore(self, remote_values):
+        """Restore last known payloads of remote values into the state table."""
+        restored = 0
+        for remote_value in remote_values:
+            if self._restore_remote_value(remote_value):
+                restored += 1
+        self.xknx.logger.debug("Restored %s values from state store", restored)
+
+    def _restore_remote_value(self, remote_value):
+        """Restore payloads stored for the group addresses of remote value. Return True if any was restored."""
+        restored = False
+        for group_address in remote_value.all_group_addresses():
+            payload, timestamp = self.load(group_address)
+            if payload is not None and remote_value.payload_valid(payload):
+                self.xknx.state_table.update(group_address, payload, timestamp)
+                restored = True
+        return restored
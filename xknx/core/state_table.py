@@ -0,0 +1,219 @@
+"""
+Module for the central state of all group addresses.
+
+The StateTable holds the last payload of every group address in arrays indexed by the
+raw (16 bit) group address. Arrays are allocated in pages of 256 group addresses (one
+middle group) on the first update of an address within the page - so the memory used
+grows with the group addresses of the installation, not with the address space:
+
+* payload bytes (up to MAX_PAYLOAD_LENGTH bytes per address) and payload kind/length
+* time of the last update (seconds since epoch)
+* raw physical address of the device which sent the last update (0 if unknown)
+* update counter - incremented on every update of the address
+
+RemoteValues are views on this table. Views register for their group addresses and are
+marked outdated (`state_changed()`) on every update of one of them - or on restore - so
+reading an up-to-date view is O(1). A snapshot of the state of the whole installation is
+a copy of the buffers of all pages.
+
+Payloads longer than MAX_PAYLOAD_LENGTH bytes (extended frames) are held in a dict
+and are not part of snapshots.
+"""
+import struct
+import weakref
+from array import array
+
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.telegram import PhysicalAddress
+
+_PAGE_BITS = 8
+_PAGE_SIZE = 1 << _PAGE_BITS
+_PAGE_MASK = _PAGE_SIZE - 1
+# number of the page preceding its buffers within a snapshot
+_PAGE_HEADER = struct.Struct('<H')
+
+_KIND_EMPTY = 0
+_KIND_BINARY = 1
+_KIND_ARRAY = 2
+_KIND_LONG = 3
+
+
+class _Page:
+    """Arrays holding the state of 256 group addresses."""
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ('payloads', 'kinds', 'lengths', 'timestamps', 'sources', 'counters')
+
+    def __init__(self, payload_length):
+        """Initialize _Page class."""
+        self.payloads = bytearray(_PAGE_SIZE * payload_length)
+        self.kinds = bytearray(_PAGE_SIZE)
+        self.lengths = bytearray(_PAGE_SIZE)
+        self.timestamps = array('d', bytes(8 * _PAGE_SIZE))
+        self.sources = array('H', bytes(2 * _PAGE_SIZE))
+        self.counters = array('I', bytes(array('I').itemsize * _PAGE_SIZE))
+
+    def buffers(self):
+        """Return all arrays in order of a snapshot."""
+        return (self.payloads, self.kinds, self.lengths, self.timestamps, self.sources, self.counters)
+
+
+class StateTable:
+    """Class for the central state of all group addresses."""
+
+    MAX_PAYLOAD_LENGTH = 14
+
+    def __init__(self):
+        """Initialize StateTable class."""
+        # raw group address >> 8 -> _Page
+        self._pages = {}
+        self._long_payloads = {}
+        # raw group address -> {id(view): view} of views registered for it
+        self._views = {}
+
+    def __len__(self):
+        """Return number of allocated pages."""
+        return len(self._pages)
+
+    def register_view(self, view, group_addresses):
+        """Call view.state_changed() on every update of group addresses."""
+        for group_address in group_addresses:
+            self._views.setdefault(group_address.raw, weakref.WeakValueDictionary())[id(view)] = view
+
+    def unregister_view(self, view, group_addresses):
+        """Stop notifying view about updates of group addresses."""
+        for group_address in group_addresses:
+            views = self._views.get(group_address.raw)
+            if views is not None:
+                views.pop(id(view), None)
+
+    def _notify(self, raw):
+        """Mark views of raw group address outdated."""
+        views = self._views.get(raw)
+        if views:
+            for view in views.values():
+                view.state_changed()
+
+    def _page(self, raw):
+        """Return page of raw group address - allocate it if necessary."""
+        page = self._pages.get(raw >> _PAGE_BITS)
+        if page is None:
+            page = self._pages[raw >> _PAGE_BITS] = _Page(self.MAX_PAYLOAD_LENGTH)
+        return page
+
+    def update(self, group_address, payload, timestamp, source_address=None):
+        """Set payload of group address. Setting None clears the address."""
+        raw = group_address.raw
+        page = self._page(raw)
+        index = raw & _PAGE_MASK
+        self._long_payloads.pop(raw, None)
+        if payload is None:
+            page.kinds[index] = _KIND_EMPTY
+        elif isinstance(payload, DPTBinary):
+            page.kinds[index] = _KIND_BINARY
+            page.lengths[index] = 1
+            page.payloads[index * self.MAX_PAYLOAD_LENGTH] = payload.value
+        elif len(payload.value) <= self.MAX_PAYLOAD_LENGTH:
+            length = len(payload.value)
+            offset = index * self.MAX_PAYLOAD_LENGTH
+            page.kinds[index] = _KIND_ARRAY
+            page.lengths[index] = length
+            page.payloads[offset:offset + length] = payload.value
+        else:
+            page.kinds[index] = _KIND_LONG
+            self._long_payloads[raw] = payload
+        page.timestamps[index] = timestamp
+        page.sources[index] = source_address.raw if isinstance(source_address, PhysicalAddress) else 0
+        # wrap around instead of overflowing the array type
+        page.counters[index] = (page.counters[index] + 1) & 0xFFFFFFFF
+        self._notify(raw)
+
+    def payload(self, group_address):
+        """Return payload of group address or None."""
+        raw = group_address.raw
+        page = self._pages.get(raw >> _PAGE_BITS)
+        if page is None:
+            return None
+        index = raw & _PAGE_MASK
+        kind = page.kinds[index]
+        if kind == _KIND_BINARY:
+            return DPTBinary(page.payloads[index * self.MAX_PAYLOAD_LENGTH])
+        if kind == _KIND_ARRAY:
+            offset = index * self.MAX_PAYLOAD_LENGTH
+            return DPTArray(bytes(page.payloads[offset:offset + page.lengths[index]]))
+        if kind == _KIND_LONG:
+            return self._long_payloads[raw]
+        return None
+
+    def timestamp(self, group_address):
+        """Return time of last update of group address or None."""
+        page = self._pages.get(group_address.raw >> _PAGE_BITS)
+        if page is None or page.kinds[group_address.raw & _PAGE_MASK] == _KIND_EMPTY:
+            return None
+        return page.timestamps[group_address.raw & _PAGE_MASK]
+
+    def source_address(self, group_address):
+        """Return PhysicalAddress which sent the last update of group address or None."""
+        page = self._pages.get(group_address.raw >> _PAGE_BITS)
+        source = 0 if page is None else page.sources[group_address.raw & _PAGE_MASK]
+        return PhysicalAddress(source) if source else None
+
+    def counter(self, group_address):
+        """Return update counter of group address."""
+        page = self._pages.get(group_address.raw >> _PAGE_BITS)
+        return 0 if page is None else page.counters[group_address.raw & _PAGE_MASK]
+
+    def latest(self, group_addresses):
+        """Return the group address updated last (holding a payload) or None."""
+        latest = None
+        latest_timestamp = None
+        for group_address in group_addresses:
+            timestamp = self.timestamp(group_address)
+            if timestamp is not None and (latest is None or timestamp > latest_timestamp):
+                latest = group_address
+                latest_timestamp = timestamp
+        return latest
+
+    def snapshot(self):
+        """Return copy of the state of all group addresses as one buffer."""
+        return b''.join(_PAGE_HEADER.pack(number) + b''.join(bytes(buffer) for buffer in page.buffers())
+                        for number, page in sorted(self._pages.items()))
+
+    def restore(self, snapshot):
+        """
+        Restore state from a snapshot.
+
+        Update counters are not restored but incremented. All views are marked outdated.
+        """
+        sizes = [len(buffer) * getattr(buffer, 'itemsize', 1)
+                 for buffer in _Page(self.MAX_PAYLOAD_LENGTH).buffers()]
+        page_size = _PAGE_HEADER.size + sum(sizes)
+        if len(snapshot) % page_size:
+            raise ValueError("Snapshot does not match size of state table")
+        view = memoryview(snapshot)
+        pages = {}
+        for start in range(0, len(snapshot), page_size):
+            (number,) = _PAGE_HEADER.unpack_from(view, start)
+            page = pages[number] = _Page(self.MAX_PAYLOAD_LENGTH)
+            offset = start + _PAGE_HEADER.size
+            for buffer, size in zip(page.buffers(), sizes):
+                if buffer is not page.counters:
+                    buffer[:] = array(buffer.typecode, view[offset:offset + size].tobytes()) \
+                        if isinstance(buffer, array) else view[offset:offset + size]
+                offset += size
+        # pages not part of the snapshot are cleared
+        for number in self._pages.keys() - pages.keys():
+            pages[number] = _Page(self.MAX_PAYLOAD_LENGTH)
+        for number, page in pages.items():
+            old_page = self._pages.get(number)
+            if old_page is not None:
+                page.counters = old_page.counters
+            page.counters = array('I', ((counter + 1) & 0xFFFFFFFF for counter in page.counters))
+        self._pages = pages
+        # payloads of extended frames are not part of snapshots
+        self._long_payloads.clear()
+        for page in self._pages.values():
+            page.kinds[:] = page.kinds.replace(bytes((_KIND_LONG,)), bytes((_KIND_EMPTY,)))
+        for raw in list(self._views):
+            self._notify(raw)
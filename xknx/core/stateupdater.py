@@ -1,28 +1,83 @@
-"""Module for reading the values of all devices from device vector from KNX bus in periodic cycles."""
+"""
+Module for reading the values of all devices from device vector from KNX bus in periodic cycles.
+
+The StateUpdater keeps the time each state address is due next in a heap. Due addresses
+are read concurrently - bounded by `max_concurrent_reads` which defaults to what the
+outgoing rate limit can send within half the read timeout. Addresses a value was seen
+for on the bus (or restored from the StateStore) within their interval are not read but
+rescheduled.
+
+Devices without state addresses and devices implementing their own `sync()` (e.g. DateTime
+broadcasting the time) are synced by calling `sync()` once per interval instead.
+
+The refresh interval defaults to `timeout` and can be set per device name, per value type
+(e.g. 'temperature' of a Sensor) or per device class via `intervals`.
+"""
 import asyncio
+import heapq
+import itertools
+import time
+
+from xknx.exceptions import XKNXException
+from xknx.telegram import TelegramType
+
+from .value_reader import ValueReader
+
+# key prefix of devices synced by calling sync()
+_SYNC = 'sync'
 
 
 class StateUpdater():
     """Class for reading the values of all devices from KNX bus."""
 
+    # pylint: disable=too-many-instance-attributes
+
+    DEFAULT_MAX_CONCURRENT_READS = 10
+    READ_TIMEOUT = 1
+
     def __init__(self,
                  xknx,
                  timeout=3600,
-                 start_timeout=10):
+                 start_timeout=10,
+                 intervals=None,
+                 max_concurrent_reads=None):
         """Initialize StateUpdater class."""
+        # pylint: disable=too-many-arguments
         self.xknx = xknx
         self.timeout = timeout
         self.start_timeout = start_timeout
+        self.intervals = intervals or {}
+        self.max_concurrent_reads = max_concurrent_reads
         self.run_forever = True
         self.run_task = None
 
+        # raw group address -> (group address, devices, interval)
+        self._state_addresses = {}
+        # (_SYNC, id(device)) -> (device, interval) of devices synced by calling sync()
+        self._sync_devices = {}
+        # raw group address or sync device key -> loop time it is due next
+        self._next_due = {}
+        # raw group address -> loop time a value was seen on the bus
+        self._last_seen = {}
+        self._heap = []
+        self._heap_counter = itertools.count()
+        self._collected_for = None
+        self._collected_at = None
+        self._telegram_received_cb = None
+
     async def start(self):
         """Start StateUpdater."""
+        # state addresses are group addresses of devices - keeps the AddressPrefilter active
+        self._telegram_received_cb = self.xknx.telegram_queue.register_telegram_received_cb(
+            self.telegram_received, device_addresses_only=True)
         self.run_task = self.xknx.loop.create_task(
             self.run())
 
     async def stop(self):
         """Stop StateUpdater."""
+        if self._telegram_received_cb is not None:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(self._telegram_received_cb)
+            self._telegram_received_cb = None
         if self.run_task:
             self.xknx.logger.debug("Stopping StateUpdater")
             self.run_task.cancel()
@@ -31,12 +86,167 @@ class StateUpdater():
             except asyncio.CancelledError:
                 self.run_task = None
 
+    async def telegram_received(self, telegram):
+        """Remember when a value was seen on the bus. Callback from TelegramQueue."""
+        if telegram.telegramtype in (TelegramType.GROUP_WRITE, TelegramType.GROUP_RESPONSE):
+            self._last_seen[telegram.group_address.raw] = self.xknx.loop.time()
+        return False
+
+    def interval_for(self, device):
+        """Return refresh interval of device."""
+        for key in self._interval_keys(device):
+            if key in self.intervals:
+                return self.intervals[key]
+        return self.timeout
+
+    @staticmethod
+    def _interval_keys(device):
+        """Yield keys to look up the interval of device: name, value types, device classes."""
+        yield device.name
+        for remote_value in device.remote_values():
+            if getattr(remote_value, 'value_type', None) is not None:
+                yield remote_value.value_type
+        yield from type(device).__mro__
+
+    @staticmethod
+    def _syncs_itself(device):
+        """Test if device is synced by calling its sync() instead of reading its state addresses."""
+        from xknx.devices import Device
+        return not device.state_addresses() or type(device).sync is not Device.sync
+
+    def collect_state_addresses(self):
+        """(Re)collect state addresses of all devices. New addresses are due immediately."""
+        now = self.xknx.loop.time()
+        state_addresses = {}
+        sync_devices = {}
+        for device in self.xknx.devices:
+            interval = self.interval_for(device)
+            if self._syncs_itself(device):
+                sync_devices[(_SYNC, id(device))] = (device, interval)
+                continue
+            for group_address in device.state_addresses():
+                if group_address.raw not in state_addresses:
+                    state_addresses[group_address.raw] = (group_address, [], interval)
+                _, devices, other_interval = state_addresses[group_address.raw]
+                if device not in devices:
+                    devices.append(device)
+                state_addresses[group_address.raw] = (group_address, devices, min(interval, other_interval))
+        self._state_addresses = state_addresses
+        self._sync_devices = sync_devices
+        for raw, (group_address, _, _) in state_addresses.items():
+            if raw not in self._next_due:
+                self._restore_last_seen(group_address, now)
+                self._schedule(raw, now)
+        for key in sync_devices:
+            if key not in self._next_due:
+                self._schedule(key, now)
+        for key in set(self._next_due) - set(state_addresses) - set(sync_devices):
+            del self._next_due[key]
+        self._collected_for = (len(self.xknx.devices), self.xknx.devices.group_address_generation)
+        self._collected_at = now
+
+    def _restore_last_seen(self, group_address, now):
+        """Take time of last update from state store for addresses not seen on the bus yet."""
+        if self.xknx.state_store is None or group_address.raw in self._last_seen:
+            return
+        timestamp = self.xknx.state_store.timestamp(group_address)
+        if timestamp is not None:
+            self._last_seen[group_address.raw] = now - max(0, time.time() - timestamp)
+
+    def _collection_outdated(self):
+        """Test if devices changed or state addresses were not collected within default interval."""
+        return self._collected_for != (len(self.xknx.devices), self.xknx.devices.group_address_generation) or \
+            self.xknx.loop.time() - self._collected_at >= self.timeout
+
+    def _schedule(self, key, due):
+        """Schedule reading of raw group address or syncing of device at loop time `due`."""
+        self._next_due[key] = due
+        heapq.heappush(self._heap, (due, next(self._heap_counter), key))
+
+    def _concurrency(self):
+        """Return number of reads allowed to run concurrently."""
+        if self.max_concurrent_reads is not None:
+            return self.max_concurrent_reads
+        if self.xknx.rate_limit:
+            return max(1, int(self.xknx.rate_limit * self.READ_TIMEOUT / 2))
+        return self.DEFAULT_MAX_CONCURRENT_READS
+
     async def run(self):
         """Worker thread. Endless loop for updating states."""
         await asyncio.sleep(self.start_timeout)
         self.xknx.logger.debug("Starting StateUpdater")
-        while True:
-            await self.xknx.devices.sync()
-            await asyncio.sleep(self.timeout)
-            if not self.run_forever:
-                break
+        semaphore = asyncio.Semaphore(self._concurrency())
+        reads = set()
+        self.collect_state_addresses()
+        try:
+            while True:
+                if not self.run_forever and not self._heap:
+                    # single cycle: every address has been handled
+                    break
+                if self._collection_outdated():
+                    self.collect_state_addresses()
+                now = self.xknx.loop.time()
+                if not self._heap:
+                    await asyncio.sleep(self.timeout)
+                    continue
+                due, _, raw = self._heap[0]
+                if due > now:
+                    await asyncio.sleep(min(due - now, self.timeout))
+                    continue
+                heapq.heappop(self._heap)
+                if self._next_due.get(raw) != due:
+                    # stale heap entry - rescheduled or removed in the meantime
+                    continue
+                if raw in self._sync_devices:
+                    device, interval = self._sync_devices[raw]
+                    if self.run_forever:
+                        self._schedule(raw, now + interval)
+                    await semaphore.acquire()
+                    self._start_read(reads, semaphore, self.sync_device(device))
+                    continue
+                group_address, devices, interval = self._state_addresses[raw]
+                last_seen = self._last_seen.get(raw)
+                if last_seen is not None and now - last_seen < interval:
+                    if self.run_forever:
+                        self._schedule(raw, last_seen + interval)
+                    continue
+                if self.run_forever:
+                    self._schedule(raw, now + interval)
+                await semaphore.acquire()
+                self._start_read(reads, semaphore, self.read(group_address, devices))
+            if reads:
+                await asyncio.wait(reads)
+        finally:
+            for read in reads:
+                read.cancel()
+
+    def _start_read(self, reads, semaphore, coroutine):
+        """Run coroutine as task within reads. Releases semaphore once done."""
+        read = self.xknx.loop.create_task(coroutine)
+        reads.add(read)
+        read.add_done_callback(reads.discard)
+        read.add_done_callback(lambda _: semaphore.release())
+
+    async def sync_device(self, device):
+        """Sync device by calling its sync() - e.g. DateTime broadcasts the time."""
+        try:
+            await device.sync()
+        except XKNXException as ex:
+            self.xknx.logger.error("Error while syncing device: %s", ex)
+
+    async def read(self, group_address, devices):
+        """Read group address from KNX bus and pass response to devices currently requesting it."""
+        devices = [device for device in devices if group_address in device.state_addresses()]
+        if not devices:
+            return
+        try:
+            value_reader = ValueReader(self.xknx, group_address, timeout_in_seconds=self.READ_TIMEOUT)
+            telegram = await value_reader.read()
+            if telegram is None:
+                self.xknx.logger.warning("Could not sync group address '%s' from %s", group_address, devices[0])
+                return
+            self._last_seen[group_address.raw] = self.xknx.loop.time()
+            for device in devices:
+                await device.process(telegram)
+        except XKNXException as ex:
+            self.xknx.logger.error("Error while syncing device: %s", ex)
@@ -0,0 +1,205 @@
+"""
+Module for bounded queues of telegrams.
+
+A TelegramBuffer is an asyncio.Queue which - once `maxsize` telegrams are queued -
+handles further telegrams according to its OverflowPolicy:
+
+* BLOCK: put() waits for a free slot, put_nowait() raises asyncio.QueueFull (received
+  telegrams are then dropped - counted and logged as warning by KNXIPInterface)
+* DROP_OLDEST: the oldest queued telegram is discarded
+* DROP_NEWEST: the new telegram is discarded
+* COALESCE: a queued telegram of the same direction and type to the same group address
+  is replaced by the new one - keeping its position. Without such a telegram the oldest
+  one is discarded.
+
+Only telegrams (of `bounded_direction`, if set) count against `maxsize`. Other items -
+e.g. stop signals - are queued right away and never discarded. Counters of overflows and
+discarded/coalesced telegrams are kept for monitoring. `dropped_cb` is called with every
+item removed from the queue without being returned by get().
+
+XKNX.telegrams and TelegramQueue.outgoing_queue are TelegramBuffers. Both are unbounded
+by default. XKNX.telegrams is bounded for incoming telegrams only: outgoing telegrams
+are put by devices - possibly from within a handler of the consumer of this very queue -
+and are bounded by the outgoing queue they are moved to right away. So put() of an
+outgoing telegram never waits for the consumer.
+"""
+import asyncio
+from enum import Enum
+import heapq
+
+from xknx.telegram import Telegram
+
+
+class OverflowPolicy(Enum):
+    """Enum class for the handling of telegrams put into a full TelegramBuffer."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    COALESCE = "coalesce"
+
+
+class TelegramBuffer(asyncio.Queue):
+    """Class for bounded queues of telegrams."""
+
+    def __init__(self, maxsize=0, overflow_policy=OverflowPolicy.BLOCK, dropped_cb=None, bounded_direction=None):
+        """Initialize TelegramBuffer class."""
+        # pylint: disable=too-many-arguments
+        super().__init__(maxsize)
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.dropped_cb = dropped_cb
+        # TelegramDirection of telegrams counting against maxsize - None for all telegrams
+        self.bounded_direction = bounded_direction
+        # number of queued items counting against maxsize
+        self._bounded_count = 0
+        # number of items put into the full queue
+        self.overflow_count = 0
+        # number of telegrams discarded (including rejected by put_nowait with BLOCK)
+        self.drop_count = 0
+        # number of telegrams replaced by a newer telegram
+        self.coalesce_count = 0
+
+    @staticmethod
+    def _telegram(item):
+        """Return telegram of queue item or None for other items."""
+        return item if isinstance(item, Telegram) else None
+
+    def _bounded(self, item):
+        """Test if item counts against maxsize."""
+        telegram = self._telegram(item)
+        return telegram is not None and \
+            (self.bounded_direction is None or telegram.direction == self.bounded_direction)
+
+    def _put(self, item):
+        """Append item to queue - called by asyncio.Queue."""
+        super()._put(item)
+        if self._bounded(item):
+            self._bounded_count += 1
+
+    def _get(self):
+        """Remove first item from queue - called by asyncio.Queue."""
+        item = super()._get()
+        if self._bounded(item):
+            self._bounded_count -= 1
+        return item
+
+    def full(self):
+        """Return True if maxsize items counting against it are queued."""
+        return 0 < self.maxsize <= self._bounded_count
+
+    def _oldest_index(self):
+        """Return index of the oldest telegram counting against maxsize within the queue or None."""
+        for index, item in enumerate(self._queue):
+            if self._bounded(item):
+                return index
+        return None
+
+    def _remove(self, index):
+        """Remove item at index from queue and return it."""
+        item = self._queue[index]
+        del self._queue[index]
+        self._bounded_count -= 1
+        return item
+
+    def _replace(self, index, item):
+        """Replace queued item at index with item. Return replaced item."""
+        replaced = self._queue[index]
+        self._queue[index] = item
+        return replaced
+
+    def _coalesce_index(self, telegram):
+        """Return index of queued telegram which may be replaced by telegram or None."""
+        for index, item in enumerate(self._queue):
+            queued = self._telegram(item)
+            if self._bounded(item) and \
+                    queued.group_address == telegram.group_address and \
+                    queued.telegramtype == telegram.telegramtype and \
+                    queued.direction == telegram.direction:
+                return index
+        return None
+
+    def _discard(self, item):
+        """Account for item removed from queue without being returned by get()."""
+        self.drop_count += 1
+        # the discarded item will never be processed
+        self.task_done()
+        if self.dropped_cb is not None:
+            self.dropped_cb(item)
+
+    async def put(self, item):
+        """Put item into the queue. Waits for a free slot only with OverflowPolicy.BLOCK."""
+        if self.overflow_policy is OverflowPolicy.BLOCK and self._bounded(item):
+            await super().put(item)
+        else:
+            self.put_nowait(item)
+
+    def put_nowait(self, item):
+        """Put item into the queue. If it is full, handle item according to overflow policy."""
+        if not self.full() or not self._bounded(item):
+            # items not counting against maxsize are always queued (full() checks bounded items only)
+            maxsize, self._maxsize = self._maxsize, 0
+            try:
+                super().put_nowait(item)
+            finally:
+                self._maxsize = maxsize
+            return
+        self.overflow_count += 1
+        telegram = self._telegram(item)
+        if self.overflow_policy is OverflowPolicy.BLOCK:
+            self.drop_count += 1
+            raise asyncio.QueueFull
+        if self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+            self.drop_count += 1
+            if self.dropped_cb is not None:
+                self.dropped_cb(item)
+            return
+        if self.overflow_policy is OverflowPolicy.COALESCE:
+            index = self._coalesce_index(telegram)
+            if index is not None:
+                replaced = self._replace(index, item)
+                self.coalesce_count += 1
+                if self.dropped_cb is not None:
+                    self.dropped_cb(replaced)
+                return
+        self._discard(self._remove(self._oldest_index()))
+        super().put_nowait(item)
+
+
+class PriorityTelegramBuffer(TelegramBuffer, asyncio.PriorityQueue):
+    """Class for bounded priority queues of (priority, sequence, telegram) entries - tuples or lists."""
+
+    @staticmethod
+    def _telegram(item):
+        """Return telegram of queue entry or None for other entries."""
+        return item[2] if isinstance(item[2], Telegram) else None
+
+    def _oldest_index(self):
+        """Return index of the entry with the lowest sequence holding a telegram counting against maxsize or None."""
+        indices = [index for index, item in enumerate(self._queue) if self._bounded(item)]
+        if not indices:
+            return None
+        return min(indices, key=lambda index: self._queue[index][1])
+
+    def _remove(self, index):
+        """Remove entry at index from heap and return it."""
+        item = self._queue[index]
+        self._queue[index] = self._queue[-1]
+        self._queue.pop()
+        heapq.heapify(self._queue)
+        self._bounded_count -= 1
+        return item
+
+    def _replace(self, index, item):
+        """Replace telegram of queued entry at index - keeping its position. Return replaced entry."""
+        entry = self._queue[index]
+        if isinstance(entry, list):
+            # list entries may be referenced elsewhere - update in place
+            replaced = entry.copy()
+            entry[2] = item[2]
+            return replaced
+        self._queue[index] = (*entry[:2], item[2])
+        return entry
+
+    def pushpop(self, item):
+        """Return the first entry - which may be item itself - and leave item in the queue otherwise."""
+        return heapq.heappushpop(self._queue, item)
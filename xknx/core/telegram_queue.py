@@ -6,11 +6,50 @@ When a device wants to sends a telegram to the KNX bus, it has to queue it to th
 The underlaying KNXIPInterface will poll the queue and send the packets to the correct KNX/IP abstraction (Tunneling or Routing).
 
 You may register callbacks to be notified if a telegram was pushed to the queue.
+Responses to pending reads are matched by the ReadMultiplexer before any callback is called.
+
+Incoming telegrams are processed one after another - or with XKNX.incoming_dispatch_workers
+set, by the IncomingDispatcher concurrently for unrelated devices. With incoming dispatch
+workers or XKNX.record_handler_latencies set, the duration of every handler is recorded
+within `handler_latencies`.
+
+Outgoing telegrams are sent in the order of their KNX priority (SYSTEM, URGENT, NORMAL, LOW)
+and limited by a token bucket (see RateLimiter). Within a priority, GroupValueReads are sent
+after writes and responses - so bulk state reads never delay writes of devices.
+RemoteValues and Devices send with their `priority`. The outgoing queue may be bounded by
+XKNX.outgoing_queue_size (see TelegramBuffer). With XKNX.coalesce_outgoing_writes set,
+at most one GroupValueWrite per group address is queued: a newer write replaces the
+telegram of the queued one - keeping its position within the queue.
+
+Outgoing telegrams whose deadline (Telegram.deadline, default set from XKNX.outgoing_ttl)
+passed while they were queued - e.g. during a reconnect - are dropped instead of sent.
 """
 import asyncio
+import itertools
+import time
 
 from xknx.exceptions import XKNXException
-from xknx.telegram import TelegramDirection
+from xknx.telegram import (
+    AddressFilter, CompiledAddressFilter, TelegramDirection, TelegramPriority,
+    TelegramType)
+
+from .handler_latency import HandlerLatency
+from .incoming_dispatcher import IncomingDispatcher
+from .rate_limiter import RateLimiter
+from .read_multiplexer import ReadMultiplexer
+from .telegram_buffer import PriorityTelegramBuffer
+
+# Outgoing telegrams are dequeued by lane - lower lane first
+PRIORITY_LANES = {
+    TelegramPriority.SYSTEM: 0,
+    TelegramPriority.URGENT: 2,
+    TelegramPriority.NORMAL: 4,
+    TelegramPriority.LOW: 6,
+}
+# GroupValueReads (e.g. of the StateUpdater) are queued behind writes of the same priority
+_READ_LANE_OFFSET = 1
+# Stop signal is queued behind all telegrams
+_STOP_LANE = 2 * len(PRIORITY_LANES)
 
 
 class TelegramQueue():
@@ -21,15 +60,25 @@ class TelegramQueue():
 
         # pylint: disable=too-few-public-methods
 
-        def __init__(self, callback, address_filters=None):
+        def __init__(self, callback, address_filters=None, device_addresses_only=False):
             """Initialize Callback class."""
             self.callback = callback
             self.address_filters = address_filters
+            # callback is only interested in group addresses of devices (e.g. StateUpdater)
+            self.device_addresses_only = device_addresses_only
+            self.name = getattr(callback, '__qualname__', None) or repr(callback)
+            # AddressFilters are merged into a single lookup - None if not all filters are AddressFilters
+            self.compiled_filter = None
+            if address_filters is not None and \
+                    all(isinstance(address_filter, AddressFilter) for address_filter in address_filters):
+                self.compiled_filter = CompiledAddressFilter.from_filters(address_filters)
 
         def is_within_filter(self, telegram):
             """Test if callback is filtering for group address."""
             if self.address_filters is None:
                 return True
+            if self.compiled_filter is not None:
+                return self.compiled_filter.match(telegram.group_address)
             for address_filter in self.address_filters:
                 if address_filter.match(telegram.group_address):
                     return True
@@ -39,25 +88,46 @@ class TelegramQueue():
         """Initialize TelegramQueue class."""
         self.xknx = xknx
         self.telegram_received_cbs = []
-        self.outgoing_queue = asyncio.Queue()
+        # incremented whenever telegram received callbacks are (un)registered
+        self.callbacks_generation = 0
+        self.read_multiplexer = ReadMultiplexer(xknx)
+        self.incoming_dispatcher = None
+        # handler name -> HandlerLatency
+        self.handler_latencies = {}
+        # entries: [lane, sequence, telegram] - sequence keeps order within a lane
+        self.outgoing_queue = None
+        # group address -> queued entry of GroupValueWrite (with coalesce_outgoing_writes)
+        self._pending_writes = {}
+        # number of outgoing GroupValueWrites replaced by a newer one
+        self.coalesced_writes = 0
+        # number of outgoing telegrams dropped because their deadline passed
+        self.expired_telegrams = 0
+        self.rate_limiter = RateLimiter(xknx)
+        self._outgoing_sequence = itertools.count()
         self._consumer_task = None
 
-    def register_telegram_received_cb(self, telegram_received_cb, address_filters=None):
+    def register_telegram_received_cb(self, telegram_received_cb, address_filters=None, device_addresses_only=False):
         """Register callback for a telegram beeing received from KNX bus."""
-        callback = TelegramQueue.Callback(telegram_received_cb, address_filters)
+        callback = TelegramQueue.Callback(telegram_received_cb, address_filters, device_addresses_only)
         self.telegram_received_cbs.append(callback)
+        self.callbacks_generation += 1
         return callback
 
     def unregister_telegram_received_cb(self, telegram_received_cb):
         """Unregister callback for a telegram beeing received from KNX bus."""
         self.telegram_received_cbs.remove(telegram_received_cb)
+        self.callbacks_generation += 1
 
     async def start(self):
         """Start telegram queue."""
-        self._consumer_task = asyncio.gather(
-            self._telegram_consumer(),
-            self._outgoing_rate_limiter()
-        )
+        self.outgoing_queue = PriorityTelegramBuffer(
+            self.xknx.outgoing_queue_size, self.xknx.outgoing_overflow_policy,
+            dropped_cb=self._outgoing_dropped)
+        coroutines = [self._telegram_consumer(), self._outgoing_rate_limiter()]
+        if self.xknx.incoming_dispatch_workers:
+            self.incoming_dispatcher = IncomingDispatcher(self.xknx, self.xknx.incoming_dispatch_workers)
+            coroutines.append(self.incoming_dispatcher.run())
+        self._consumer_task = asyncio.gather(*coroutines)
 
     async def stop(self):
         """Stop telegram queue."""
@@ -72,41 +142,101 @@ class TelegramQueue():
             telegram = await self.xknx.telegrams.get()
             # Breaking up queue if None is pushed to the queue
             if telegram is None:
-                self.outgoing_queue.put_nowait(None)
+                if self.incoming_dispatcher is not None:
+                    await self.incoming_dispatcher.stop()
+                await self.outgoing_queue.put([_STOP_LANE, next(self._outgoing_sequence), None])
                 await self.outgoing_queue.join()
                 self.xknx.telegrams.task_done()
                 break
 
             try:
                 if telegram.direction == TelegramDirection.INCOMING:
-                    await self.process_telegram_incoming(telegram)
-                    self.xknx.telegrams.task_done()
+                    if self.incoming_dispatcher is not None:
+                        # task_done() is called by the dispatcher once the telegram was processed
+                        self.incoming_dispatcher.dispatch(telegram)
+                    else:
+                        await self.process_telegram_incoming(telegram)
+                        self.xknx.telegrams.task_done()
                 elif telegram.direction == TelegramDirection.OUTGOING:
-                    self.outgoing_queue.put_nowait(telegram)
+                    await self._queue_outgoing(telegram)
                     # self.xknx.telegrams.task_done() for outgoing is called in _outgoing_rate_limiter.
             except XKNXException as ex:
                 self.xknx.logger.error("Error while processing telegram %s", ex)
 
+    async def _queue_outgoing(self, telegram):
+        """Put outgoing telegram into outgoing queue - or replace the telegram of a pending write."""
+        if telegram.deadline is None and self.xknx.outgoing_ttl is not None:
+            telegram.set_ttl(self.xknx.outgoing_ttl)
+        coalesce = self.xknx.coalesce_outgoing_writes and telegram.telegramtype == TelegramType.GROUP_WRITE
+        if coalesce:
+            entry = self._pending_writes.get(telegram.group_address)
+            if entry is not None:
+                entry[2] = telegram
+                self.coalesced_writes += 1
+                # the replaced telegram will never be sent
+                self.xknx.telegrams.task_done()
+                return
+        entry = [self._lane(telegram), next(self._outgoing_sequence), telegram]
+        if coalesce:
+            self._pending_writes[telegram.group_address] = entry
+        await self.outgoing_queue.put(entry)
+
+    @staticmethod
+    def _lane(telegram):
+        """Return lane of outgoing telegram."""
+        lane = PRIORITY_LANES[telegram.priority]
+        if telegram.telegramtype == TelegramType.GROUP_READ:
+            lane += _READ_LANE_OFFSET
+        return lane
+
+    def _forget_pending_write(self, entry):
+        """Remove entry from pending writes. Further writes to its group address are queued anew."""
+        if entry[2] is not None and self._pending_writes.get(entry[2].group_address) is entry:
+            del self._pending_writes[entry[2].group_address]
+
     async def _outgoing_rate_limiter(self):
         """Endless loop for processing outgoing telegrams."""
         while True:
-            telegram = await self.outgoing_queue.get()
+            entry = await self.outgoing_queue.get()
             # Breaking up queue if None is pushed to the queue
-            if telegram is None:
+            if entry[2] is None:
                 self.outgoing_queue.task_done()
                 break
+            # drop stale telegrams without waiting for the rate limiter
+            if self._drop_expired(entry):
+                continue
+
+            # limit rate to knx bus - defaults to 20 per second
+            await self.rate_limiter.acquire()
+            # a telegram of higher priority may have been queued while waiting
+            entry = self.outgoing_queue.pushpop(entry)
+            if self._drop_expired(entry):
+                continue
+            self._forget_pending_write(entry)
 
             try:
-                await self.process_telegram_outgoing(telegram)
+                await self.process_telegram_outgoing(entry[2])
             except XKNXException as ex:
                 self.xknx.logger.error("Error while processing outgoing telegram %s", ex)
             finally:
                 self.outgoing_queue.task_done()
                 self.xknx.telegrams.task_done()
 
-            # limit rate to knx bus - defaults to 20 per second
-            if self.xknx.rate_limit:
-                await asyncio.sleep(1 / self.xknx.rate_limit)
+    def _drop_expired(self, entry):
+        """Drop entry taken from outgoing queue if the deadline of its telegram passed. Return True if dropped."""
+        if not entry[2].expired():
+            return False
+        self._forget_pending_write(entry)
+        self.expired_telegrams += 1
+        self.xknx.logger.debug("Dropping expired telegram %s", entry[2])
+        self.outgoing_queue.task_done()
+        self.xknx.telegrams.task_done()
+        return True
+
+    def _outgoing_dropped(self, entry):
+        """Mark outgoing telegram discarded by the outgoing queue as done."""
+        self._forget_pending_write(entry)
+        self.xknx.telegrams.task_done()
 
     async def _process_all_telegrams(self):
         """Process all telegrams being queued. Used in unit tests."""
@@ -133,14 +263,46 @@ class TelegramQueue():
     async def process_telegram_incoming(self, telegram):
         """Process incoming telegram."""
         self.xknx.telegram_logger.debug(telegram)
-        processed = False
+        processed = self.read_multiplexer.telegram_received(telegram)
+        if self.xknx.record_handler_latencies or self.xknx.incoming_dispatch_workers:
+            await self._process_telegram_incoming_recorded(telegram, processed)
+            return
+        for telegram_received_cb in self.telegram_received_cbs:
+            if telegram_received_cb.is_within_filter(telegram):
+                ret = await telegram_received_cb.callback(telegram)
+                if ret:
+                    processed = True
+
+        if not processed:
+            for device in self.xknx.devices.devices_by_group_address(
+                    telegram.group_address):
+                await device.process(telegram)
+
+    async def _process_telegram_incoming_recorded(self, telegram, processed):
+        """Process incoming telegram - recording the duration of every handler."""
         for telegram_received_cb in self.telegram_received_cbs:
             if telegram_received_cb.is_within_filter(telegram):
+                started = time.perf_counter()
                 ret = await telegram_received_cb.callback(telegram)
+                self._record_latency(telegram_received_cb.name, started)
                 if ret:
                     processed = True
 
         if not processed:
             for device in self.xknx.devices.devices_by_group_address(
                     telegram.group_address):
+                started = time.perf_counter()
                 await device.process(telegram)
+                self._record_latency(device.name, started)
+
+    def _record_latency(self, name, started):
+        """Record duration of handler started at `started` (time.perf_counter())."""
+        latency = self.handler_latencies.get(name)
+        if latency is None:
+            latency = self.handler_latencies[name] = HandlerLatency(name)
+        latency.record(time.perf_counter() - started)
+
+    def slowest_handlers(self, count=None):
+        """Return HandlerLatency of handlers sorted by their maximum duration - slowest first."""
+        latencies = sorted(self.handler_latencies.values(), key=lambda latency: latency.maximum, reverse=True)
+        return latencies if count is None else latencies[:count]
@@ -7,6 +7,7 @@ from .climate_mode import ClimateMode
 from .cover import Cover
 from .datetime import DateTime, DateTimeBroadcastType
 from .device import Device
+from .device_update_subscription import DeviceUpdateSubscription
 from .devices import Devices
 from .diagram import Diagram
 from .expose_sensor import ExposeSensor
@@ -5,7 +5,7 @@ Module for managing the climate within a room.
 * Manages and sends the desired setpoint to KNX bus.
 """
 from xknx.remote_value import (
-    RemoteValue1Count, RemoteValueSwitch, RemoteValueTemp)
+    RemoteValue1Count, RemoteValueRegistry, RemoteValueSwitch, RemoteValueTemp)
 from xknx.telegram import GroupAddress
 
 from .climate_mode import ClimateMode
@@ -135,6 +135,12 @@ class Climate(Device):
 
         self.mode = mode
 
+        self._remote_values = RemoteValueRegistry(xknx, [
+            self.temperature,
+            self.target_temperature,
+            self._setpoint_shift,
+            self.on])
+
     @classmethod
     def from_config(cls, xknx, name, config):
         """Initialize object from configuration structure."""
@@ -192,10 +198,7 @@ class Climate(Device):
         """Test if device has given group address."""
         if self.mode is not None and self.mode.has_group_address(group_address):
             return True
-        return self.temperature.has_group_address(group_address) or \
-            self.target_temperature.has_group_address(group_address) or \
-            self._setpoint_shift.has_group_address(group_address) or \
-            self.on.has_group_address(group_address)
+        return self._remote_values.has_group_address(group_address)
 
     @property
     def is_on(self):
@@ -286,10 +289,7 @@ class Climate(Device):
 
     async def process_group_write(self, telegram):
         """Process incoming GROUP WRITE telegram."""
-        await self.temperature.process(telegram)
-        await self.target_temperature.process(telegram)
-        await self._setpoint_shift.process(telegram)
-        await self.on.process(telegram)
+        await self._remote_values.process(telegram)
         if self.mode is not None:
             await self.mode.process_group_write(telegram)
 
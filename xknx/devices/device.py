@@ -2,9 +2,14 @@
 Device is the base class for all implemented devices (e.g. Lights/Switches/Sensors).
 
 It provides basis functionality for reading the state from the KNX bus.
+
+With XKNX.callback_coalesce_window set, updates of a device within this window are
+merged into one call of its device_updated callbacks.
 """
 from xknx.exceptions import XKNXException
-from xknx.telegram import Telegram, TelegramType
+from xknx.remote_value import RemoteValue
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramPriority, TelegramType)
 
 
 class Device:
@@ -15,9 +20,27 @@ class Device:
         self.xknx = xknx
         self.name = name
         self.device_updated_cbs = []
+        self._priority = TelegramPriority.LOW
+        self._coalesced_update = None
+        # tasks running device updated callbacks of coalesced updates
+        self._coalesced_tasks = set()
         if device_updated_cb is not None:
             self.register_device_updated_cb(device_updated_cb)
 
+    @property
+    def priority(self):
+        """Return KNX priority of telegrams sent by device."""
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority):
+        """Set KNX priority of telegrams sent by device and its remote values."""
+        self._priority = TelegramPriority(priority)
+        for attribute in vars(self).values():
+            if isinstance(attribute, RemoteValue) or \
+                    (isinstance(attribute, Device) and attribute is not self):
+                attribute.priority = self._priority
+
     def register_device_updated_cb(self, device_updated_cb):
         """Register device updated callback."""
         self.device_updated_cbs.append(device_updated_cb)
@@ -28,6 +51,30 @@ class Device:
 
     async def after_update(self):
         """Execute callbacks after internal state has been changed."""
+        if self.xknx.callback_coalesce_window:
+            if self._coalesced_update is None:
+                self._coalesced_update = self.xknx.loop.call_later(
+                    self.xknx.callback_coalesce_window, self._coalesced_update_due)
+            return
+        await self._run_device_updated_cbs()
+
+    def _coalesced_update_due(self):
+        """Run device updated callbacks for all updates within coalesce window."""
+        self._coalesced_update = None
+        task = self.xknx.loop.create_task(self._run_device_updated_cbs())
+        self._coalesced_tasks.add(task)
+        task.add_done_callback(self._coalesced_tasks.discard)
+
+    def cancel_coalesced_updates(self):
+        """Cancel pending and running device updated callbacks of coalesced updates. Called on stop."""
+        if self._coalesced_update is not None:
+            self._coalesced_update.cancel()
+            self._coalesced_update = None
+        for task in list(self._coalesced_tasks):
+            task.cancel()
+
+    async def _run_device_updated_cbs(self):
+        """Call device updated callbacks."""
         for device_updated_cb in self.device_updated_cbs:
             # pylint: disable=not-callable
             await device_updated_cb(self)
@@ -61,6 +108,7 @@ class Device:
         telegram.payload = payload
         telegram.telegramtype = TelegramType.GROUP_RESPONSE \
             if response else TelegramType.GROUP_WRITE
+        telegram.priority = self.priority
         await self.xknx.telegrams.put(telegram)
 
     def state_addresses(self):
@@ -68,6 +116,31 @@ class Device:
         # pylint: disable=no-self-use
         return []
 
+    def remote_values(self):
+        """Yield RemoteValues of device and its nested devices."""
+        for attribute in self.__dict__.values():
+            if isinstance(attribute, RemoteValue):
+                yield attribute
+            elif isinstance(attribute, Device) and attribute is not self:
+                yield from attribute.remote_values()
+
+    def all_group_addresses(self):
+        """
+        Return all group addresses the device may be addressed by.
+
+        Collected from RemoteValue, GroupAddress and nested Device attributes.
+        Used by Devices for indexing - has_group_address() stays authoritative.
+        """
+        group_addresses = []
+        for attribute in self.__dict__.values():
+            if isinstance(attribute, RemoteValue):
+                group_addresses.extend(attribute.all_group_addresses())
+            elif isinstance(attribute, GroupAddress):
+                group_addresses.append(attribute)
+            elif isinstance(attribute, Device) and attribute is not self:
+                group_addresses.extend(attribute.all_group_addresses())
+        return group_addresses
+
     async def process(self, telegram):
         """Process incoming telegram."""
         if telegram.telegramtype == TelegramType.GROUP_WRITE:
@@ -0,0 +1,64 @@
+"""
+Module for receiving updated devices in batches.
+
+A DeviceUpdateSubscription is an async iterator yielding lists of devices updated
+since the previous batch. Each device is contained once per batch, in order of its
+first update. Updates are collected until the next event loop iteration or - if
+`interval` is set - for `interval` seconds after the first update of a batch.
+
+    subscription = xknx.devices.subscribe_device_updates(interval=0.1)
+    async for devices in subscription:
+        write_states(devices)
+"""
+import asyncio
+
+
+class DeviceUpdateSubscription:
+    """Class for receiving updated devices in batches."""
+
+    def __init__(self, devices, interval=0):
+        """Initialize DeviceUpdateSubscription class."""
+        self.devices = devices
+        self.interval = interval
+        self.closed = False
+        self._batch = []
+        # id() of devices within _batch - devices are not necessarily hashable
+        self._batch_ids = set()
+        self._batch_pending = asyncio.Event()
+
+    def device_updated(self, device):
+        """Add device to current batch. Called by Devices."""
+        if id(device) in self._batch_ids:
+            return
+        self._batch_ids.add(id(device))
+        self._batch.append(device)
+        self._batch_pending.set()
+
+    def close(self):
+        """Stop receiving updates. A pending batch is still delivered."""
+        if self.closed:
+            return
+        self.closed = True
+        self.devices.unsubscribe_device_updates(self)
+        self._batch_pending.set()
+
+    def __aiter__(self):
+        """Return async iterator."""
+        return self
+
+    async def __anext__(self):
+        """Wait for updates and return list of updated devices."""
+        await self._batch_pending.wait()
+        if not self.closed:
+            # collect further updates of this event loop iteration or interval
+            await asyncio.sleep(self.interval)
+        batch = self._batch
+        if not batch:
+            raise StopAsyncIteration
+        self._batch = []
+        self._batch_ids = set()
+        self._batch_pending.clear()
+        if self.closed:
+            # wake up for StopAsyncIteration
+            self._batch_pending.set()
+        return batch
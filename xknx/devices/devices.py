@@ -3,7 +3,10 @@ Module for handling a vector/array of devices.
 
 More or less an array with devices. Adds some search functionality to find devices.
 """
+from xknx.telegram import GroupAddress
+
 from .device import Device
+from .device_update_subscription import DeviceUpdateSubscription
 
 
 class Devices:
@@ -12,7 +15,10 @@ class Devices:
     def __init__(self):
         """Initialize Devices class."""
         self.__devices = []
+        self.__devices_by_group_address = None
+        self.group_address_generation = 0
         self.device_updated_cbs = []
+        self.device_update_subscriptions = []
 
     def register_device_updated_cb(self, device_updated_cb):
         """Register callback for devices beeing updated."""
@@ -22,16 +28,51 @@ class Devices:
         """Unregister callback for devices beeing updated."""
         self.device_updated_cbs.remove(device_updated_cb)
 
+    def subscribe_device_updates(self, interval=0):
+        """Return DeviceUpdateSubscription yielding batches of updated devices."""
+        subscription = DeviceUpdateSubscription(self, interval=interval)
+        self.device_update_subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe_device_updates(self, subscription):
+        """Stop passing updated devices to subscription."""
+        if subscription in self.device_update_subscriptions:
+            self.device_update_subscriptions.remove(subscription)
+            subscription.close()
+
     def __iter__(self):
         """Iterator."""
         yield from self.__devices
 
     def devices_by_group_address(self, group_address):
         """Return device(s) by group address."""
-        for device in self.__devices:
+        if not isinstance(group_address, GroupAddress):
+            for device in self.__devices:
+                if device.has_group_address(group_address):
+                    yield device
+            return
+        if self.__devices_by_group_address is None:
+            self._build_group_address_index()
+        for device in self.__devices_by_group_address.get(group_address.raw, ()):
             if device.has_group_address(group_address):
                 yield device
 
+    def _build_group_address_index(self):
+        """Build index from raw group address to devices."""
+        self.__devices_by_group_address = {}
+        for device in self.__devices:
+            self._add_to_group_address_index(device)
+
+    def _add_to_group_address_index(self, device):
+        """Add group addresses of device to index."""
+        for raw in {group_address.raw for group_address in device.all_group_addresses()}:
+            self.__devices_by_group_address.setdefault(raw, []).append(device)
+
+    def group_addresses_changed(self):
+        """Invalidate group address index. Called after group addresses of a device were reassigned."""
+        self.__devices_by_group_address = None
+        self.group_address_generation += 1
+
     def __getitem__(self, key):
         """Return device by name or by index."""
         for device in self.__devices:
@@ -58,9 +99,13 @@ class Devices:
             raise TypeError()
         device.register_device_updated_cb(self.device_updated)
         self.__devices.append(device)
+        if self.__devices_by_group_address is not None:
+            self._add_to_group_address_index(device)
 
     async def device_updated(self, device):
         """Call all registered device updated callbacks of device."""
+        for subscription in self.device_update_subscriptions:
+            subscription.device_updated(device)
         for device_updated_cb in self.device_updated_cbs:
             await device_updated_cb(device)
 
@@ -12,6 +12,7 @@ from xknx.remote_value import RemoteValueColorRGB as RV_RGB
 from xknx.remote_value import RemoteValueColorXyY as RV_XYY
 from xknx.remote_value import RemoteValueDpt2ByteUnsigned as RV_ABS
 from xknx.remote_value import RemoteValueDpt3 as RV_DIM
+from xknx.remote_value import RemoteValueRegistry
 from xknx.remote_value import RemoteValueScaling as RV_SCALE
 from xknx.remote_value import RemoteValueSwitch as RV_SWITCH
 
@@ -128,6 +129,69 @@ class Group(Device):
         self.clr_tw_ww = RV_SCALE(xknx, addr["CLR_TW_WW"], None, self.name, None, 0, 255)
         self.clr_tw_cw = RV_SCALE(xknx, addr["CLR_TW_CW"], None, self.name, None, 0, 255)
 
+        # remote values processing GroupValueWrite and GroupValueResponse telegrams
+        self._write_remote_values = RemoteValueRegistry(xknx, [
+            self.sw,
+            self.val_dim,
+            self.val,
+            #
+            # self.clr_xyy,
+            self.clr_cct_abs,
+            #
+            self.clr_rgb,
+            self.clr_rgb_bri,
+            self.clr_rgb_dim,
+            #
+            self.clr_r,
+            self.clr_r_bri,
+            self.clr_r_dim,
+            self.clr_r_sw,
+            #
+            self.clr_g,
+            self.clr_g_bri,
+            self.clr_g_dim,
+            self.clr_g_sw,
+            #
+            self.clr_b,
+            self.clr_b_bri,
+            self.clr_b_dim,
+            self.clr_b_sw,
+            #
+            self.clr_h,
+            self.clr_h_dim,
+            #
+            self.clr_s,
+            self.clr_s_dim,
+            #
+            self.clr_cct,
+            self.clr_cct_dim,
+            #
+            self.clr_cct_abs_in,
+        ])
+        # status remote values answering GroupValueRead telegrams
+        self._read_remote_values = RemoteValueRegistry(xknx, [
+            self.sw_stat,
+            self.val_stat,
+            #
+            self.clr_rgb_stat,
+            #
+            self.clr_r_stat,
+            self.clr_r_sw_stat,
+            #
+            self.clr_g_stat,
+            self.clr_g_sw_stat,
+            #
+            self.clr_b_stat,
+            self.clr_b_sw_stat,
+            #
+            self.clr_h_stat,
+            #
+            self.clr_s_stat,
+            #
+            self.clr_cct_stat,
+            self.clr_cct_abs_stat,
+        ])
+
     def update(self, addresses):
         self.sw.group_addresses = addresses["SW"]
         self.sw_stat.group_addresses = addresses["SW_STAT"]
@@ -203,64 +267,12 @@ class Group(Device):
     def has_group_address(self, group_address):
         """Test if device has given group address. Not used for Status"""
         return (
-            self.sw.has_group_address(group_address)
-            or self.val.has_group_address(group_address)  # noqa W503
-            or self.val_dim.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_xyy.has_group_address(group_address)  # noqa W503
-            or self.clr_cct_abs.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_rgb.has_group_address(group_address)  # noqa W503
-            or self.clr_rgb_bri.has_group_address(group_address)  # noqa W503
-            or self.clr_rgb_dim.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_r.has_group_address(group_address)  # noqa W503
-            or self.clr_r_bri.has_group_address(group_address)  # noqa W503
-            or self.clr_r_dim.has_group_address(group_address)  # noqa W503
-            or self.clr_r_sw.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_g.has_group_address(group_address)  # noqa W503
-            or self.clr_g_bri.has_group_address(group_address)  # noqa W503
-            or self.clr_g_dim.has_group_address(group_address)  # noqa W503
-            or self.clr_g_sw.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_b.has_group_address(group_address)  # noqa W503
-            or self.clr_b_bri.has_group_address(group_address)  # noqa W503
-            or self.clr_b_dim.has_group_address(group_address)  # noqa W503
-            or self.clr_b_sw.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_h.has_group_address(group_address)  # noqa W503
-            or self.clr_h_dim.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_s.has_group_address(group_address)  # noqa W503
-            or self.clr_s_dim.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_cct.has_group_address(group_address)  # noqa W503
-            or self.clr_cct_dim.has_group_address(group_address)  # noqa W503
-            or self.clr_cct_abs_in.has_group_address(group_address)  # noqa W503
+            self._write_remote_values.has_group_address(group_address)
             # Status for group read requests
             # sw and val_stat needed in GW function
-            or self.sw_stat.has_group_address(group_address)  # noqa W503
-            or self.val_stat.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_rgb_stat.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_r_stat.has_group_address(group_address)  # noqa W503
-            or self.clr_r_sw_stat.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_g_stat.has_group_address(group_address)  # noqa W503
-            or self.clr_g_sw_stat.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_b_stat.has_group_address(group_address)  # noqa W503
-            or self.clr_b_sw_stat.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_h_stat.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_s_stat.has_group_address(group_address)  # noqa W503
-            #
-            or self.clr_cct_stat.has_group_address(group_address)  # noqa W503
-            or self.clr_cct_abs_stat.has_group_address(group_address)  # noqa W503
+            or self._read_remote_values.has_group_address(group_address)  # noqa W503
             #
+            or self.clr_xyy.has_group_address(group_address)  # noqa W503
             or self.clr_tw_ww.has_group_address(group_address)  # noqa W503
             or self.clr_tw_cw.has_group_address(group_address)  # noqa W503
         )
@@ -277,65 +289,11 @@ class Group(Device):
 
     async def process_group_write(self, telegram):
         """Process incoming GROUP WRITE telegram."""
-        await self.sw.process(telegram)
-        await self.val_dim.process(telegram)
-        await self.val.process(telegram)
-        #
-        # await self.clr_xyy.process(telegram)
-        await self.clr_cct_abs.process(telegram)
-        #
-        await self.clr_rgb.process(telegram)
-        await self.clr_rgb_bri.process(telegram)
-        await self.clr_rgb_dim.process(telegram)
-        #
-        await self.clr_r.process(telegram)
-        await self.clr_r_bri.process(telegram)
-        await self.clr_r_dim.process(telegram)
-        await self.clr_r_sw.process(telegram)
-        #
-        await self.clr_g.process(telegram)
-        await self.clr_g_bri.process(telegram)
-        await self.clr_g_dim.process(telegram)
-        await self.clr_g_sw.process(telegram)
-        #
-        await self.clr_b.process(telegram)
-        await self.clr_b_bri.process(telegram)
-        await self.clr_b_dim.process(telegram)
-        await self.clr_b_sw.process(telegram)
-        #
-        await self.clr_h.process(telegram)
-        await self.clr_h_dim.process(telegram)
-        #
-        await self.clr_s.process(telegram)
-        await self.clr_s_dim.process(telegram)
-        #
-        await self.clr_cct.process(telegram)
-        await self.clr_cct_dim.process(telegram)
-        #
-        await self.clr_cct_abs_in.process(telegram)
+        await self._write_remote_values.process(telegram)
 
     async def process_group_read(self, telegram):
         """Process incoming GroupValueRead telegrams."""
-        await self.sw_stat.process_read(telegram)
-        await self.val_stat.process_read(telegram)
-        #
-        await self.clr_rgb_stat.process_read(telegram)
-        #
-        await self.clr_r_stat.process_read(telegram)
-        await self.clr_r_sw_stat.process_read(telegram)
-        #
-        await self.clr_g_stat.process_read(telegram)
-        await self.clr_g_sw_stat.process_read(telegram)
-        #
-        await self.clr_b_stat.process_read(telegram)
-        await self.clr_b_sw_stat.process_read(telegram)
-        #
-        await self.clr_h_stat.process_read(telegram)
-        #
-        await self.clr_s_stat.process_read(telegram)
-        #
-        await self.clr_cct_stat.process_read(telegram)
-        await self.clr_cct_abs_stat.process_read(telegram)
+        await self._read_remote_values.process_read(telegram)
 
     def __eq__(self, other):
         """Equal operator."""
@@ -12,7 +12,7 @@ It provides functionality for
 """
 from xknx.remote_value import (
     RemoteValueColorRGB, RemoteValueColorRGBW, RemoteValueDpt2ByteUnsigned,
-    RemoteValueScaling, RemoteValueSwitch)
+    RemoteValueRegistry, RemoteValueScaling, RemoteValueSwitch)
 
 from .device import Device
 
@@ -96,6 +96,14 @@ class Light(Device):
         self.min_kelvin = min_kelvin
         self.max_kelvin = max_kelvin
 
+        self._remote_values = RemoteValueRegistry(xknx, [
+            self.switch,
+            self.color,
+            self.rgbw,
+            self.brightness,
+            self.tunable_white,
+            self.color_temperature])
+
     @property
     def supports_brightness(self):
         """Return if light supports brightness."""
@@ -172,12 +180,7 @@ class Light(Device):
 
     def has_group_address(self, group_address):
         """Test if device has given group address."""
-        return (self.switch.has_group_address(group_address) or
-                self.brightness.has_group_address(group_address) or
-                self.color.has_group_address(group_address) or
-                self.rgbw.has_group_address(group_address) or
-                self.tunable_white.has_group_address(group_address) or
-                self.color_temperature.has_group_address(group_address))
+        return self._remote_values.has_group_address(group_address)
 
     def __str__(self):
         """Return object as readable string."""
@@ -323,12 +326,7 @@ class Light(Device):
 
     async def process_group_write(self, telegram):
         """Process incoming GROUP WRITE telegram."""
-        await self.switch.process(telegram)
-        await self.color.process(telegram)
-        await self.rgbw.process(telegram)
-        await self.brightness.process(telegram)
-        await self.tunable_white.process(telegram)
-        await self.color_temperature.process(telegram)
+        await self._remote_values.process(telegram)
 
     def __eq__(self, other):
         """Equal operator."""
@@ -20,7 +20,8 @@ class Sensor(Device):
                  group_address_state=None,
                  sync_state=True,
                  value_type=None,
-                 device_updated_cb=None):
+                 device_updated_cb=None,
+                 deadband=None):
         """Initialize Sensor class."""
         # pylint: disable=too-many-arguments
         super().__init__(xknx, name, device_updated_cb)
@@ -31,7 +32,8 @@ class Sensor(Device):
             sync_state=sync_state,
             value_type=value_type,
             device_name=self.name,
-            after_update_cb=self.after_update)
+            after_update_cb=self.after_update,
+            deadband=deadband)
 
     @classmethod
     def from_config(cls, xknx, name, config):
@@ -39,12 +41,14 @@ class Sensor(Device):
         group_address_state = config.get('group_address_state')
         sync_state = config.get('sync_state', True)
         value_type = config.get('value_type')
+        deadband = config.get('deadband')
 
         return cls(xknx,
                    name,
                    group_address_state=group_address_state,
                    sync_state=sync_state,
-                   value_type=value_type)
+                   value_type=value_type,
+                   deadband=deadband)
 
     def has_group_address(self, group_address):
         """Test if device has given group address."""
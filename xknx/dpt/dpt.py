@@ -45,6 +45,10 @@ class DPTBase:
     @staticmethod
     def test_bytesarray(raw, length):
         """Test if array of raw bytes has the correct length and values of correct type."""
+        if isinstance(raw, (bytes, bytearray)):
+            if len(raw) != length:
+                raise ConversionError("Invalid raw bytes", raw=raw)
+            return
         if not isinstance(raw, (tuple, list)) \
                 or len(raw) != length \
                 or any(not isinstance(byte, int) for byte in raw) \
@@ -81,17 +85,18 @@ class DPTBinary(DPTBase):
 
 
 class DPTArray(DPTBase):
-    """The DPTArray is a base class for all datatypes appended to the KNX telegram."""
+    """The DPTArray is a base class for all datatypes appended to the KNX telegram. The value is stored as bytes."""
 
     # pylint: disable=too-few-public-methods
     def __init__(self, value):
         """Initialize DPTArray class."""
-        if isinstance(value, int):
-            self.value = (value,)
-        elif isinstance(value, (list, bytes)):
-            self.value = tuple(value,)
-        elif isinstance(value, tuple):
+        if isinstance(value, bytes):
             self.value = value
+        elif isinstance(value, (int, list, tuple, bytearray, memoryview)):
+            try:
+                self.value = bytes((value,)) if isinstance(value, int) else bytes(value)
+            except (ValueError, TypeError):
+                raise ConversionError("Cant init DPTArray", value=value)
         else:
             raise TypeError()
 
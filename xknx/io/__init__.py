@@ -5,16 +5,22 @@ This package contains all objects managing Tunneling and Routing Connections..
 - GatewayScanner searches for available KNX/IP devices in the local network.
 - Routing uses UDP/Multicast to communicate with KNX/IP device.
 - Tunnelling uses UDP packets and builds a static tunnel with KNX/IP device.
+- TunnelPool opens several tunnels to one KNX/IP device and spreads outgoing telegrams across them.
+- MultiGateway connects several KNX/IP devices and sends telegrams through the one responsible for their group address.
 """
 # flake8: noqa
 from .connect import Connect
 from .connectionstate import ConnectionState
 from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
 from .disconnect import Disconnect
+from .duplicate_filter import DuplicateFilter
 from .gateway_scanner import GatewayScanFilter, GatewayScanner
 from .knxip_interface import ConnectionConfig, ConnectionType, KNXIPInterface
+from .multi_gateway import MultiGateway
 from .request_response import RequestResponse
 from .routing import Routing
 from .tunnel import Tunnel
+from .tunnel_pool import TunnelPool
 from .tunnelling import Tunnelling
+from .tunnelling_sender import TunnellingSender
 from .udp_client import UDPClient
@@ -33,6 +33,5 @@ class Connect(RequestResponse):
     def on_success_hook(self, knxipframe):
         """Set communication channel and identifier after having received a valid answer."""
         self.communication_channel = knxipframe.body.communication_channel
+        # individual address assigned to the tunnel - used by Tunnel, xknx.own_address is left untouched
         self.identifier = knxipframe.body.identifier
-        # Use the address they gave us
-        self.xknx.own_address.raw = self.identifier
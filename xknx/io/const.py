@@ -2,3 +2,12 @@
 
 DEFAULT_MCAST_GRP = '224.0.23.12'
 DEFAULT_MCAST_PORT = 3671
+
+# Upper bound for a single received datagram - KNXnet/IP frames are far smaller.
+UDP_RECEIVE_BUFFER_SIZE = 4096
+# Maximum number of datagrams drained from a socket within one wakeup.
+DEFAULT_UDP_MAX_BATCH_SIZE = 64
+# Maximum number of telegrams buffered while a tunnel is disconnected.
+TUNNEL_BUFFER_SIZE = 1000
+# Seconds within which a telegram received through several connections is a duplicate.
+DUPLICATE_TELEGRAM_WINDOW = 2.0
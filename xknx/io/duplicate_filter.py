@@ -0,0 +1,57 @@
+"""
+Module for detecting telegrams received through several connections.
+
+Tunnelling channels to one gateway - and gateways of lines connected by couplers - all
+receive the same bus traffic. The DuplicateFilter counts how often every telegram (source
+address, group address, type and payload) was received per connection: the n-th copy
+received on one connection is the same telegram as the n-th copy received on any other
+connection. Telegrams sent repeatedly on the bus are hence passed on every time.
+
+Counters are discarded once a telegram was not received for `window` seconds.
+"""
+import collections
+import time
+
+from .const import DUPLICATE_TELEGRAM_WINDOW
+
+
+class DuplicateFilter:
+    """Class for detecting telegrams received through several connections."""
+
+    def __init__(self, window=DUPLICATE_TELEGRAM_WINDOW):
+        """Initialize DuplicateFilter class."""
+        self.window = window
+        # key of received telegram -> [last received, number passed on, {connection: number received}]
+        self._received = collections.OrderedDict()
+
+    def __len__(self):
+        """Return number of telegrams tracked."""
+        return len(self._received)
+
+    @staticmethod
+    def _key(telegram):
+        """Return key of telegram - equal for all copies of the telegram."""
+        payload = telegram.payload
+        return (telegram.source_address, telegram.group_address, telegram.telegramtype,
+                None if payload is None else (type(payload), payload.value))
+
+    def is_duplicate(self, connection, telegram):
+        """Test if telegram received through connection was received through another connection already."""
+        now = time.monotonic()
+        while self._received:
+            oldest = next(iter(self._received.values()))
+            if now - oldest[0] <= self.window:
+                break
+            self._received.popitem(last=False)
+        key = self._key(telegram)
+        entry = self._received.get(key)
+        if entry is None:
+            entry = self._received[key] = [now, 0, {}]
+        else:
+            entry[0] = now
+            self._received.move_to_end(key)
+        received = entry[2][connection] = entry[2].get(connection, 0) + 1
+        if received <= entry[1]:
+            return True
+        entry[1] += 1
+        return False
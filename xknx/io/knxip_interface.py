@@ -6,6 +6,7 @@ KNXIPInterface manages KNX/IP Tunneling or Routing connections.
 * provides callbacks after having received a telegram from the network.
 
 """
+import asyncio
 import ipaddress
 from enum import Enum
 from platform import system as get_os_name
@@ -16,8 +17,10 @@ from xknx.exceptions import XKNXException
 
 from .const import DEFAULT_MCAST_PORT
 from .gateway_scanner import GatewayScanFilter, GatewayScanner
+from .multi_gateway import MultiGateway
 from .routing import Routing
 from .tunnel import Tunnel
+from .tunnel_pool import TunnelPool
 
 
 class ConnectionType(Enum):
@@ -26,6 +29,8 @@ class ConnectionType(Enum):
     AUTOMATIC = 0
     TUNNELING = 1
     ROUTING = 2
+    TUNNELING_POOL = 3
+    MULTI_GATEWAY = 4
 
 
 class ConnectionConfig:
@@ -37,11 +42,18 @@ class ConnectionConfig:
         * AUTOMATIC for using GatewayScanner for searching and finding KNX/IP devices in the network.
         * TUNNELING connect to a specific KNX/IP tunneling device.
         * ROUTING use KNX/IP multicast routing.
+        * TUNNELING_POOL open several tunnelling channels to a specific KNX/IP tunneling device.
+        * MULTI_GATEWAY connect all `gateways` at once.
     * local_ip: Local ip of the interface though which KNXIPInterface should connect.
     * gateway_ip: IP of KNX/IP tunneling device.
     * gateway_port: Port of KNX/IP tunneling device.
     * auto_reconnect: Auto reconnect to KNX/IP tunneling device if connection cannot be established.
     * auto_reconnect_wait: Wait n seconds before trying to reconnect to KNX/IP tunneling device.
+    * auto_reconnect_max_wait: Upper bound in seconds of the wait - doubled after every failed reconnect.
+    * window_size: Number of unacknowledged tunnelling requests the KNX/IP tunneling device accepts.
+    * tunnel_channels: Number of tunnelling channels opened with TUNNELING_POOL.
+    * gateways: ConnectionConfigs of the KNX/IP devices connected with MULTI_GATEWAY.
+    * address_filters: Patterns of group addresses this KNX/IP device is responsible for within MULTI_GATEWAY.
     * scan_filter: For AUTOMATIC connection, limit scan with the given filter
     * bind_to_multicast_addr: Bind to the multicast address instead of the local IP (ROUTING only)
     """
@@ -56,7 +68,12 @@ class ConnectionConfig:
                  auto_reconnect: bool = False,
                  auto_reconnect_wait: int = 3,
                  scan_filter: GatewayScanFilter = GatewayScanFilter(),
-                 bind_to_multicast_addr: bool = True):
+                 bind_to_multicast_addr: bool = True,
+                 window_size: int = 1,
+                 auto_reconnect_max_wait: int = 60,
+                 tunnel_channels: int = 2,
+                 gateways: list = None,
+                 address_filters: list = None):
         """Initialize ConnectionConfig class."""
         # pylint: disable=too-many-arguments
         self.connection_type = connection_type
@@ -66,7 +83,12 @@ class ConnectionConfig:
         self.auto_reconnect = auto_reconnect
         self.auto_reconnect_wait = auto_reconnect_wait
         self.bind_to_multicast_addr = bind_to_multicast_addr
-        if connection_type == ConnectionType.TUNNELING:
+        self.window_size = window_size
+        self.auto_reconnect_max_wait = auto_reconnect_max_wait
+        self.tunnel_channels = tunnel_channels
+        self.gateways = gateways or []
+        self.address_filters = address_filters
+        if connection_type in (ConnectionType.TUNNELING, ConnectionType.TUNNELING_POOL):
             scan_filter.tunnelling = True
         elif connection_type == ConnectionType.ROUTING:
             scan_filter.routing = True
@@ -80,11 +102,13 @@ class ConnectionConfig:
 class KNXIPInterface():
     """Class for managing KNX/IP Tunneling or Routing connections."""
 
-    def __init__(self, xknx, connection_config=ConnectionConfig()):
+    def __init__(self, xknx, connection_config=ConnectionConfig(), telegram_received_callback=None):
         """Initialize KNXIPInterface class."""
         self.xknx = xknx
         self.interface = None
         self.connection_config = connection_config
+        # received telegrams are passed to this callback instead of queued (used by MultiGateway)
+        self.telegram_received_callback = telegram_received_callback
 
     async def start(self):
         """Start interface. Connecting KNX/IP device with the selected method."""
@@ -99,7 +123,21 @@ class KNXIPInterface():
                 self.connection_config.gateway_ip,
                 self.connection_config.gateway_port,
                 self.connection_config.auto_reconnect,
-                self.connection_config.auto_reconnect_wait)
+                self.connection_config.auto_reconnect_wait,
+                self.connection_config.window_size,
+                self.connection_config.auto_reconnect_max_wait)
+        elif self.connection_config.connection_type == ConnectionType.TUNNELING_POOL:
+            await self.start_tunnel_pool(
+                self.connection_config.local_ip,
+                self.connection_config.gateway_ip,
+                self.connection_config.gateway_port,
+                self.connection_config.tunnel_channels,
+                self.connection_config.auto_reconnect,
+                self.connection_config.auto_reconnect_wait,
+                self.connection_config.window_size,
+                self.connection_config.auto_reconnect_max_wait)
+        elif self.connection_config.connection_type == ConnectionType.MULTI_GATEWAY:
+            await self.start_multi_gateway(self.connection_config.gateways)
         else:
             await self.start_automatic(self.connection_config.scan_filter)
 
@@ -118,13 +156,15 @@ class KNXIPInterface():
                                         gateway.ip_addr,
                                         gateway.port,
                                         self.connection_config.auto_reconnect,
-                                        self.connection_config.auto_reconnect_wait)
+                                        self.connection_config.auto_reconnect_wait,
+                                        self.connection_config.window_size,
+                                        self.connection_config.auto_reconnect_max_wait)
         elif gateway.supports_routing:
             bind_to_multicast_addr = get_os_name() != "Darwin"  # = Mac OS
             await self.start_routing(gateway.local_ip, bind_to_multicast_addr)
 
     async def start_tunnelling(self, local_ip, gateway_ip, gateway_port,
-                               auto_reconnect, auto_reconnect_wait):
+                               auto_reconnect, auto_reconnect_wait, window_size=1, auto_reconnect_max_wait=60):
         """Start KNX/IP tunnel."""
         # pylint: disable=too-many-arguments
         validate_ip(gateway_ip, address_name="Gateway IP address")
@@ -140,7 +180,41 @@ class KNXIPInterface():
             gateway_port=gateway_port,
             telegram_received_callback=self.telegram_received,
             auto_reconnect=auto_reconnect,
-            auto_reconnect_wait=auto_reconnect_wait)
+            auto_reconnect_wait=auto_reconnect_wait,
+            window_size=window_size,
+            auto_reconnect_max_wait=auto_reconnect_max_wait)
+        await self.interface.start()
+
+    async def start_tunnel_pool(self, local_ip, gateway_ip, gateway_port, channels,
+                                auto_reconnect, auto_reconnect_wait, window_size=1, auto_reconnect_max_wait=60):
+        """Start several KNX/IP tunnels to one gateway."""
+        # pylint: disable=too-many-arguments
+        validate_ip(gateway_ip, address_name="Gateway IP address")
+        if local_ip is None:
+            local_ip = self.find_local_ip(gateway_ip=gateway_ip)
+        validate_ip(local_ip, address_name="Local IP address")
+        self.xknx.logger.debug("Starting %s tunnels from %s to %s:%s", channels, local_ip, gateway_ip, gateway_port)
+        self.interface = TunnelPool(
+            self.xknx,
+            local_ip=local_ip,
+            gateway_ip=gateway_ip,
+            gateway_port=gateway_port,
+            channels=channels,
+            telegram_received_callback=self.telegram_received,
+            auto_reconnect=auto_reconnect,
+            auto_reconnect_wait=auto_reconnect_wait,
+            window_size=window_size,
+            auto_reconnect_max_wait=auto_reconnect_max_wait)
+        await self.interface.start()
+
+    async def start_multi_gateway(self, connection_configs):
+        """Connect several KNX/IP devices at once."""
+        self.xknx.logger.debug("Connecting %s gateways", len(connection_configs))
+        self.interface = MultiGateway(
+            self.xknx,
+            [KNXIPInterface(self.xknx, connection_config=connection_config)
+             for connection_config in connection_configs],
+            telegram_received_callback=self.telegram_received)
         await self.interface.start()
 
     async def start_routing(self, local_ip, bind_to_multicast_addr):
@@ -162,8 +236,15 @@ class KNXIPInterface():
 
     def telegram_received(self, telegram):
         """Put received telegram into queue. Callback for having received telegram."""
-        self.xknx.loop.create_task(
-            self.xknx.telegrams.put(telegram))
+        if self.telegram_received_callback is not None:
+            self.telegram_received_callback(telegram)
+            return
+        try:
+            self.xknx.telegrams.put_nowait(telegram)
+        except asyncio.QueueFull:
+            # bus traffic can not wait for a free slot (OverflowPolicy.BLOCK) - counted within xknx.telegrams.drop_count
+            self.xknx.logger.warning("Incoming telegram queue full. Dropping %s (%s dropped so far)",
+                                     telegram, self.xknx.telegrams.drop_count)
 
     async def send_telegram(self, telegram):
         """Send telegram to connected device (either Tunneling or Routing)."""
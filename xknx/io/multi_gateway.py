@@ -0,0 +1,113 @@
+"""
+Abstraction for connecting several KNX/IP gateways at once.
+
+Buildings with several lines may connect a KNX/IP interface to each of them. A MultiGateway
+holds one KNXIPInterface per gateway (Tunneling, TunnelPool, Routing or Automatic) and
+
+* sends every outgoing telegram through the gateway responsible for its group address -
+  the first gateway whose `address_filters` (e.g. ['1/*/*'] for main group 1) match it.
+  Group addresses no gateway is responsible for are sent through the gateways without
+  `address_filters`, or the first gateway if all have some.
+* fails over to another connected gateway while the responsible gateway is disconnected
+  (e.g. after its heartbeat failed). Telegrams already buffered by the disconnected tunnel
+  are sent once it is reconnected - set XKNX.outgoing_ttl to drop stale ones instead.
+* merges the telegrams received from all gateways. Telegrams forwarded by couplers are
+  passed on once (see DuplicateFilter); telegrams sent by xknx itself are dropped.
+
+Gateways which can not be connected on start are skipped.
+"""
+import functools
+
+from xknx.exceptions import XKNXException
+from xknx.telegram import AddressFilter, CompiledAddressFilter
+
+from .duplicate_filter import DuplicateFilter
+from .tunnel import Tunnel
+from .tunnel_pool import TunnelPool
+
+
+class MultiGateway():
+    """Class for connecting several KNX/IP gateways at once."""
+
+    def __init__(self, xknx, gateways, telegram_received_callback=None):
+        """Initialize MultiGateway class with KNXIPInterfaces."""
+        self.xknx = xknx
+        self.gateways = list(gateways)
+        self.telegram_received_callback = telegram_received_callback
+        # gateway -> CompiledAddressFilter of group addresses it is responsible for or None
+        self._address_filters = {}
+        for gateway in self.gateways:
+            gateway.telegram_received_callback = functools.partial(self.telegram_received, gateway)
+            address_filters = gateway.connection_config.address_filters
+            self._address_filters[gateway] = CompiledAddressFilter.from_filters(
+                [AddressFilter(address_filter) for address_filter in address_filters]) \
+                if address_filters else None
+        self.duplicate_filter = DuplicateFilter()
+
+        # statistics
+        self.duplicate_telegrams = 0
+        self.failover_telegrams = 0
+
+    async def start(self):
+        """Connect all gateways. Gateways which can not be connected are skipped."""
+        for gateway in list(self.gateways):
+            try:
+                await gateway.start()
+            except (OSError, XKNXException) as ex:
+                self.xknx.logger.warning("Could not connect gateway %s: %s", gateway.connection_config.gateway_ip, ex)
+                await gateway.stop()
+                self.gateways.remove(gateway)
+        if not self.gateways:
+            raise XKNXException("Could not establish connection")
+
+    async def stop(self):
+        """Disconnect all gateways."""
+        for gateway in self.gateways:
+            await gateway.stop()
+
+    @staticmethod
+    def connected(gateway):
+        """Test if gateway is connected. Routing has no connection state and is always connected."""
+        return gateway.interface is not None and getattr(gateway.interface, 'connected', True)
+
+    def gateways_for(self, group_address):
+        """Return gateways in order of preference for sending telegrams to group address."""
+        responsible = [gateway for gateway in self.gateways
+                       if self._address_filters[gateway] is not None and
+                       self._address_filters[gateway].match(group_address)]
+        default = [gateway for gateway in self.gateways if self._address_filters[gateway] is None]
+        others = [gateway for gateway in self.gateways if gateway not in responsible and gateway not in default]
+        return responsible + default + others
+
+    async def send_telegram(self, telegram):
+        """Send telegram through the responsible gateway - or the next connected one."""
+        gateways = self.gateways_for(telegram.group_address)
+        gateway = next((gateway for gateway in gateways if self.connected(gateway)), gateways[0])
+        if gateway is not gateways[0]:
+            self.failover_telegrams += 1
+            self.xknx.logger.debug("Gateway %s disconnected. Sending %s through %s",
+                                   gateways[0].connection_config.gateway_ip, telegram,
+                                   gateway.connection_config.gateway_ip)
+        await gateway.send_telegram(telegram)
+
+    def _own_addresses(self):
+        """Return individual addresses telegrams sent by xknx carry - own_address for Routing, the assigned address per tunnel."""
+        addresses = {self.xknx.own_address}
+        for gateway in self.gateways:
+            if isinstance(gateway.interface, Tunnel):
+                addresses.add(gateway.interface.src_address)
+            elif isinstance(gateway.interface, TunnelPool):
+                addresses.update(tunnel.src_address for tunnel in gateway.interface.tunnels)
+        return addresses
+
+    def telegram_received(self, gateway, telegram):
+        """Pass telegram received by gateway on - unless it was received through another gateway already."""
+        if self.telegram_received_callback is None:
+            return
+        if telegram.source_address in self._own_addresses():
+            # sent through another gateway and forwarded by couplers
+            return
+        if self.duplicate_filter.is_duplicate(gateway, telegram):
+            self.duplicate_telegrams += 1
+            return
+        self.telegram_received_callback(telegram)
@@ -2,13 +2,24 @@
 Abstraction for handling KNX/IP routing.
 
 Routing uses UDP Multicast to broadcast and receive KNX/IP messages.
+
+Routing indications addressed to group addresses nobody is interested in (see
+AddressPrefilter) are dropped based on their raw bytes - before they are parsed.
 """
-from xknx.knxip import APCICommand, KNXIPFrame, KNXIPServiceType
+from xknx.knxip import APCICommand, CEMIFlags, KNXIPFrame, KNXIPServiceType
 from xknx.telegram import TelegramDirection
 
 from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
 from .udp_client import UDPClient
 
+# service type of routing indications within the KNXnet/IP header
+_ROUTING_INDICATION = KNXIPServiceType.ROUTING_INDICATION.value.to_bytes(2, 'big')
+# offset of the cEMI frame - behind the KNXnet/IP header
+_CEMI_OFFSET = 6
+# APCI of GroupValueRead, GroupValueResponse and GroupValueWrite
+_GROUP_APCI = frozenset(cmd.value for cmd in (
+    APCICommand.GROUP_READ, APCICommand.GROUP_RESPONSE, APCICommand.GROUP_WRITE))
+
 
 class Routing():
     """Class for handling KNX/IP routing."""
@@ -23,12 +34,32 @@ class Routing():
                                    (local_ip, 0),
                                    (DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT),
                                    multicast=True,
-                                   bind_to_multicast_addr=bind_to_multicast_addr)
+                                   bind_to_multicast_addr=bind_to_multicast_addr,
+                                   prefilter=self.prefilter)
 
         self.udpclient.register_callback(
             self.response_rec_callback,
             [KNXIPServiceType.ROUTING_INDICATION])
 
+    def prefilter(self, raw):
+        """Test if raw KNX/IP frame may be of interest. Only routing indications to group addresses of interest pass."""
+        if self.xknx.address_prefilter.allowed_addresses() is None or \
+                raw[2:4] != _ROUTING_INDICATION:
+            return True
+        # cEMI: message code, additional info length, additional info, control fields,
+        # source address, destination address, length, TPCI/APCI
+        if len(raw) < _CEMI_OFFSET + 2:
+            # malformed - leave it to the parser
+            return True
+        control = _CEMI_OFFSET + 2 + raw[_CEMI_OFFSET + 1]
+        if len(raw) < control + 9:
+            return True
+        if not (raw[control] << 8 | raw[control + 1]) & CEMIFlags.DESTINATION_GROUP_ADDRESS:
+            return False
+        if (raw[control + 7] << 8 | raw[control + 8]) & 0xFFC0 not in _GROUP_APCI:
+            return False
+        return self.xknx.address_prefilter.allows(raw[control + 4] << 8 | raw[control + 5])
+
     def response_rec_callback(self, knxipframe, _):
         """Verify and handle knxipframe. Callback from internal udpclient."""
         if knxipframe.body.src_addr == self.xknx.own_address:
@@ -2,17 +2,26 @@
 Abstraction for handling KNX/IP tunnels.
 
 Tunnels connect to KNX/IP devices directly via UDP and build a static UDP connection.
+
+If a TUNNELLING_REQUEST is not acknowledged or the heartbeat fails, the tunnel is
+reconnected in the background - with exponentially increasing waits between failed
+attempts (`auto_reconnect_wait` up to `auto_reconnect_max_wait` seconds). Telegrams
+sent while the tunnel is disconnected and telegrams which were not acknowledged are
+buffered and sent in order once a new channel is established. Stale telegrams
+(Telegram.deadline) are dropped from the buffer.
 """
 import asyncio
+import collections
 
 from xknx.exceptions import XKNXException
 from xknx.knxip import KNXIPFrame, KNXIPServiceType, TunnellingRequest
-from xknx.telegram import TelegramDirection
+from xknx.telegram import PhysicalAddress, TelegramDirection
 
 from .connect import Connect
 from .connectionstate import ConnectionState
+from .const import TUNNEL_BUFFER_SIZE
 from .disconnect import Disconnect
-from .tunnelling import Tunnelling
+from .tunnelling_sender import TunnellingSender
 from .udp_client import UDPClient
 
 
@@ -23,7 +32,7 @@ class Tunnel():
 
     def __init__(self, xknx, src_address, local_ip, gateway_ip, gateway_port,
                  telegram_received_callback=None, auto_reconnect=False,
-                 auto_reconnect_wait=3):
+                 auto_reconnect_wait=3, window_size=1, auto_reconnect_max_wait=60):
         """Initialize Tunnel class."""
         # pylint: disable=too-many-arguments
         self.xknx = xknx
@@ -34,17 +43,35 @@ class Tunnel():
         self.telegram_received_callback = telegram_received_callback
 
         self.udp_client = None
+        self.tunnelling_sender = TunnellingSender(xknx, window_size=window_size)
         self.init_udp_client()
 
-        self.sequence_number = 0
         self.communication_channel = None
         self.number_heartbeat_failed = 0
 
         self.auto_reconnect = auto_reconnect
         self.auto_reconnect_wait = auto_reconnect_wait
+        self.auto_reconnect_max_wait = auto_reconnect_max_wait
+
+        # True once the channel is established and buffered telegrams were sent
+        self.connected = False
+        # telegrams sent while disconnected
+        self._buffer = collections.deque()
+        self.buffer_size = TUNNEL_BUFFER_SIZE
+        # telegrams which were not acknowledged - sent again before the buffer
+        self._resend = collections.deque()
+        # generation of the TunnellingSender the connection was lost in
+        self._lost_generation = None
+
+        # statistics
+        self.reconnect_attempts = 0
+        self.reconnects = 0
+        self.last_reconnect_duration = None
+        self.dropped_telegrams = 0
 
         self._heartbeat_task = None
         self._reconnect_task = None
+        self._confirm_tasks = set()
 
     def init_udp_client(self):
         """Initialize udp_client."""
@@ -54,6 +81,7 @@ class Tunnel():
 
         self.udp_client.register_callback(
             self.tunnel_reqest_received, [TunnellingRequest.service_type])
+        self.tunnelling_sender.set_udp_client(self.udp_client)
 
     def tunnel_reqest_received(self, knxipframe, udp_client):
         """Handle incoming tunnel request."""
@@ -88,30 +116,71 @@ class Tunnel():
 
     async def connect(self):
         """Connect/build tunnel."""
+        if await self._connect() or self._reconnect_task is not None:
+            # connected - or lost again while sending buffered telegrams and reconnecting
+            return
+        if self.auto_reconnect:
+            msg = "Cannot connect to KNX. Retry in {} seconds.".format(
+                self.auto_reconnect_wait
+            )
+            self.xknx.logger.warning(msg)
+            self._start_reconnect(wait=self.auto_reconnect_wait)
+            return
+        raise XKNXException("Could not establish connection")
+
+    async def _connect(self):
+        """Build tunnel and send buffered telegrams. Return True if the tunnel is connected."""
         connect = Connect(
             self.xknx,
             self.udp_client)
         await connect.start()
         if not connect.success:
-            if self.auto_reconnect:
-                msg = "Cannot connect to KNX. Retry in {} seconds.".format(
-                    self.auto_reconnect_wait
-                )
-                self.xknx.logger.warning(msg)
-                task = self.xknx.loop.create_task(self.schedule_reconnect())
-                self._reconnect_task = task
-                return
-            raise XKNXException("Could not establish connection")
+            return False
         self.xknx.logger.debug(
             "Tunnel established communication_channel=%s, id=%s",
             connect.communication_channel,
             connect.identifier)
-        self._reconnect_task = None
+        # individual address assigned by the gateway - differs per channel
+        self.src_address = PhysicalAddress(connect.identifier)
         self.communication_channel = connect.communication_channel
-        self.sequence_number = 0
+        self.tunnelling_sender.reset(self.communication_channel, self.src_address)
         await self.start_heartbeat()
+        return await self._flush_buffer()
+
+    async def _flush_buffer(self):
+        """Send telegrams buffered while disconnected in order. Return False if the connection was lost meanwhile."""
+        generation = self.tunnelling_sender.generation
+        while self._resend or self._buffer:
+            telegram = (self._resend or self._buffer).popleft()
+            if telegram.expired():
+                self.dropped_telegrams += 1
+                continue
+            await self._send(telegram)
+            if self._lost_generation == generation:
+                return False
+        self.connected = True
+        return True
+
+    def _buffer_telegram(self, telegram):
+        """Keep telegram until the tunnel is connected. Drop the oldest telegram if the buffer is full."""
+        if len(self._buffer) >= self.buffer_size:
+            self._buffer.popleft()
+            self.dropped_telegrams += 1
+        self._buffer.append(telegram)
+
+    @property
+    def buffered_telegrams(self):
+        """Return number of telegrams waiting for the tunnel to be connected."""
+        return len(self._buffer) + len(self._resend)
 
     async def send_telegram(self, telegram):
+        """Send Telegram to tunnelling device or buffer it while the tunnel is disconnected."""
+        if not self.connected:
+            self._buffer_telegram(telegram)
+            return
+        await self._send(telegram)
+
+    async def _send(self, telegram):
         """
         Send Telegram to routing tunnelling device - retry mechanism.
 
@@ -125,36 +194,61 @@ class Tunnel():
         shall repeat the TUNNELLING_REQUEST frame once and then terminate the
         connection by sending a DISCONNECT_REQUEST frame to the other device’s
         control endpoint.
+
+        With a window_size > 1 this returns as soon as the TUNNELLING_REQUEST was sent;
+        the TUNNELLING_ACK is awaited in the background.
+
+        Telegrams which were not acknowledged are sent again after the tunnel was reconnected.
         """
-        success = await self._send_telegram_impl(telegram)
-        if not success:
-            self.xknx.logger.warning("Sending of telegram failed. Retrying a second time.")
-            success = await self._send_telegram_impl(telegram)
-            if not success:
-                self.xknx.logger.warning("Resending telegram failed. Reconnecting to tunnel.")
-                await self.reconnect()
-                success = await self._send_telegram_impl(telegram)
-                if not success:
-                    raise XKNXException("Could not send telegram to tunnel")
-        self.increase_sequence_number()
-
-    async def _send_telegram_impl(self, telegram):
-        """Send Telegram to tunnelling device - implementation."""
-        tunnelling = Tunnelling(
-            self.xknx,
-            self.udp_client,
-            telegram,
-            self.src_address,
-            self.sequence_number,
-            self.communication_channel)
-        await tunnelling.start()
-        return tunnelling.success
-
-    def increase_sequence_number(self):
-        """Increase sequence number."""
-        self.sequence_number += 1
-        if self.sequence_number == 256:
-            self.sequence_number = 0
+        slot = await self.tunnelling_sender.send(telegram)
+        if self.tunnelling_sender.window_size == 1:
+            await self._confirm_telegram(slot, telegram)
+            return
+        task = self.xknx.loop.create_task(self._confirm_telegram_in_background(slot, telegram))
+        self._confirm_tasks.add(task)
+        task.add_done_callback(self._confirm_tasks.discard)
+        # a task cancelled before it started never runs its finally block
+        lease = slot.lease
+        task.add_done_callback(lambda _: self.tunnelling_sender.release(slot, lease))
+
+    async def _confirm_telegram(self, slot, telegram):
+        """Wait for TUNNELLING_ACK of telegram and release slot. Reconnect and send again if it is missing."""
+        generation = slot.generation
+        try:
+            success = await self.tunnelling_sender.wait_for_ack(slot)
+        finally:
+            self.tunnelling_sender.release(slot)
+        if success:
+            return
+        if generation != self.tunnelling_sender.generation and self.connected:
+            # the tunnel was reconnected meanwhile
+            await self._send(telegram)
+            return
+        self._resend.append(telegram)
+        if generation == self.tunnelling_sender.generation and self._lost_generation != generation:
+            self.xknx.logger.warning("Resending telegram failed. Reconnecting to tunnel.")
+        self._connection_lost(generation)
+
+    def _connection_lost(self, generation):
+        """Mark tunnel as disconnected and reconnect in the background - once per connection."""
+        if generation != self.tunnelling_sender.generation:
+            # a newer connection is being established
+            return
+        self.connected = False
+        self._lost_generation = generation
+        self._start_reconnect()
+
+    def _start_reconnect(self, wait=0):
+        """Start reconnect task if it is not running."""
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self.xknx.loop.create_task(self._reconnect_loop(wait))
+
+    async def _confirm_telegram_in_background(self, slot, telegram):
+        """Wait for TUNNELLING_ACK of telegram within background task."""
+        try:
+            await self._confirm_telegram(slot, telegram)
+        except XKNXException as ex:
+            self.xknx.logger.error("Error while sending telegram %s", ex)
 
     async def connectionstate(self):
         """Return state of tunnel. True if tunnel is in good shape."""
@@ -184,15 +278,50 @@ class Tunnel():
         await self.udp_client.stop()
 
     async def reconnect(self):
-        """Reconnect to tunnel device."""
-        await self.disconnect(True)
-        self.init_udp_client()
-        await self.start()
+        """
+        Reconnect to tunnel device. Retry with exponential backoff until a new channel is established.
+
+        There is no limit of attempts - this only returns once reconnected. Call stop() to give up.
+        """
+        await self._reconnect_loop()
 
     async def schedule_reconnect(self):
         """Schedule reconnect to KNX."""
-        await asyncio.sleep(self.auto_reconnect_wait)
-        await self.reconnect()
+        await self._reconnect_loop(wait=self.auto_reconnect_wait)
+
+    async def _reconnect_loop(self, wait=0):
+        """Reconnect until a new channel is established - doubling the wait after every failed attempt."""
+        self.connected = False
+        started = self.xknx.loop.time()
+        await self.stop_heartbeat()
+        attempt = 0
+        while True:
+            if wait:
+                await asyncio.sleep(wait)
+            attempt += 1
+            self.reconnect_attempts += 1
+            if await self._reconnect_once():
+                break
+            wait = min(self.auto_reconnect_wait * 2 ** (attempt - 1), self.auto_reconnect_max_wait)
+            self.xknx.logger.warning("Reconnecting to tunnel failed. Retry in %s seconds.", wait)
+        self.reconnects += 1
+        self.last_reconnect_duration = self.xknx.loop.time() - started
+        self.xknx.logger.info("Tunnel reconnected after %.1f seconds and %s attempt(s)",
+                              self.last_reconnect_duration, attempt)
+
+    async def _reconnect_once(self):
+        """Replace udp client and build tunnel. Return True on success."""
+        try:
+            await self.disconnect(True)
+            # the old channel is gone - do not disconnect it again on further attempts
+            self.communication_channel = None
+            await self.stop_heartbeat()
+            self.init_udp_client()
+            await self.connect_udp()
+            return await self._connect()
+        except (OSError, XKNXException) as ex:
+            self.xknx.logger.warning("Could not reconnect to tunnel: %s", ex)
+            return False
 
     async def stop_reconnect(self):
         """Stop reconnect task if running."""
@@ -206,9 +335,17 @@ class Tunnel():
         #      which can happen if disconnect fails? normally this fails because
         #      we have no connection...
         # await self.disconnect()
+        self.connected = False
         await self.disconnect(True)
         await self.stop_heartbeat()
         await self.stop_reconnect()
+        for task in list(self._confirm_tasks):
+            task.cancel()
+        if self.buffered_telegrams:
+            self.xknx.logger.warning("Dropping %s telegrams not sent to tunnel", self.buffered_telegrams)
+            self.dropped_telegrams += self.buffered_telegrams
+            self._buffer.clear()
+            self._resend.clear()
 
     async def start_heartbeat(self):
         """Start heartbeat for monitoring state of tunnel, as suggested by 03.08.02 KNX Core 5.4."""
@@ -243,7 +380,6 @@ class Tunnel():
         self.number_heartbeat_failed = self.number_heartbeat_failed + 1
         if self.number_heartbeat_failed > 3:
             self.xknx.logger.warning("Heartbeat failed - reconnecting")
-            await self.stop_reconnect()
-            await self.reconnect()
             self.number_heartbeat_failed = 0
-            await self.stop_heartbeat()
+            # reconnects in the background - the heartbeat is restarted once connected
+            self._connection_lost(self.tunnelling_sender.generation)
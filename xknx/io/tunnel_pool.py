@@ -0,0 +1,154 @@
+"""
+Abstraction for handling several KNX/IP tunnels to one gateway.
+
+Most KNX/IP interfaces offer multiple tunnelling channels. A TunnelPool opens `channels`
+Tunnels to the same gateway and spreads outgoing telegrams across them - each channel
+waits for the TUNNELLING_ACKs of its own requests only.
+
+* Telegrams to a group address are sent through one channel as long as telegrams to this
+  address are pending - so they reach the bus in the order they were sent. Other group
+  addresses are assigned to the connected channel with the fewest pending telegrams.
+* Every channel receives the same bus traffic. A telegram is passed on once - further
+  copies received on other channels are dropped (see DuplicateFilter). Telegrams sent
+  by the pool itself (received on the other channels) are dropped.
+
+Channels which can not be opened on start are closed again - unless `auto_reconnect` is
+set, in which case they keep trying in the background and take over traffic once connected.
+"""
+import asyncio
+import functools
+
+from xknx.exceptions import XKNXException
+
+from .duplicate_filter import DuplicateFilter
+from .tunnel import Tunnel
+
+
+class _Channel:
+    """Tunnel of a TunnelPool with its queue of outgoing telegrams."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, tunnel):
+        """Initialize _Channel class."""
+        self.tunnel = tunnel
+        self.queue = asyncio.Queue()
+        # number of telegrams queued or being sent
+        self.load = 0
+        self.worker = None
+
+
+class TunnelPool():
+    """Class for handling several KNX/IP tunnels to one gateway."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, xknx, local_ip, gateway_ip, gateway_port, channels,
+                 telegram_received_callback=None, auto_reconnect=False,
+                 auto_reconnect_wait=3, window_size=1, auto_reconnect_max_wait=60):
+        """Initialize TunnelPool class."""
+        # pylint: disable=too-many-arguments
+        self.xknx = xknx
+        self.telegram_received_callback = telegram_received_callback
+        self.auto_reconnect = auto_reconnect
+        self.channels = []
+        for _ in range(channels):
+            tunnel = Tunnel(
+                xknx,
+                xknx.own_address,
+                local_ip=local_ip,
+                gateway_ip=gateway_ip,
+                gateway_port=gateway_port,
+                auto_reconnect=auto_reconnect,
+                auto_reconnect_wait=auto_reconnect_wait,
+                window_size=window_size,
+                auto_reconnect_max_wait=auto_reconnect_max_wait)
+            tunnel.telegram_received_callback = functools.partial(self.telegram_received, tunnel)
+            self.channels.append(_Channel(tunnel))
+        # group address -> [channel, number of pending telegrams]
+        self._pending = {}
+        self.duplicate_filter = DuplicateFilter()
+
+        # statistics
+        self.duplicate_telegrams = 0
+        self.dropped_telegrams = 0
+
+    @property
+    def tunnels(self):
+        """Return tunnels of all channels."""
+        return [channel.tunnel for channel in self.channels]
+
+    @property
+    def connected(self):
+        """Return True if any channel is connected."""
+        return any(channel.tunnel.connected for channel in self.channels)
+
+    async def start(self):
+        """Open all channels. Channels which can not be opened are closed again."""
+        for channel in list(self.channels):
+            try:
+                await channel.tunnel.start()
+            except XKNXException as ex:
+                self.xknx.logger.warning("Could not open tunnelling channel: %s", ex)
+                await channel.tunnel.stop()
+                self.channels.remove(channel)
+        if not self.channels:
+            raise XKNXException("Could not establish connection")
+        self.xknx.logger.debug("Opened %s tunnelling channels", len(self.channels))
+        for channel in self.channels:
+            channel.worker = self.xknx.loop.create_task(self._worker(channel))
+
+    async def stop(self):
+        """Send pending telegrams and close all channels."""
+        await asyncio.gather(*(channel.queue.join() for channel in self.channels if channel.worker is not None))
+        for channel in self.channels:
+            if channel.worker is not None:
+                channel.worker.cancel()
+                channel.worker = None
+            await channel.tunnel.stop()
+
+    async def send_telegram(self, telegram):
+        """Queue telegram for the channel of its group address. Returns without waiting for the TUNNELLING_ACK."""
+        pending = self._pending.get(telegram.group_address)
+        if pending is None:
+            pending = self._pending[telegram.group_address] = [self._least_loaded_channel(), 0]
+        pending[1] += 1
+        channel = pending[0]
+        channel.load += 1
+        channel.queue.put_nowait(telegram)
+
+    def _least_loaded_channel(self):
+        """Return connected channel with the fewest pending telegrams - or any channel if none is connected."""
+        candidates = [channel for channel in self.channels if channel.tunnel.connected] or self.channels
+        return min(candidates, key=lambda channel: channel.load)
+
+    async def _worker(self, channel):
+        """Endless loop for sending the telegrams queued for channel."""
+        while True:
+            telegram = await channel.queue.get()
+            try:
+                if telegram.expired():
+                    self.dropped_telegrams += 1
+                else:
+                    await channel.tunnel.send_telegram(telegram)
+            except XKNXException as ex:
+                self.xknx.logger.error("Error while sending telegram %s", ex)
+            finally:
+                channel.load -= 1
+                pending = self._pending[telegram.group_address]
+                pending[1] -= 1
+                if not pending[1]:
+                    del self._pending[telegram.group_address]
+                channel.queue.task_done()
+
+    def telegram_received(self, tunnel, telegram):
+        """Pass telegram received by tunnel on - unless it was received on another channel already."""
+        if self.telegram_received_callback is None:
+            return
+        if any(telegram.source_address == channel.tunnel.src_address for channel in self.channels):
+            # sent by the pool through another channel
+            return
+        if self.duplicate_filter.is_duplicate(tunnel, telegram):
+            self.duplicate_telegrams += 1
+            return
+        self.telegram_received_callback(telegram)
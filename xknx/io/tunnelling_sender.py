@@ -0,0 +1,199 @@
+"""
+Abstraction to send TunnellingRequests and match the corresponding TunnellingAcks.
+
+One TunnellingSender lives as long as its Tunnel. It owns the sequence counter and a
+long-lived callback for TunnellingAcks, which are matched to the outstanding requests
+by their sequence counter.
+
+Up to `window_size` requests may be outstanding at the same time. The default of 1
+is what the KNXnet/IP specification demands - only use a bigger window with gateways
+known to accept more than one outstanding request.
+"""
+import asyncio
+
+from xknx.knxip import ErrorCode, KNXIPFrame, KNXIPServiceType, TunnellingAck
+
+
+class TunnellingSender():
+    """Class for sending TunnellingRequests within a sliding window."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    class Slot:
+        """Reusable state of one outstanding TunnellingRequest."""
+
+        # pylint: disable=too-few-public-methods
+
+        def __init__(self):
+            """Initialize Slot class."""
+            self.response_received_or_timeout = asyncio.Event()
+            self.timeout_handle = None
+            self.sequence_counter = None
+            self.generation = None
+            self.knxipframe = None
+            self.success = False
+            self.in_use = False
+            # incremented on every use of the slot
+            self.lease = 0
+
+    def __init__(self, xknx, udp_client=None, window_size=1, timeout_in_seconds=1):
+        """Initialize TunnellingSender class."""
+        # pylint: disable=too-many-arguments
+        if not 1 <= window_size <= 255:
+            raise ValueError("window_size has to be between 1 and 255")
+        self.xknx = xknx
+        self.udp_client = None
+        self.window_size = window_size
+        self.timeout_in_seconds = timeout_in_seconds
+        self.src_address = None
+        self.communication_channel_id = None
+        self.sequence_number = 0
+        # incremented on every reset(), requests of older generations are stale
+        self.generation = 0
+
+        self._callb = None
+        self._pending = {}
+        self._free_slots = asyncio.Queue()
+        for _ in range(window_size):
+            self._free_slots.put_nowait(TunnellingSender.Slot())
+
+        self.set_udp_client(udp_client)
+
+    def set_udp_client(self, udp_client):
+        """Listen for TunnellingAcks on (new) udp_client."""
+        if self._callb is not None:
+            self.udp_client.unregister_callback(self._callb)
+            self._callb = None
+        self.udp_client = udp_client
+        if udp_client is not None:
+            self._callb = udp_client.register_callback(
+                self.ack_received, [TunnellingAck.service_type])
+
+    def reset(self, communication_channel_id, src_address):
+        """Start over with a new tunnel connection. Outstanding requests fail."""
+        self.communication_channel_id = communication_channel_id
+        self.src_address = src_address
+        self.sequence_number = 0
+        self.generation += 1
+        for slot in self._pending.values():
+            slot.success = False
+            slot.response_received_or_timeout.set()
+        self._pending.clear()
+
+    def increase_sequence_number(self):
+        """Increase sequence number."""
+        self.sequence_number += 1
+        if self.sequence_number == 256:
+            self.sequence_number = 0
+
+    @property
+    def outstanding(self):
+        """Return number of requests waiting for their TunnellingAck."""
+        return len(self._pending)
+
+    async def send(self, telegram):
+        """Wait for a free slot within the window, send TunnellingRequest and return slot."""
+        slot = await self._free_slots.get()
+        slot.in_use = True
+        slot.lease += 1
+        slot.sequence_counter = self.sequence_number
+        slot.generation = self.generation
+        slot.success = False
+        self.increase_sequence_number()
+        slot.knxipframe = self.create_knxipframe(telegram, slot.sequence_counter)
+        self._pending[slot.sequence_counter] = slot
+        try:
+            self._transmit(slot)
+        except Exception:
+            self.release(slot)
+            raise
+        return slot
+
+    async def wait_for_ack(self, slot):
+        """
+        Wait for TunnellingAck of slot. Return True if request was acknowledged.
+
+        A request not confirmed within timeout_in_seconds is repeated once with the
+        same sequence counter.
+        """
+        for attempt in range(2):
+            if attempt:
+                self.xknx.logger.warning("Sending of telegram failed. Retrying a second time.")
+                self._transmit(slot)
+            await slot.response_received_or_timeout.wait()
+            self._stop_timeout(slot)
+            if slot.success:
+                return True
+            if not self._is_pending(slot):
+                # tunnel was reset in the meantime
+                return False
+        return False
+
+    def release(self, slot, lease=None):
+        """
+        Give slot back to the window.
+
+        Releasing a slot twice is a no-op. If `lease` is given the slot is only released
+        if it was not handed out again in the meantime.
+        """
+        if not slot.in_use or lease not in (None, slot.lease):
+            return
+        slot.in_use = False
+        self._stop_timeout(slot)
+        if self._is_pending(slot):
+            del self._pending[slot.sequence_counter]
+        slot.knxipframe = None
+        self._free_slots.put_nowait(slot)
+
+    def ack_received(self, knxipframe, _):
+        """Match TunnellingAck to outstanding request. Callback from internal udpclient."""
+        if not isinstance(knxipframe.body, TunnellingAck):
+            self.xknx.logger.warning("Cant understand knxipframe")
+            return
+        slot = self._pending.get(knxipframe.body.sequence_counter)
+        if slot is None or \
+                knxipframe.body.communication_channel_id != self.communication_channel_id:
+            self.xknx.logger.debug("Ignoring unexpected TunnellingAck: %s", knxipframe)
+            return
+        slot.success = knxipframe.body.status_code == ErrorCode.E_NO_ERROR
+        if not slot.success:
+            self.xknx.logger.warning("Error: KNX bus responded to TunnellingRequest %s with error: %s",
+                                     slot.sequence_counter, knxipframe.body.status_code)
+        slot.response_received_or_timeout.set()
+
+    def create_knxipframe(self, telegram, sequence_counter):
+        """Create KNX/IP Frame object to be sent to device."""
+        knxipframe = KNXIPFrame(self.xknx)
+        knxipframe.init(KNXIPServiceType.TUNNELLING_REQUEST)
+        knxipframe.body.communication_channel_id = self.communication_channel_id
+        knxipframe.body.cemi.telegram = telegram
+        knxipframe.body.cemi.src_addr = self.src_address
+        knxipframe.body.sequence_counter = sequence_counter
+        knxipframe.normalize()
+        return knxipframe
+
+    def _is_pending(self, slot):
+        """Test if slot is still waiting for its TunnellingAck within current generation."""
+        return self._pending.get(slot.sequence_counter) is slot and \
+            slot.generation == self.generation
+
+    def _transmit(self, slot):
+        """Send request of slot and start timeout."""
+        slot.response_received_or_timeout.clear()
+        self.udp_client.send(slot.knxipframe)
+        slot.timeout_handle = self.xknx.loop.call_later(
+            self.timeout_in_seconds, self._timeout, slot)
+
+    def _timeout(self, slot):
+        """Handle timeout for not having received TunnellingAck."""
+        self.xknx.logger.warning("Error: KNX bus did not respond in time to TunnellingRequest %s",
+                                 slot.sequence_counter)
+        slot.timeout_handle = None
+        slot.response_received_or_timeout.set()
+
+    @staticmethod
+    def _stop_timeout(slot):
+        """Stop timeout of slot."""
+        if slot.timeout_handle is not None:
+            slot.timeout_handle.cancel()
+            slot.timeout_handle = None
@@ -3,14 +3,29 @@ UDPClient is an abstraction for handling the complete UDP io.
 
 The module is build upon asyncio udp functions.
 Due to lame support of UDP multicast within asyncio some special treatment for multicast is necessary.
+
+Whenever asyncio reports a received datagram all further datagrams already waiting
+on the (nonblocking) socket are drained within the same wakeup and processed as a batch.
+Draining reads the socket owned by asyncio's (private) `_SelectorDatagramTransport` directly
+and therefore relies on its internals: the transport reads the socket only when it is readable
+and never buffers incoming datagrams. Like asyncio, drained datagrams are not checked for their
+source address (the kernel filters them for connected unicast sockets) and errors raised while
+draining are passed to `error_received()` - the transport itself does not take notice of them.
+
+An optional `prefilter` is called with the raw bytes of every datagram before it is
+parsed; datagrams it returns False for are dropped.
 """
 import asyncio
+import heapq
+import itertools
 import socket
 from sys import platform
 
 from xknx.exceptions import CouldNotParseKNXIP, XKNXException
 from xknx.knxip import KNXIPFrame
 
+from .const import DEFAULT_UDP_MAX_BATCH_SIZE, UDP_RECEIVE_BUFFER_SIZE
+
 
 class UDPClient:
     """Class for handling (sending and receiving) UDP packets."""
@@ -20,10 +35,14 @@ class UDPClient:
     class Callback:
         """Callback class for handling callbacks for different 'KNX service types' of received packets."""
 
+        # registration order of callbacks across service types
+        _sequence = itertools.count()
+
         def __init__(self, callback, service_types=None):
             """Initialize Callback class."""
             self.callback = callback
             self.service_types = service_types or []
+            self.sequence = next(UDPClient.Callback._sequence)
 
         def has_service(self, service_type):
             """Test if callback is listening for given service type."""
@@ -34,17 +53,25 @@ class UDPClient:
     class UDPClientFactory(asyncio.DatagramProtocol):
         """Abstraction for managing the asyncio-udp transports."""
 
+        # pylint: disable=too-many-arguments
+
         def __init__(self,
                      xknx,
                      own_ip,
                      multicast=False,
-                     data_received_callback=None):
+                     data_received_callback=None,
+                     datagrams_received_callback=None,
+                     sock=None,
+                     max_batch_size=1):
             """Initialize UDPClientFactory class."""
             self.xknx = xknx
             self.own_ip = own_ip
             self.multicast = multicast
             self.transport = None
             self.data_received_callback = data_received_callback
+            self.datagrams_received_callback = datagrams_received_callback
+            self.sock = sock
+            self.max_batch_size = max_batch_size
 
         def connection_made(self, transport):
             """Assign transport. Callback after udp connection was made."""
@@ -52,9 +79,28 @@ class UDPClient:
 
         def datagram_received(self, data, addr):
             """Call assigned callback. Callback for datagram received."""
-            if self.data_received_callback is not None:
+            if self.datagrams_received_callback is not None and \
+                    self.sock is not None and \
+                    self.max_batch_size > 1:
+                self.datagrams_received_callback(self.drain(data))
+            elif self.data_received_callback is not None:
                 self.data_received_callback(data)
 
+        def drain(self, data):
+            """Return `data` and all datagrams already waiting on the socket (up to max_batch_size)."""
+            batch = [data]
+            if self.transport is not None and self.transport.is_closing():
+                return batch
+            recv = self.sock.recv
+            try:
+                while len(batch) < self.max_batch_size:
+                    batch.append(recv(UDP_RECEIVE_BUFFER_SIZE))
+            except (BlockingIOError, InterruptedError):
+                pass
+            except OSError as exc:
+                self.error_received(exc)
+            return batch
+
         def error_received(self, exc):
             """Handle errors. Callback for error received."""
             if hasattr(self, 'xknx'):
@@ -65,7 +111,8 @@ class UDPClient:
             if hasattr(self, 'xknx'):
                 self.xknx.logger.info('closing transport %s', exc)
 
-    def __init__(self, xknx, local_addr, remote_addr, multicast=False, bind_to_multicast_addr=False):
+    def __init__(self, xknx, local_addr, remote_addr, multicast=False, bind_to_multicast_addr=False,
+                 max_batch_size=DEFAULT_UDP_MAX_BATCH_SIZE, prefilter=None):
         """Initialize UDPClient class."""
         # pylint: disable=too-many-arguments
         if not isinstance(local_addr, tuple):
@@ -77,12 +124,15 @@ class UDPClient:
         self.remote_addr = remote_addr
         self.multicast = multicast
         self.bind_to_multicast_addr = bind_to_multicast_addr
+        self.max_batch_size = max_batch_size
+        self.prefilter = prefilter
         self.transport = None
-        self.callbacks = []
+        # service type -> registered callbacks; key None holds callbacks for all service types
+        self._callbacks_by_service_type = {}
 
     def data_received_callback(self, raw):
         """Parse and process KNXIP frame. Callback for having received an UDP packet."""
-        if raw:
+        if raw and (self.prefilter is None or self.prefilter(raw)):
             try:
                 knxipframe = KNXIPFrame(self.xknx)
                 knxipframe.from_knx(raw)
@@ -91,28 +141,69 @@ class UDPClient:
             except CouldNotParseKNXIP as couldnotparseknxip:
                 self.xknx.logger.exception(couldnotparseknxip)
 
+    def datagrams_received_callback(self, raws):
+        """Parse and process a batch of KNXIP frames. Callback for having received UDP packets."""
+        knxipframes = []
+        for raw in raws:
+            if not raw or (self.prefilter is not None and not self.prefilter(raw)):
+                continue
+            try:
+                knxipframe = KNXIPFrame(self.xknx)
+                knxipframe.from_knx(raw)
+                self.xknx.knx_logger.debug("Received: %s", knxipframe)
+                knxipframes.append(knxipframe)
+            except CouldNotParseKNXIP as couldnotparseknxip:
+                self.xknx.logger.exception(couldnotparseknxip)
+        self.handle_knxipframes(knxipframes)
+
+    def handle_knxipframes(self, knxipframes):
+        """Handle batch of KNXIP Frames."""
+        for knxipframe in knxipframes:
+            self.handle_knxipframe(knxipframe)
+
     def handle_knxipframe(self, knxipframe):
         """Handle KNXIP Frame and call all callbacks which watch for the service type ident."""
-        handled = False
-        for callback in self.callbacks:
-            if callback.has_service(knxipframe.header.service_type_ident):
-                callback.callback(knxipframe, self)
-                handled = True
-        if not handled:
+        callbacks = self.callbacks_for_service_type(knxipframe.header.service_type_ident)
+        for callback in callbacks:
+            callback.callback(knxipframe, self)
+        if not callbacks:
             self.xknx.logger.debug("UNHANDLED: %s", knxipframe.header.service_type_ident)
 
+    def callbacks_for_service_type(self, service_type):
+        """Return callbacks watching for service type or for all service types in order of registration."""
+        callbacks = self._callbacks_by_service_type.get(service_type)
+        catch_all = self._callbacks_by_service_type.get(None)
+        if callbacks and catch_all:
+            return tuple(heapq.merge(callbacks, catch_all, key=lambda callb: callb.sequence))
+        # copy - callbacks may (un)register callbacks
+        return tuple(callbacks or catch_all or ())
+
+    @property
+    def callbacks(self):
+        """Return all registered callbacks."""
+        return sorted({callb
+                       for bucket in self._callbacks_by_service_type.values()
+                       for callb in bucket},
+                      key=lambda callb: callb.sequence)
+
     def register_callback(self, callback, service_types=None):
         """Register callback."""
         if service_types is None:
             service_types = []
 
         callb = UDPClient.Callback(callback, service_types)
-        self.callbacks.append(callb)
+        # dicts are used as ordered sets for O(1) unregistering
+        for service_type in dict.fromkeys(service_types or (None,)):
+            self._callbacks_by_service_type.setdefault(service_type, {})[callb] = None
         return callb
 
     def unregister_callback(self, callb):
         """Unregister callback."""
-        self.callbacks.remove(callb)
+        for service_type in dict.fromkeys(callb.service_types or (None,)):
+            bucket = self._callbacks_by_service_type[service_type]
+            del bucket[callb]
+            if not bucket:
+                del self._callbacks_by_service_type[service_type]
 
     @staticmethod
     def create_multicast_sock(own_ip, remote_addr, bind_to_multicast_addr):
@@ -154,24 +245,36 @@ class UDPClient:
         sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
         return sock
 
+    @staticmethod
+    def create_unicast_sock(local_addr, remote_addr):
+        """Create UDP socket bound to local_addr and connected to remote_addr."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        try:
+            sock.bind(local_addr)
+            sock.connect(remote_addr)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
     async def connect(self):
         """Connect UDP socket. Open UDP port and build mulitcast socket if necessary."""
-        udp_client_factory = UDPClient.UDPClientFactory(
-            self.xknx, self.local_addr[0], multicast=self.multicast,
-            data_received_callback=self.data_received_callback)
-
         if self.multicast:
             sock = UDPClient.create_multicast_sock(self.local_addr[0], self.remote_addr, self.bind_to_multicast_addr)
-            (transport, _) = await self.xknx.loop.create_datagram_endpoint(
-                lambda: udp_client_factory, sock=sock)
-            self.transport = transport
-
         else:
-            (transport, _) = await self.xknx.loop.create_datagram_endpoint(
-                lambda: udp_client_factory,
-                local_addr=self.local_addr,
-                remote_addr=self.remote_addr)
-            self.transport = transport
+            sock = UDPClient.create_unicast_sock(self.local_addr, self.remote_addr)
+
+        udp_client_factory = UDPClient.UDPClientFactory(
+            self.xknx, self.local_addr[0], multicast=self.multicast,
+            data_received_callback=self.data_received_callback,
+            datagrams_received_callback=self.datagrams_received_callback,
+            sock=sock,
+            max_batch_size=self.max_batch_size)
+
+        (transport, _) = await self.xknx.loop.create_datagram_endpoint(
+            lambda: udp_client_factory, sock=sock)
+        self.transport = transport
 
     def send(self, knxipframe):
         """Send KNXIPFrame to socket."""
@@ -179,16 +282,14 @@ class UDPClient:
         if self.transport is None:
             raise XKNXException("Transport not connected")
 
-        val = knxipframe.to_knx()
         try:
-            val = bytes(val)
+            val = knxipframe.to_knx()
         except ValueError as ex:
             raise XKNXException(f"KNX IP Frame Byte Error: {ex}")
+        if self.multicast:
+            self.transport.sendto(val, self.remote_addr)
         else:
-            if self.multicast:
-                self.transport.sendto(val, self.remote_addr)
-            else:
-                self.transport.sendto(val)
+            self.transport.sendto(val)
 
     def getsockname(self):
         """Return sockname."""
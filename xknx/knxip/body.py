@@ -21,6 +21,16 @@ class KNXIPBody():
         """Serialize to KNX/IP raw data."""
         self.xknx.logger.warning("to_knx not implemented for %s", self.__class__.__name__)
 
+    def to_knx_into(self, buffer, offset):
+        """
+        Serialize to KNX/IP raw data into preallocated `buffer` at `offset`.
+
+        Returns number of bytes written. May be overwritten by derived class to avoid intermediate lists.
+        """
+        data = self.to_knx()
+        buffer[offset:offset + len(data)] = data
+        return len(data)
+
     def __eq__(self, other):
         """Equal operator."""
         return self.__dict__ == other.__dict__
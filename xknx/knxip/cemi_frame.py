@@ -11,14 +11,48 @@ Documentation within:
     KNX IP Communication Medium
     File: AN117 v02.01 KNX IP Communication Medium DV.pdf
 """
+import struct
+
 from xknx.dpt import DPTArray, DPTBinary
 from xknx.exceptions import (
     ConversionError, CouldNotParseKNXIP, UnsupportedCEMIMessage)
-from xknx.telegram import GroupAddress, PhysicalAddress, Telegram, TelegramType
+from xknx.telegram import (
+    GroupAddress, PhysicalAddress, Telegram, TelegramPriority, TelegramType)
 
 from .body import KNXIPBody
 from .knxip_enum import APCICommand, CEMIFlags, CEMIMessageCode
 
+# Standard L_Data frame without additional information:
+# code, addil, flags, src, dst, mpdu_len, tpci_apci
+_L_DATA_STANDARD = struct.Struct('>BBHHHBH')
+
+_DATA_LINK_LAYER_CODES = {
+    code.value: code for code in (
+        CEMIMessageCode.L_DATA_IND,
+        CEMIMessageCode.L_Data_REQ,
+        CEMIMessageCode.L_DATA_CON)}
+
+_APCI_COMMANDS = {cmd.value: cmd for cmd in APCICommand}
+
+_TELEGRAM_TYPES = {
+    APCICommand.GROUP_WRITE: TelegramType.GROUP_WRITE,
+    APCICommand.GROUP_READ: TelegramType.GROUP_READ,
+    APCICommand.GROUP_RESPONSE: TelegramType.GROUP_RESPONSE,
+}
+
+_PRIORITY_FLAGS = {
+    TelegramPriority.SYSTEM: CEMIFlags.PRIORITY_SYSTE,
+    TelegramPriority.NORMAL: CEMIFlags.PRIORITY_NORMAL,
+    TelegramPriority.URGENT: CEMIFlags.PRIORITY_URGENT,
+    TelegramPriority.LOW: CEMIFlags.PRIORITY_LOW,
+}
+
+_PRIORITY_MASK = 0x0C00
+
+_TELEGRAM_PRIORITIES = {flags: priority for priority, flags in _PRIORITY_FLAGS.items()}
+
+_FAST_PATH_FLAGS = CEMIFlags.FRAME_TYPE_STANDARD | CEMIFlags.DESTINATION_GROUP_ADDRESS
+
 
 class CEMIFrame(KNXIPBody):
     """Representation of a CEMI Frame."""
@@ -42,19 +76,14 @@ class CEMIFrame(KNXIPBody):
         telegram = Telegram()
         telegram.payload = self.payload
         telegram.group_address = self.dst_addr
-
-        def resolve_telegram_type(cmd):
-            """Return telegram type from APCI Command."""
-            if cmd == APCICommand.GROUP_WRITE:
-                return TelegramType.GROUP_WRITE
-            if cmd == APCICommand.GROUP_READ:
-                return TelegramType.GROUP_READ
-            if cmd == APCICommand.GROUP_RESPONSE:
-                return TelegramType.GROUP_RESPONSE
+        if isinstance(self.src_addr, PhysicalAddress):
+            telegram.source_address = self.src_addr
+        telegram.priority = _TELEGRAM_PRIORITIES[self.flags & _PRIORITY_MASK]
+        try:
+            telegram.telegramtype = _TELEGRAM_TYPES[self.cmd]
+        except KeyError:
             raise ConversionError("Telegram not implemented for {0}".format(self.cmd))
 
-        telegram.telegramtype = resolve_telegram_type(self.cmd)
-
         # TODO: Set telegram.direction [additional flag within KNXIP]
         return telegram
 
@@ -69,7 +98,7 @@ class CEMIFrame(KNXIPBody):
         self.flags = (CEMIFlags.FRAME_TYPE_STANDARD |
                       CEMIFlags.DO_NOT_REPEAT |
                       CEMIFlags.BROADCAST |
-                      CEMIFlags.PRIORITY_LOW |
+                      _PRIORITY_FLAGS[telegram.priority] |
                       CEMIFlags.NO_ACK_REQUESTED |
                       CEMIFlags.CONFIRM_NO_ERROR |
                       CEMIFlags.DESTINATION_GROUP_ADDRESS |
@@ -106,6 +135,9 @@ class CEMIFrame(KNXIPBody):
 
     def from_knx(self, raw):
         """Parse/deserialize from KNX/IP raw data."""
+        length = self.from_knx_standard_group_frame(raw)
+        if length is not None:
+            return length
         try:
             try:
                 self.code = CEMIMessageCode(raw[0])
@@ -121,11 +153,42 @@ class CEMIFrame(KNXIPBody):
             # self.xknx.logger.warning("Ignoring not implemented CEMI: %s", unsupported_cemi_err)
             return len(raw)
 
+    def from_knx_standard_group_frame(self, cemi):
+        """
+        Parse standard L_Data frame without additional info addressed to a group.
+
+        Fast path for the vast majority of incoming frames. Returns None if `cemi`
+        is not such a frame - it shall then be parsed by the generic parser.
+        """
+        try:
+            code, addil, flags, src, dst, mpdu_len, tpci_apci = _L_DATA_STANDARD.unpack_from(cemi)
+        except (struct.error, TypeError):
+            # too short or not a bytes-like object
+            return None
+        message_code = _DATA_LINK_LAYER_CODES.get(code)
+        cmd = _APCI_COMMANDS.get(tpci_apci & 0xFFC0)
+        if addil or message_code is None or cmd is None or \
+                flags & _FAST_PATH_FLAGS != _FAST_PATH_FLAGS or \
+                mpdu_len != len(cemi) - 10:
+            return None
+
+        self.code = message_code
+        self.flags = flags
+        self.src_addr = PhysicalAddress(src)
+        self.dst_addr = GroupAddress(dst, levels=self.xknx.address_format)
+        self.mpdu_len = mpdu_len
+        self.cmd = cmd
+        if mpdu_len == 1:
+            self.payload = DPTBinary(tpci_apci & DPTBinary.APCI_BITMASK)
+        else:
+            self.payload = DPTArray(cemi[11:])
+        return len(cemi)
+
     def from_knx_data_link_layer(self, cemi):
         """Parse L_DATA_IND, CEMIMessageCode.L_Data_REQ, CEMIMessageCode.L_DATA_CON."""
         if len(cemi) < 11:
             # eg. ETS Line-Scan issues L_DATA_IND with length 10
-            raise UnsupportedCEMIMessage("CEMI too small. Length: {0}; CEMI: {1}".format(len(cemi), cemi))
+            raise UnsupportedCEMIMessage("CEMI too small. Length: {0}; CEMI: {1}".format(len(cemi), bytes(cemi)))
 
         # AddIL (Additional Info Length), as specified within
         # KNX Chapter 3.6.3/4.1.4.3 "Additional information."
@@ -134,13 +197,14 @@ class CEMIFrame(KNXIPBody):
 
         self.flags = cemi[2 + addil] * 256 + cemi[3 + addil]
 
-        self.src_addr = PhysicalAddress((cemi[4 + addil], cemi[5 + addil]))
+        # Addresses are interned - passing the raw int returns the cached object
+        self.src_addr = PhysicalAddress(cemi[4 + addil] * 256 + cemi[5 + addil])
 
         if self.flags & CEMIFlags.DESTINATION_GROUP_ADDRESS:
-            self.dst_addr = GroupAddress((cemi[6 + addil], cemi[7 + addil]),
+            self.dst_addr = GroupAddress(cemi[6 + addil] * 256 + cemi[7 + addil],
                                          levels=self.xknx.address_format)
         else:
-            self.dst_addr = PhysicalAddress((cemi[6 + addil], cemi[7 + addil]))
+            self.dst_addr = PhysicalAddress(cemi[6 + addil] * 256 + cemi[7 + addil])
 
         self.mpdu_len = cemi[8 + addil]
 
@@ -171,45 +235,41 @@ class CEMIFrame(KNXIPBody):
 
     def to_knx(self):
         """Serialize to KNX/IP raw data."""
+        data = bytearray(self.calculated_length())
+        self.to_knx_into(data, 0)
+        return data
+
+    def to_knx_into(self, buffer, offset):
+        """Serialize to KNX/IP raw data into preallocated `buffer` at `offset`. Return number of bytes written."""
         if not isinstance(self.src_addr, (GroupAddress, PhysicalAddress)):
             raise ConversionError("src_add not set")
         if not isinstance(self.dst_addr, (GroupAddress, PhysicalAddress)):
             raise ConversionError("dst_add not set")
 
-        data = []
-
-        data.append(self.code.value)
-        data.append(0x00)
-        data.append((self.flags >> 8) & 255)
-        data.append(self.flags & 255)
-        data.extend(self.src_addr.to_knx())
-        data.extend(self.dst_addr.to_knx())
-
-        def encode_cmd_and_payload(cmd, encoded_payload=0, appended_payload=None):
-            """Encode cmd and payload."""
-            if appended_payload is None:
-                appended_payload = []
-            data = [
-                1 + len(appended_payload),
-                (cmd.value >> 8) & 0xff,
-                (cmd.value & 0xff) |
-                (encoded_payload & DPTBinary.APCI_BITMASK)]
-            data.extend(appended_payload)
-            return data
-
+        encoded_payload = 0
+        appended_payload = b''
         if self.payload is None:
-            data.extend(encode_cmd_and_payload(self.cmd))
+            pass
         elif isinstance(self.payload, DPTBinary):
-            data.extend(encode_cmd_and_payload(
-                self.cmd,
-                encoded_payload=self.payload.value))
+            encoded_payload = self.payload.value
         elif isinstance(self.payload, DPTArray):
-            data.extend(encode_cmd_and_payload(
-                self.cmd,
-                appended_payload=self.payload.value))
+            appended_payload = self.payload.value
         else:
             raise TypeError()
-        return data
+
+        buffer[offset] = self.code.value
+        buffer[offset + 1] = 0x00
+        buffer[offset + 2] = (self.flags >> 8) & 255
+        buffer[offset + 3] = self.flags & 255
+        buffer[offset + 4] = (self.src_addr.raw >> 8) & 255
+        buffer[offset + 5] = self.src_addr.raw & 255
+        buffer[offset + 6] = (self.dst_addr.raw >> 8) & 255
+        buffer[offset + 7] = self.dst_addr.raw & 255
+        buffer[offset + 8] = 1 + len(appended_payload)
+        buffer[offset + 9] = (self.cmd.value >> 8) & 0xff
+        buffer[offset + 10] = (self.cmd.value & 0xff) | (encoded_payload & DPTBinary.APCI_BITMASK)
+        buffer[offset + 11:offset + 11 + len(appended_payload)] = appended_payload
+        return 11 + len(appended_payload)
 
     def __str__(self):
         """Return object as readable string."""
@@ -80,7 +80,7 @@ class DIBGeneric(DIB):
             raise CouldNotParseKNXIP("DIB wrong length")
 
         self.dtc = DIBTypeCode(raw[1])
-        self.data = raw[:dib_length]
+        self.data = bytes(raw[:dib_length])
 
         return dib_length
 
@@ -45,15 +45,21 @@ class KNXIPHeader():
 
     def to_knx(self):
         """Serialize to KNX/IP raw data."""
-        data = []
-        data.append(self.header_length)
-        data.append(self.protocol_version)
-        data.append((self.service_type_ident.value >> 8) & 255)
-        data.append(self.service_type_ident.value & 255)
-        data.append((self.total_length >> 8) & 255)
-        data.append(self.total_length & 255)
+        data = bytearray(KNXIPHeader.HEADERLENGTH)
+        self.to_knx_into(data, 0)
         return data
 
+    def to_knx_into(self, buffer, offset):
+        """Serialize to KNX/IP raw data into preallocated `buffer` at `offset`. Return number of bytes written."""
+        service_type_ident = self.service_type_ident.value
+        buffer[offset] = self.header_length
+        buffer[offset + 1] = self.protocol_version
+        buffer[offset + 2] = (service_type_ident >> 8) & 255
+        buffer[offset + 3] = service_type_ident & 255
+        buffer[offset + 4] = (self.total_length >> 8) & 255
+        buffer[offset + 5] = self.total_length & 255
+        return KNXIPHeader.HEADERLENGTH
+
     def __str__(self):
         """Return object as readable string."""
         return '<KNXIPHeader HeaderLength="{0}" ProtocolVersion="{1}" ' \
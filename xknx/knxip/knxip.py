@@ -72,6 +72,13 @@ class KNXIPFrame:
 
     def from_knx(self, data):
         """Parse/deserialize from KNX/IP raw data."""
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            try:
+                data = bytes(data)
+            except ValueError:
+                raise CouldNotParseKNXIP("KNXIP data contains invalid bytes")
+        # slicing a memoryview does not copy the underlying data
+        data = memoryview(data)
         pos = self.header.from_knx(data)
 
         self.init(self.header.service_type_ident)
@@ -87,10 +94,10 @@ class KNXIPFrame:
         self.header.set_length(self.body)
 
     def to_knx(self):
-        """Serialize to KNX/IP raw data."""
-        data = []
-        data.extend(self.header.to_knx())
-        data.extend(self.body.to_knx())
+        """Serialize to KNX/IP raw data. Returns a bytearray."""
+        data = bytearray(KNXIPHeader.HEADERLENGTH + self.body.calculated_length())
+        pos = self.header.to_knx_into(data, 0)
+        self.body.to_knx_into(data, pos)
         return data
 
     def __str__(self):
@@ -48,18 +48,18 @@ class TunnellingAck(KNXIPBody):
 
     def to_knx(self):
         """Serialize to KNX/IP raw data."""
-        def ack_to_knx():
-            """Serialize ACK information."""
-            ack = []
-            ack.append(TunnellingAck.BODY_LENGTH)
-            ack.append(self.communication_channel_id)
-            ack.append(self.sequence_counter)
-            ack.append(self.status_code.value)
-            return ack
-        data = []
-        data.extend(ack_to_knx())
+        data = bytearray(TunnellingAck.BODY_LENGTH)
+        self.to_knx_into(data, 0)
         return data
 
+    def to_knx_into(self, buffer, offset):
+        """Serialize to KNX/IP raw data into preallocated `buffer` at `offset`. Return number of bytes written."""
+        buffer[offset] = TunnellingAck.BODY_LENGTH
+        buffer[offset + 1] = self.communication_channel_id
+        buffer[offset + 2] = self.sequence_counter
+        buffer[offset + 3] = self.status_code.value
+        return TunnellingAck.BODY_LENGTH
+
     def __str__(self):
         """Return object as readable string."""
         return '<TunnellingAck communication_channel_id="{0}" ' \
@@ -50,20 +50,19 @@ class TunnellingRequest(KNXIPBody):
 
     def to_knx(self):
         """Serialize to KNX/IP raw data."""
-        def header_to_knx():
-            """Serialize header."""
-            cri = []
-            cri.append(TunnellingRequest.HEADER_LENGTH)
-            cri.append(self.communication_channel_id)
-            cri.append(self.sequence_counter)
-            cri.append(0x00)  # Reserved
-            return cri
-
-        data = []
-        data.extend(header_to_knx())
-        data.extend(self.cemi.to_knx())
+        data = bytearray(self.calculated_length())
+        self.to_knx_into(data, 0)
         return data
 
+    def to_knx_into(self, buffer, offset):
+        """Serialize to KNX/IP raw data into preallocated `buffer` at `offset`. Return number of bytes written."""
+        buffer[offset] = TunnellingRequest.HEADER_LENGTH
+        buffer[offset + 1] = self.communication_channel_id
+        buffer[offset + 2] = self.sequence_counter
+        buffer[offset + 3] = 0x00  # Reserved
+        return TunnellingRequest.HEADER_LENGTH + \
+            self.cemi.to_knx_into(buffer, offset + TunnellingRequest.HEADER_LENGTH)
+
     def __str__(self):
         """Return object as readable string."""
         return '<TunnellingRequest communication_channel_id="{0}" ' \
@@ -10,6 +10,7 @@ from .remote_value_dpt3 import (
     RemoteValueDpt3, RemoteValueStartStopBlinds, RemoteValueStartStopDimming)
 from .remote_value_dpt_2_byte_unsigned import RemoteValueDpt2ByteUnsigned
 from .remote_value_dpt_value_1_ucount import RemoteValueDptValue1Ucount
+from .remote_value_registry import RemoteValueRegistry
 from .remote_value_scaling import RemoteValueScaling
 from .remote_value_scene_number import RemoteValueSceneNumber
 from .remote_value_sensor import RemoteValueSensor
@@ -5,9 +5,27 @@ Remote value can be :
 - a group address for writing a KNX value,
 - a group address for reading a KNX value,
 - or a group of both representing the same value.
+
+The payload is not held by the remote value itself: it is a view on the slot of the
+StateTable of the group address updated last. The StateTable marks the view outdated on
+every update of one of its group addresses (e.g. by another remote value sharing a group
+address) - only then the slot is determined again. Payloads written by others are only
+used if payload_valid(). The value is decoded from the payload once and cached until then.
 """
+import time
+
 from xknx.exceptions import CouldNotParseTelegram
-from xknx.telegram import GroupAddress, Telegram, TelegramType
+from xknx.telegram import (
+    GroupAddress, Telegram, TelegramPriority, TelegramType)
+
+# marks the cached value as outdated
+_NOT_DECODED = object()
+# marks that no value was passed to after_update_cb yet
+_NOT_REPORTED = object()
+# keys of __dict__ holding the view on the state table and the last reported value
+_VIEW_ATTRIBUTES = ("_view_addresses", "_outdated", "_state_address", "_payload", "_value", "_reported_value")
+# keys of __dict__ not compared by __eq__
+_IGNORED_ATTRIBUTES = ("after_update_cb", "_registries") + _VIEW_ATTRIBUTES
 
 
 class RemoteValue:
@@ -21,6 +39,7 @@ class RemoteValue:
         sync_state=True,
         device_name=None,
         after_update_cb=None,
+        priority=TelegramPriority.LOW,
     ):
         """Initialize RemoteValue class."""
         # pylint: disable=too-many-arguments
@@ -38,12 +57,108 @@ class RemoteValue:
         if isinstance(group_address_state, (str, int)):
             group_address_state = GroupAddress(group_address_state)
 
-        self.group_address = group_address
-        self.group_address_state = group_address_state
+        # RemoteValueRegistries indexing this remote value by group address
+        self._registries = []
+        self._group_address = group_address
+        self._group_address_state = group_address_state
         self.sync_state = sync_state
         self.device_name = "Unknown" if device_name is None else device_name
         self.after_update_cb = after_update_cb
-        self.payload = None
+        # KNX priority of telegrams sent by this remote value
+        self.priority = priority
+        self._reported_value = _NOT_REPORTED
+        # group addresses registered with the state table
+        self._view_addresses = []
+        self._reset_view()
+
+    def _reset_view(self):
+        """Register view for the current group addresses and forget the slot the payload is taken from."""
+        state_table = self.xknx.state_table
+        state_table.unregister_view(self, self._view_addresses)
+        self._view_addresses = self.all_group_addresses()
+        state_table.register_view(self, self._view_addresses)
+        # True if a group address was updated since _state_address was determined
+        self._outdated = True
+        # group address of the slot within the state table - None if no address holds a payload
+        self._state_address = None
+        self._payload = None
+        self._value = None
+
+    def state_changed(self):
+        """Mark view outdated. Called by the StateTable after a group address of this remote value was updated."""
+        self._outdated = True
+
+    @property
+    def group_address(self):
+        """Return group addresses written to (and listened to)."""
+        return self._group_address
+
+    @group_address.setter
+    def group_address(self, group_address):
+        """Set group addresses written to."""
+        self._group_address = group_address
+        self._group_addresses_changed()
+
+    @property
+    def group_address_state(self):
+        """Return group address read from."""
+        return self._group_address_state
+
+    @group_address_state.setter
+    def group_address_state(self, group_address_state):
+        """Set group address read from."""
+        self._group_address_state = group_address_state
+        self._group_addresses_changed()
+
+    def _group_addresses_changed(self):
+        """Invalidate view on state table and indices of registries and devices after group addresses were reassigned."""
+        self._reset_view()
+        for registry in self._registries:
+            registry.group_addresses_changed()
+        self.xknx.devices.group_addresses_changed()
+
+    @property
+    def payload(self):
+        """Return current payload."""
+        if self._outdated:
+            self._resolve()
+        return self._payload
+
+    def _resolve(self):
+        """Take payload from the slot of the group address updated last."""
+        self._outdated = False
+        state_table = self.xknx.state_table
+        self._state_address = state_table.latest(self._view_addresses)
+        payload = None if self._state_address is None else state_table.payload(self._state_address)
+        # written by someone else (another remote value, StateStore) - may be of another shape
+        self._payload = payload if payload is not None and self.payload_valid(payload) else None
+        self._value = _NOT_DECODED
+
+    @payload.setter
+    def payload(self, payload):
+        """Set payload of state address (or first group address). Value is decoded on next access."""
+        group_address = self.group_address_state \
+            if isinstance(self.group_address_state, GroupAddress) else None
+        if group_address is None and self.group_address and \
+                isinstance(self.group_address[0], GroupAddress):
+            group_address = self.group_address[0]
+        if group_address is None:
+            self.xknx.logger.warning("Cannot set payload of remote value without group address: %s",
+                                     self.device_name)
+            return
+        self._update(group_address, payload)
+
+    def _update(self, group_address, payload, source_address=None):
+        """Write payload to slot of group address within state table and state store."""
+        timestamp = time.time()
+        self.xknx.state_table.update(group_address, payload, timestamp, source_address)
+        if self.xknx.state_store is not None:
+            self.xknx.state_store.store(group_address, payload, timestamp)
+        # the slot just written is the one updated last - even if timestamps are equal
+        self._outdated = False
+        self._state_address = group_address
+        self._payload = self.xknx.state_table.payload(group_address)
+        self._value = _NOT_DECODED
 
     @property
     def initialized(self):
@@ -62,10 +177,19 @@ class RemoteValue:
 
     def has_group_address(self, group_address):
         """Test if device has given group address."""
-        try:
-            return group_address in self.group_address or group_address == self.group_address_state
-        except TypeError:
+        if self.group_address is None:
             return False
+        return group_address in self.group_address or group_address == self.group_address_state
+
+    def all_group_addresses(self):
+        """Return all group addresses this remote value listens to."""
+        group_addresses = []
+        if self.group_address:
+            group_addresses.extend(
+                ga for ga in self.group_address if isinstance(ga, GroupAddress))
+        if isinstance(self.group_address_state, GroupAddress):
+            group_addresses.append(self.group_address_state)
+        return group_addresses
 
     def state_addresses(self):
         """Return group addresses which should be requested to sync state."""
@@ -103,11 +227,21 @@ class RemoteValue:
                 device_name=f"{self.device_name}->{type(self).__name__}",
             )
 
-        self.payload = telegram.payload
+        self._update(telegram.group_address, telegram.payload, telegram.source_address)
         if self.after_update_cb is not None:
-            await self.after_update_cb(self.value, telegram.group_address)
+            value = self.value
+            if self.xknx.change_only_callbacks and self._reported_value is not _NOT_REPORTED and \
+                    not self.value_changed(self._reported_value, value):
+                return True
+            self._reported_value = value
+            await self.after_update_cb(value, telegram.group_address)
         return True
 
+    def value_changed(self, old_value, new_value):
+        """Test if value changed enough to notify after_update_cb (with XKNX.change_only_callbacks)."""
+        # pylint: disable=no-self-use
+        return old_value != new_value
+
     async def process_read(self, telegram):
         """Process read telegram."""
         if not self.has_group_address(telegram.group_address):
@@ -118,9 +252,13 @@ class RemoteValue:
     @property
     def value(self):
         """Return current value."""
-        if self.payload is None:
+        if self._outdated:
+            self._resolve()
+        if self._payload is None:
             return None
-        return self.from_knx(self.payload)
+        if self._value is _NOT_DECODED:
+            self._value = self.from_knx(self._payload)
+        return self._value
 
     async def send(self, response=False):
         """Send payload as telegram to KNX bus."""
@@ -131,6 +269,7 @@ class RemoteValue:
             TelegramType.GROUP_RESPONSE if response else TelegramType.GROUP_WRITE
         )
         telegram.payload = self.payload
+        telegram.priority = self.priority
         # print("telegram", telegram)
         await self.xknx.telegrams.put(telegram)
 
@@ -149,7 +288,7 @@ class RemoteValue:
             )
             return
 
-        self.payload = self.to_knx(value)
+        self._update(self.group_address[0], self.to_knx(value))
         await self.send()
 
     @property
@@ -194,15 +333,17 @@ class RemoteValue:
 
     def __eq__(self, other):
         """Equal operator."""
+        if self.payload != other.payload:
+            return False
         for key, value in self.__dict__.items():
-            if key == "after_update_cb":
+            if key in _IGNORED_ATTRIBUTES:
                 continue
             if key not in other.__dict__:
                 return False
             if other.__dict__[key] != value:
                 return False
         for key, value in other.__dict__.items():
-            if key == "after_update_cb":
+            if key in _IGNORED_ATTRIBUTES:
                 continue
             if key not in self.__dict__:
                 return False
@@ -0,0 +1,87 @@
+"""
+Module for looking up remote values by group address.
+
+Devices with many remote values (e.g. Group) use a registry to route an incoming
+telegram only to the remote values owning its group address instead of calling
+process() on every remote value.
+
+The index is built lazily. Remote values invalidate the index of the registries they are
+registered with once their group addresses are reassigned - other registries are kept.
+"""
+from xknx.telegram import GroupAddress
+
+
+class RemoteValueRegistry:
+    """Class for looking up remote values by group address."""
+
+    def __init__(self, xknx, remote_values=None):
+        """Initialize RemoteValueRegistry class."""
+        self.xknx = xknx
+        self.remote_values = []
+        self._remote_values_by_group_address = None
+        for remote_value in remote_values or ():
+            self.register(remote_value)
+
+    def register(self, remote_value):
+        """Register remote value."""
+        self.remote_values.append(remote_value)
+        # pylint: disable=protected-access
+        remote_value._registries.append(self)
+        self._remote_values_by_group_address = None
+
+    def unregister(self, remote_value):
+        """Unregister remote value."""
+        self.remote_values.remove(remote_value)
+        # pylint: disable=protected-access
+        remote_value._registries.remove(self)
+        self._remote_values_by_group_address = None
+
+    def group_addresses_changed(self):
+        """Invalidate index. Called after group addresses of a registered remote value were reassigned."""
+        self._remote_values_by_group_address = None
+
+    def _build_index(self):
+        """Build index from raw group address to remote values."""
+        self._remote_values_by_group_address = {}
+        for remote_value in self.remote_values:
+            for raw in {group_address.raw for group_address in remote_value.all_group_addresses()}:
+                self._remote_values_by_group_address.setdefault(raw, []).append(remote_value)
+
+    def remote_values_by_group_address(self, group_address):
+        """Return remote value(s) by group address."""
+        if not isinstance(group_address, GroupAddress):
+            return [remote_value for remote_value in self.remote_values
+                    if remote_value.has_group_address(group_address)]
+        if self._remote_values_by_group_address is None:
+            self._build_index()
+        return [remote_value for remote_value in
+                self._remote_values_by_group_address.get(group_address.raw, ())
+                if remote_value.has_group_address(group_address)]
+
+    def has_group_address(self, group_address):
+        """Test if any registered remote value has given group address."""
+        return bool(self.remote_values_by_group_address(group_address))
+
+    async def process(self, telegram):
+        """Pass telegram to remote values owning its group address. Return True if processed."""
+        processed = False
+        for remote_value in self.remote_values_by_group_address(telegram.group_address):
+            if await remote_value.process(telegram):
+                processed = True
+        return processed
+
+    async def process_read(self, telegram):
+        """Pass read telegram to remote values owning its group address. Return True if processed."""
+        processed = False
+        for remote_value in self.remote_values_by_group_address(telegram.group_address):
+            if await remote_value.process_read(telegram):
+                processed = True
+        return processed
+
+    def __len__(self):
+        """Return number of registered remote values."""
+        return len(self.remote_values)
+
+    def __eq__(self, other):
+        """Equal operator."""
+        return self.remote_values == other.remote_values
@@ -4,6 +4,8 @@ Module for managing a remote value typically used within a sensor.
 The module maps a given value_type to a DPT class and uses this class
 for serialization and deserialization of the KNX value.
 """
+import numbers
+
 from xknx.dpt import (
     DPT2ByteFloat, DPT2ByteSigned, DPT2ByteUnsigned, DPT2Ucount, DPT4ByteFloat,
     DPT4ByteSigned, DPT4ByteUnsigned, DPTAbsoluteTemperature, DPTAcceleration,
@@ -206,7 +208,8 @@ class RemoteValueSensor(RemoteValue):
                  sync_state=True,
                  value_type=None,
                  device_name=None,
-                 after_update_cb=None):
+                 after_update_cb=None,
+                 deadband=None):
         """Initialize RemoteValueSensor class."""
         # pylint: disable=too-many-arguments
         super().__init__(xknx,
@@ -218,6 +221,14 @@ class RemoteValueSensor(RemoteValue):
         if value_type not in self.DPTMAP:
             raise ConversionError("invalid value type", value_type=value_type, device_name=device_name)
         self.value_type = value_type
+        self.deadband = deadband
+
+    def value_changed(self, old_value, new_value):
+        """Test if value changed by more than deadband."""
+        if self.deadband is None or not isinstance(old_value, numbers.Number) or \
+                not isinstance(new_value, numbers.Number):
+            return old_value != new_value
+        return abs(new_value - old_value) > self.deadband
 
     def payload_valid(self, payload):
         """Test if telegram payload may be parsed."""
@@ -33,11 +33,22 @@ def address_tuple_to_int(address):
 
 
 class BaseAddress:  # pylint: disable=too-few-public-methods
-    """Base class for all knx address types."""
+    """
+    Base class for all knx address types.
+
+    Addresses are immutable and hashable. Instances are interned per subclass,
+    so creating an address for an already known raw value returns the existing object.
+    """
+
+    __slots__ = ('raw',)
 
-    def __init__(self):
-        """Initialize instance variables needed by all subclasses."""
-        self.raw = None
+    def __setattr__(self, key, value):
+        """Prevent modification of immutable address."""
+        raise AttributeError("{0} is immutable".format(self.__class__.__name__))
+
+    def __delattr__(self, key):
+        """Prevent modification of immutable address."""
+        raise AttributeError("{0} is immutable".format(self.__class__.__name__))
 
     def to_knx(self):
         """
@@ -54,14 +65,20 @@ class BaseAddress:  # pylint: disable=too-few-public-methods
         Returns `True` if we check against the same subclass and the
         raw Value matches.
 
-        Returns `False` if we check against `None`.
+        Returns `False` if we check against `None` or any other type.
         """
+        if self is other:
+            return True
         if other is None:
             return False
         if not isinstance(other, self.__class__):
-            raise TypeError()
+            return NotImplemented
         return self.raw == other.raw
 
+    def __hash__(self):
+        """Hash the raw value. Equal addresses have the same raw value."""
+        return hash(self.raw)
+
 
 class PhysicalAddress(BaseAddress):
     """Class for handling KNX pyhsical addresses."""
@@ -71,24 +88,40 @@ class PhysicalAddress(BaseAddress):
     MAX_LINE = 255
     ADDRESS_RE = re_compile(r'^(?P<area>\d{1,2})\.(?P<main>\d{1,2})\.(?P<line>\d{1,3})$')
 
-    def __init__(self, address):
-        """Initialize Address class."""
-        super().__init__()
-        if isinstance(address, str):
-            self.raw = self.__string_to_int(address)
+    __slots__ = ()
+
+    _cache = {}
+
+    def __new__(cls, address):
+        """Return interned PhysicalAddress object for `address`."""
+        if isinstance(address, int):
+            raw = address
+        elif isinstance(address, str):
+            raw = cls.__string_to_int(address)
         elif isinstance(address, tuple) and len(address) == 2:
-            self.raw = address_tuple_to_int(address)
-        elif isinstance(address, int):
-            self.raw = address
+            raw = address_tuple_to_int(address)
         elif address is None:
-            self.raw = 0
+            raw = 0
         else:
             raise CouldNotParseAddress(address)
 
-        if isinstance(self.raw, int) and self.raw > 65535:
+        try:
+            return cls._cache[raw]
+        except KeyError:
+            pass
+        if raw > 65535:
             raise CouldNotParseAddress(address)
+        instance = super().__new__(cls)
+        object.__setattr__(instance, 'raw', raw)
+        cls._cache[raw] = instance
+        return instance
 
-    def __string_to_int(self, address):
+    def __reduce__(self):
+        """Support copy and pickle of interned objects."""
+        return self.__class__, (self.raw,)
+
+    @classmethod
+    def __string_to_int(cls, address):
         """
         Parse `address` as string to an integer and do some simple checks.
 
@@ -98,13 +131,13 @@ class PhysicalAddress(BaseAddress):
 
         In any other case, we raise an `CouldNotParseAddress` exception.
         """
-        match = self.ADDRESS_RE.match(address)
+        match = cls.ADDRESS_RE.match(address)
         if not match:
             raise CouldNotParseAddress(address)
         area = int(match.group('area'))
         main = int(match.group('main'))
         line = int(match.group('line'))
-        if area > self.MAX_AREA or main > self.MAX_MAIN or line > self.MAX_LINE:
+        if area > cls.MAX_AREA or main > cls.MAX_MAIN or line > cls.MAX_LINE:
             raise CouldNotParseAddress(address)
         return (area << 12) + (main << 8) + line
 
@@ -164,55 +197,69 @@ class GroupAddress(BaseAddress):
 
     ADDRESS_RE = re_compile(r'^(?P<main>\d{1,2})(/(?P<middle>\d{1,2}))?/(?P<sub>\d{1,4})$')
 
-    def __init__(self, address, levels=GroupAddressType.LONG):
-        """Initialize Address class."""
-        super().__init__()
-        self.levels = levels
+    __slots__ = ('levels',)
+
+    _cache = {}
 
-        if isinstance(address, str) and not address.isdigit():
-            self.raw = self.__string_to_int(address)
+    def __new__(cls, address, levels=GroupAddressType.LONG):
+        """Return interned GroupAddress object for `address` and `levels`."""
+        if isinstance(address, int):
+            raw = address
+        elif isinstance(address, str) and not address.isdigit():
+            raw, levels = cls.__string_to_int(address, levels)
         elif isinstance(address, str) and address.isdigit():
-            self.raw = int(address)
+            raw = int(address)
         elif isinstance(address, tuple) and len(address) == 2:
-            self.raw = address_tuple_to_int(address)
-        elif isinstance(address, int):
-            self.raw = address
+            raw = address_tuple_to_int(address)
         elif address is None:
-            self.raw = 0
+            raw = 0
         else:
             raise CouldNotParseAddress(address)
 
-        if isinstance(self.raw, int) and self.raw > 65535:
+        try:
+            return cls._cache[(raw, levels)]
+        except KeyError:
+            pass
+        if raw > 65535:
             raise CouldNotParseAddress(address)
-
-    def __string_to_int(self, address):
+        instance = super().__new__(cls)
+        object.__setattr__(instance, 'raw', raw)
+        object.__setattr__(instance, 'levels', levels)
+        cls._cache[(raw, levels)] = instance
+        return instance
+
+    def __reduce__(self):
+        """Support copy and pickle of interned objects."""
+        return self.__class__, (self.raw, self.levels)
+
+    @classmethod
+    def __string_to_int(cls, address, levels):
         """
         Parse `address` as string to an integer and do some simple checks.
 
-        Returns the integer representation of `address` if all checks are valid:
+        Returns the integer representation of `address` and the resulting levels if all checks are valid:
         * string matches against the regular expression
         * main, middle and sub are inside its range
 
         In any other case, we raise an `CouldNotParseAddress` exception.
         """
-        match = self.ADDRESS_RE.match(address)
+        match = cls.ADDRESS_RE.match(address)
         if not match:
             raise CouldNotParseAddress(address)
         main = int(match.group('main'))
         middle = int(match.group('middle')) if match.group('middle') is not None else None
         sub = int(match.group('sub'))
-        if main > self.MAX_MAIN:
+        if main > cls.MAX_MAIN:
             raise CouldNotParseAddress(address)
         if middle is not None:
-            if middle > self.MAX_MIDDLE:
+            if middle > cls.MAX_MIDDLE:
                 raise CouldNotParseAddress(address)
-            if sub > self.MAX_SUB_LONG:
+            if sub > cls.MAX_SUB_LONG:
                 raise CouldNotParseAddress(address)
-        else:
-            if sub > self.MAX_SUB_SHORT:
-                raise CouldNotParseAddress(address)
-            self.levels = GroupAddressType.SHORT
-        return (main << 11) + (middle << 8) + sub if middle is not None else (main << 11) + sub
+            return (main << 11) + (middle << 8) + sub, levels
+        if sub > cls.MAX_SUB_SHORT:
+            raise CouldNotParseAddress(address)
+        return (main << 11) + sub, GroupAddressType.SHORT
 
     @property
     def main(self):
@@ -20,10 +20,74 @@ Patterns can be
         AddressFilter("2-5")
         AddressFilter("1-3,4,5")
         AddressFilter("-10")
+
+Filters are compiled into a CompiledAddressFilter: one byte per raw group address for
+each GroupAddressType - so matching a GroupAddress is a single index operation.
+Compiled filters can be merged via union (|) and intersection (&):
+
+    compiled = AddressFilter("1/*/*").compile() | AddressFilter("2/0/1-10").compile()
+    compiled.match(GroupAddress("2/0/5"))
 """
 from xknx.exceptions import ConversionError
 
-from .address import GroupAddress
+from .address import GroupAddress, GroupAddressType
+
+_NUMBER_OF_ADDRESSES = 0x10000
+
+# bit length of (main, middle, sub) within the raw address - None if the part is not used
+_LAYOUTS = {
+    GroupAddressType.LONG: (5, 3, 8),
+    GroupAddressType.SHORT: (5, None, 11),
+    GroupAddressType.FREE: (None, None, 16),
+}
+
+
+class CompiledAddressFilter:
+    """Class for matching group addresses against a set of raw addresses per GroupAddressType."""
+
+    def __init__(self, bitmaps):
+        """Initialize CompiledAddressFilter class with a bytes object of 65536 entries per GroupAddressType."""
+        self.bitmaps = bitmaps
+
+    @classmethod
+    def from_filters(cls, address_filters):
+        """Return union of compiled address filters."""
+        compiled = cls({levels: bytes(_NUMBER_OF_ADDRESSES) for levels in _LAYOUTS})
+        for address_filter in address_filters:
+            compiled |= address_filter.compile()
+        return compiled
+
+    def match(self, address):
+        """Test if address is matched."""
+        if isinstance(address, str):
+            address = GroupAddress(address)
+        if not isinstance(address, GroupAddress):
+            return False
+        return self.bitmaps[address.levels][address.raw] == 1
+
+    __contains__ = match
+
+    @staticmethod
+    def _combine(bitmap, other_bitmap, operator):
+        """Combine two bitmaps bitwise."""
+        return operator(int.from_bytes(bitmap, 'big'), int.from_bytes(other_bitmap, 'big')).to_bytes(
+            _NUMBER_OF_ADDRESSES, 'big')
+
+    def __or__(self, other):
+        """Return union of compiled filters."""
+        return CompiledAddressFilter({
+            levels: self._combine(bitmap, other.bitmaps[levels], int.__or__)
+            for levels, bitmap in self.bitmaps.items()})
+
+    def __and__(self, other):
+        """Return intersection of compiled filters."""
+        return CompiledAddressFilter({
+            levels: self._combine(bitmap, other.bitmaps[levels], int.__and__)
+            for levels, bitmap in self.bitmaps.items()})
+
+    def __eq__(self, other):
+        """Equal operator."""
+        return self.bitmaps == other.bitmaps
 
 
 class AddressFilter:
@@ -35,6 +99,7 @@ class AddressFilter:
         """Initialize AddressFilter class."""
         self.level_filters = []
         self._parse_pattern(pattern)
+        self._compiled = None
 
     def _parse_pattern(self, pattern):
         for part in pattern.split("/"):
@@ -42,10 +107,45 @@ class AddressFilter:
         if len(self.level_filters) > 3:
             raise ConversionError("Too many parts within pattern.", pattern=pattern)
 
+    def compile(self):
+        """Return CompiledAddressFilter matching the same addresses."""
+        if self._compiled is None:
+            self._compiled = CompiledAddressFilter({
+                levels: self._compile_bitmap(layout) for levels, layout in _LAYOUTS.items()})
+        return self._compiled
+
+    def _compile_bitmap(self, layout):
+        """Return bitmap of all raw addresses matched if interpreted with layout (bit length of main, middle, sub)."""
+        main_bits, middle_bits, sub_bits = layout
+        # parts of the address in order of level filters - from most to least significant bits
+        if len(self.level_filters) == 3:
+            parts = (main_bits, middle_bits, sub_bits)
+        elif len(self.level_filters) == 2:
+            parts = (main_bits, sub_bits)
+        else:
+            parts = (sub_bits,)
+        if None in parts:
+            # the address does not have all parts of the pattern
+            return bytes(_NUMBER_OF_ADDRESSES)
+        # bits not covered by the parts of the pattern (e.g. middle for level2 patterns) match any value
+        free_bits = 16 - sum(parts)
+        bitmap = b'\x01'
+        for level_filter, bits in zip(reversed(self.level_filters), reversed(parts)):
+            empty = bytes(len(bitmap))
+            bitmap = b''.join(bitmap if allowed else empty for allowed in level_filter.mask(bits))
+        if free_bits:
+            # free bits are located between main and sub
+            block = len(bitmap) >> main_bits if len(parts) > 1 else len(bitmap)
+            bitmap = b''.join(
+                bitmap[offset:offset + block] * (1 << free_bits) for offset in range(0, len(bitmap), block))
+        return bitmap
+
     def match(self, address):
         """Test if provided address matches Addressfilter."""
         if isinstance(address, str):
             address = GroupAddress(address)
+        if isinstance(address, GroupAddress):
+            return self.compile().match(address)
         if len(self.level_filters) == 3:
             return self._match_level3(address)
         if len(self.level_filters) == 2:
@@ -150,3 +250,12 @@ class AddressFilter:
                 if _range.match(digit):
                     return True
             return False
+
+        def mask(self, bits):
+            """Return list of booleans if the values 0..2**bits-1 are within range of pattern."""
+            mask = [False] * (1 << bits)
+            for _range in self.ranges:
+                range_from, range_to = _range.get_range()
+                for digit in range(range_from, min(range_to, len(mask) - 1) + 1):
+                    mask[digit] = True
+            return mask
@@ -11,10 +11,13 @@ It contains
 * the telegram type (e.g. GROUP_WRITE)
 * the direction (incoming or outgoing)
 * the group address (e.g. 1/2/3)
-* and the payload (e.g. "12%" or "23.23 C".
+* the payload (e.g. "12%" or "23.23 C")
+* the priority (e.g. LOW)
+* and an optional deadline - outgoing telegrams not sent until then are dropped.
 
 """
 from enum import Enum
+import time
 
 from .address import GroupAddress
 
@@ -34,6 +37,15 @@ class TelegramType(Enum):
     GROUP_RESPONSE = 3
 
 
+class TelegramPriority(Enum):
+    """Enum class for the KNX priority of a telegram. Values match the priority bits of the CEMI control field."""
+
+    SYSTEM = 0
+    NORMAL = 1
+    URGENT = 2
+    LOW = 3
+
+
 class Telegram:
     """Class for KNX telegrams."""
 
@@ -42,12 +54,34 @@ class Telegram:
     def __init__(self, group_address=GroupAddress(None),
                  telegramtype=TelegramType.GROUP_WRITE,
                  direction=TelegramDirection.OUTGOING,
-                 payload=None):
-        """Initialize Telegram class."""
+                 payload=None,
+                 priority=TelegramPriority.LOW,
+                 source_address=None,
+                 deadline=None,
+                 ttl=None):
+        """Initialize Telegram class. `ttl` (seconds from now) is an alternative to the `deadline` (time.monotonic())."""
+        # pylint: disable=too-many-arguments
         self.direction = direction
         self.telegramtype = telegramtype
         self.group_address = group_address
         self.payload = payload
+        self.priority = priority
+        # PhysicalAddress of the sender of incoming telegrams
+        self.source_address = source_address
+        # time.monotonic() after which an outgoing telegram is stale - None if it never is
+        self.deadline = deadline
+        if ttl is not None:
+            self.set_ttl(ttl)
+
+    def set_ttl(self, ttl):
+        """Set deadline to `ttl` seconds from now."""
+        self.deadline = time.monotonic() + ttl
+
+    def expired(self, now=None):
+        """Test if deadline has passed."""
+        if self.deadline is None:
+            return False
+        return (time.monotonic() if now is None else now) > self.deadline
 
     def __str__(self):
         """Return object as readable string."""
@@ -59,5 +93,9 @@ class Telegram:
                 self.direction)
 
     def __eq__(self, other):
-        """Equal operator."""
-        return self.__dict__ == other.__dict__
+        """Equal operator. The source address is not compared."""
+        return self.direction == other.direction and \
+            self.telegramtype == other.telegramtype and \
+            self.group_address == other.group_address and \
+            self.payload == other.payload and \
+            self.priority == other.priority
@@ -4,10 +4,12 @@ import logging
 import signal
 from sys import platform
 
-from xknx.core import Config, TelegramQueue
+from xknx.core import (
+    AddressPrefilter, Config, OverflowPolicy, StateStore, StateTable,
+    TelegramBuffer, TelegramQueue)
 from xknx.devices import Devices
 from xknx.io import ConnectionConfig, KNXIPInterface
-from xknx.telegram import GroupAddressType, PhysicalAddress
+from xknx.telegram import GroupAddressType, PhysicalAddress, TelegramDirection
 
 
 class XKNX:
@@ -17,6 +19,7 @@ class XKNX:
 
     DEFAULT_ADDRESS = '15.15.250'
     DEFAULT_RATE_LIMIT = 20
+    DEFAULT_RATE_LIMIT_BURST = 1
 
     def __init__(self,
                  config=None,
@@ -25,20 +28,49 @@ class XKNX:
                  address_format=GroupAddressType.LONG,
                  telegram_received_cb=None,
                  device_updated_cb=None,
-                 rate_limit=DEFAULT_RATE_LIMIT):
+                 rate_limit=DEFAULT_RATE_LIMIT,
+                 rate_limit_burst=DEFAULT_RATE_LIMIT_BURST,
+                 state_file=None,
+                 change_only_callbacks=False,
+                 callback_coalesce_window=0,
+                 incoming_dispatch_workers=0,
+                 record_handler_latencies=False,
+                 incoming_queue_size=0,
+                 incoming_overflow_policy=OverflowPolicy.BLOCK,
+                 outgoing_queue_size=0,
+                 outgoing_overflow_policy=OverflowPolicy.BLOCK,
+                 coalesce_outgoing_writes=False,
+                 outgoing_ttl=None,
+                 state_updater_intervals=None):
         """Initialize XKNX class."""
         # pylint: disable=too-many-arguments
         self.devices = Devices()
-        self.telegrams = asyncio.Queue()
         self.loop = loop or asyncio.get_event_loop()
         self.sigint_received = asyncio.Event()
         self.telegram_queue = TelegramQueue(self)
+        self.address_prefilter = AddressPrefilter(self)
         self.state_updater = None
+        self.state_table = StateTable()
+        self.state_file = state_file
+        self.state_store = None
         self.knxip_interface = None
         self.started = False
         self.address_format = address_format
         self.own_address = own_address
         self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.change_only_callbacks = change_only_callbacks
+        self.callback_coalesce_window = callback_coalesce_window
+        self.incoming_dispatch_workers = incoming_dispatch_workers
+        self.record_handler_latencies = record_handler_latencies
+        self.incoming_queue_size = incoming_queue_size
+        self.incoming_overflow_policy = OverflowPolicy(incoming_overflow_policy)
+        self.outgoing_queue_size = outgoing_queue_size
+        self.outgoing_overflow_policy = OverflowPolicy(outgoing_overflow_policy)
+        self.coalesce_outgoing_writes = coalesce_outgoing_writes
+        self.outgoing_ttl = outgoing_ttl
+        # refresh intervals of the StateUpdater per device name, value type or device class
+        self.state_updater_intervals = state_updater_intervals
         self.logger = logging.getLogger('xknx.log')
         self.knx_logger = logging.getLogger('xknx.knx')
         self.telegram_logger = logging.getLogger('xknx.telegram')
@@ -47,6 +79,10 @@ class XKNX:
         if config is not None:
             Config(self).read(config)
 
+        # outgoing telegrams are bounded by the outgoing queue of the TelegramQueue
+        self.telegrams = TelegramBuffer(self.incoming_queue_size, self.incoming_overflow_policy,
+                                        bounded_direction=TelegramDirection.INCOMING)
+
         if telegram_received_cb is not None:
             self.telegram_queue.register_telegram_received_cb(telegram_received_cb)
 
@@ -65,20 +101,29 @@ class XKNX:
     async def start(self,
                     state_updater=False,
                     daemon_mode=False,
-                    connection_config=None):
+                    connection_config=None,
+                    state_updater_intervals=None):
         """Start XKNX module. Connect to KNX/IP devices and start state updater."""
+        # pylint: disable=too-many-arguments
         if connection_config is None:
             if self.connection_config is None:
                 connection_config = ConnectionConfig()
             else:
                 connection_config = self.connection_config
+        if self.state_file is not None:
+            self.state_store = StateStore(self, self.state_file)
+            self.state_store.open()
+            self.state_store.restore(
+                remote_value for device in self.devices for remote_value in device.remote_values())
         self.knxip_interface = KNXIPInterface(self, connection_config=connection_config)
         await self.knxip_interface.start()
         await self.telegram_queue.start()
 
         if state_updater:
             from xknx.core import StateUpdater
-            self.state_updater = StateUpdater(self)
+            if state_updater_intervals is None:
+                state_updater_intervals = self.state_updater_intervals
+            self.state_updater = StateUpdater(self, intervals=state_updater_intervals)
             await self.state_updater.start()
 
         if daemon_mode:
@@ -103,6 +148,11 @@ class XKNX:
         await self.join()
         await self.telegram_queue.stop()
         await self._stop_knxip_interface_if_exists()
+        for device in self.devices:
+            device.cancel_coalesced_updates()
+        if self.state_store is not None:
+            self.state_store.close()
+            self.state_store = None
         self.started = False
 
     async def loop_until_sigint(self):